@@ -0,0 +1,35 @@
+import sys
+import json
+import argparse
+import pandas as pd
+
+
+def load_results(filepath: str) -> pd.DataFrame:
+    with open(filepath, "r", encoding="utf-8") as file:
+        report = json.load(file)
+    return pd.DataFrame(report["results"])[["scale", "benchmark", "seconds"]]
+
+
+def compare(baseline: str, candidate: str, threshold: float = 1.2) -> pd.DataFrame:
+    data = load_results(filepath=baseline).merge(
+        load_results(filepath=candidate), on=["scale", "benchmark"], suffixes=("_baseline", "_candidate")
+    )
+    data["ratio"] = data["seconds_candidate"] / data["seconds_baseline"]
+    data["regression"] = data["ratio"] > threshold
+    return data.sort_values(["regression", "ratio"], ascending=False).reset_index(drop=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=1.2)
+    args = parser.parse_args()
+
+    data = compare(baseline=args.baseline, candidate=args.candidate, threshold=args.threshold)
+    print(data.to_string(index=False))
+    sys.exit(1 if data["regression"].any() else 0)
+
+
+if __name__ == "__main__":
+    main()
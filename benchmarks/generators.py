@@ -0,0 +1,90 @@
+import os
+import numpy as np
+import pandas as pd
+from typing import Dict, List
+
+MONTHS = [f"Mes {i}" for i in range(1, 13)]
+SHEETS = ["Octubre", "Noviembre", "Diciembre", "Enero", "Febrero", "Marzo",
+          "Abril", "Mayo", "Junio", "Julio", "Agosto", "Septiembre"]
+ACCOUNTS = [101, 102, 204, 301, 302, 401, 402, 403, 501, 502, 503, 504, 601, 602, 701, 801]
+
+
+def fcp_ids(n_fcps: int) -> List[str]:
+    return [f"EC{i:04d}" for i in range(1, n_fcps + 1)]
+
+
+def money(values: np.ndarray) -> List[str]:
+    return [f"{value:,.2f}" for value in values]
+
+
+def generate_fcps(n_fcps: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    participants = rng.integers(100, 600, n_fcps)
+    sponsored = (participants * rng.uniform(0.6, 0.95, n_fcps)).astype(int)
+    survival = rng.integers(0, 60, n_fcps)
+    return pd.DataFrame({
+        "Código FCP": fcp_ids(n_fcps),
+        "Estado": rng.choice(["Activo", "Inactivo"], n_fcps, p=[0.95, 0.05]),
+        "Tipo": rng.choice(["Urbano", "Rural"], n_fcps),
+        "Participantes": participants,
+        "Patrocinados": sponsored,
+        "No patrocinados": participants - sponsored,
+        "Supervivencia": survival,
+        "Cupos supervivencia": survival + rng.integers(0, 20, n_fcps),
+        "Ciudad": rng.choice(["Quito", "Guayaquil", "Cuenca", "Ambato", "Loja"], n_fcps),
+        "Provincia": rng.choice(["Pichincha", "Guayas", "Azuay", "Tungurahua", "Loja"], n_fcps),
+        "Latitud": rng.uniform(-4.5, 1.0, n_fcps).round(6),
+        "Longitud": rng.uniform(-80.5, -77.0, n_fcps).round(6),
+    })
+
+
+def generate_poa(n_rows: int, rng: np.random.Generator) -> pd.DataFrame:
+    monthly = rng.uniform(0, 5000, (n_rows, 12)).round(2)
+    data = pd.DataFrame({
+        "Actividad": [f"Actividad {i}" for i in rng.integers(1, 40, n_rows)],
+        "Grupo": rng.choice(["Cognitivo", "Físico", "Socioemocional", "Espiritual", "Administrativo"], n_rows),
+        "Cuenta": rng.choice(ACCOUNTS, n_rows).astype(float),
+        "Total": money(monthly.sum(axis=1)),
+    })
+    for i, month in enumerate(MONTHS):
+        data[month] = money(monthly[:, i])
+    data.loc[rng.random(n_rows) < 0.05, "Cuenta"] = np.nan
+    return data
+
+
+def generate_balance_sheet(rng: np.random.Generator) -> pd.DataFrame:
+    before = rng.uniform(0, 20000, len(ACCOUNTS)).round(2)
+    debe = rng.uniform(0, 8000, len(ACCOUNTS)).round(2)
+    haber = rng.uniform(0, 8000, len(ACCOUNTS)).round(2)
+    return pd.DataFrame({
+        "Cuenta": ACCOUNTS,
+        "Descripción": [f"Cuenta {account}" for account in ACCOUNTS],
+        "Saldo anterior": before,
+        "Debe": debe,
+        "Haber": haber,
+        "Saldo": (before + debe - haber).round(2),
+    })
+
+
+def write_balance_workbook(filepath: str, rng: np.random.Generator) -> None:
+    with pd.ExcelWriter(filepath) as writer:
+        for sheet in SHEETS:
+            header = pd.DataFrame({"Balance de Comprobación": [f"Periodo {sheet}", "", "", ""]})
+            header.to_excel(writer, sheet_name=sheet, index=False)
+            generate_balance_sheet(rng=rng).to_excel(writer, sheet_name=sheet, startrow=5, index=False)
+
+
+def generate_dataset(root: str, n_fcps: int, poa_rows: int = 120, seed: int = 0) -> Dict[str, str]:
+    rng = np.random.default_rng(seed)
+    paths = {
+        "fcps": os.path.join(root, "fcps.xlsx"),
+        "poa": os.path.join(root, "raw", "POA"),
+        "balance": os.path.join(root, "raw", "Balance"),
+    }
+    os.makedirs(paths["poa"], exist_ok=True)
+    os.makedirs(paths["balance"], exist_ok=True)
+    generate_fcps(n_fcps=n_fcps, seed=seed).to_excel(paths["fcps"], index=False)
+    for fcp_id in fcp_ids(n_fcps):
+        generate_poa(n_rows=poa_rows, rng=rng).to_csv(os.path.join(paths["poa"], f"{fcp_id}.csv"), index=False)
+        write_balance_workbook(filepath=os.path.join(paths["balance"], f"Balance_de_Comprobacion_{fcp_id}.xlsx"), rng=rng)
+    return paths
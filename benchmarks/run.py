@@ -0,0 +1,166 @@
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import statistics
+import pulp
+import numpy as np
+import pandas as pd
+import openpyxl
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Any
+from config import setup_logger
+from src.data import (
+    CSVLoader, ExcelLoader, ParquetLoader, ParquetConsolidator,
+    FCPDataProcessor, POADataProcessor, BalanceDataProcessor, ProcessorRunner
+)
+from src.modelling.batch import solve_batch
+from src.modelling.optimizer import BudgetLpOptimizer
+from src.modelling.solvers import EnumerationSolver
+from src.modelling.params import DEFAULT_PARAMS
+from src.utils import list_files, get_filename
+from benchmarks.generators import generate_dataset
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> List[float]:
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - start)
+    return runs
+
+
+def poa_stages(filepath: str) -> Dict[str, Callable[[], Any]]:
+    processor = POADataProcessor(loader=CSVLoader())
+    state: Dict[str, pd.DataFrame] = {}
+
+    def load():
+        state["data"] = processor.loader.load(filepath=filepath)
+
+    def set_columns():
+        state["data"] = processor.remove_nans_by_col(data=processor.set_columns(data=state["data"]), col="account")
+
+    def parse_col_types():
+        state["data"] = processor.parse_col_types(data=state["data"].copy())
+
+    def unpivot():
+        data = processor.set_fcp_id(data=state["data"].copy(), fcp_id=get_filename(filepath=filepath))
+        processor.unpivot_month_values(data=data)
+
+    return {"load": load, "set_columns": set_columns, "parse_col_types": parse_col_types, "unpivot": unpivot}
+
+
+def balance_stages(filepath: str) -> Dict[str, Callable[[], Any]]:
+    processor = BalanceDataProcessor(loader=ExcelLoader())
+    state: Dict[str, Any] = {}
+
+    def load():
+        state["info"] = dict(processor.load_sheets(filepath=filepath))
+
+    def parse_data_sheets():
+        state["data"] = processor.set_columns(data=processor.parse_data_sheets(info=state["info"]))
+
+    def parse_col_types():
+        data = processor.parse_col_types(data=state["data"].copy())
+        processor.filter_values_by_col(data=data, col="account")
+
+    return {"load": load, "parse_data_sheets": parse_data_sheets, "parse_col_types": parse_col_types}
+
+
+def run_scale(n_fcps: int, repeat: int, workers: int, root: str) -> List[Dict[str, Any]]:
+    paths = generate_dataset(root=root, n_fcps=n_fcps)
+    poa_files = list_files(path=paths["poa"])
+    balance_files = list_files(path=paths["balance"])
+    processed = {name: os.path.join(root, "processed", name) for name in ["poa", "balance"]}
+    for path in processed.values():
+        os.makedirs(path, exist_ok=True)
+
+    benchmarks: Dict[str, Callable[[], Any]] = {}
+    for stage, fn in poa_stages(filepath=poa_files[0]).items():
+        benchmarks[f"poa.{stage}"] = fn
+    for stage, fn in balance_stages(filepath=balance_files[0]).items():
+        benchmarks[f"balance.{stage}"] = fn
+    benchmarks["fcp.process"] = lambda: FCPDataProcessor(loader=ExcelLoader()).process(filepath=paths["fcps"])
+
+    poa_tasks = [(path, os.path.join(processed["poa"], f"{get_filename(filepath=path)}.parquet")) for path in poa_files]
+    balance_processor = BalanceDataProcessor(loader=ExcelLoader())
+    balance_tasks = [
+        (path, os.path.join(processed["balance"], f"{balance_processor.get_fcp_id(filepath=path)}.parquet"))
+        for path in balance_files
+    ]
+    benchmarks["pipeline.process_poa"] = lambda: ProcessorRunner(
+        processor=POADataProcessor(loader=CSVLoader()), workers=workers
+    ).run(tasks=poa_tasks)
+    benchmarks["pipeline.process_balance"] = lambda: ProcessorRunner(
+        processor=balance_processor, workers=workers
+    ).run(tasks=balance_tasks)
+    for name in ["poa", "balance"]:
+        benchmarks[f"pipeline.consolidate_{name}"] = lambda name=name: ParquetConsolidator(loader=ParquetLoader()).consolidate(
+            filepaths=[output for _, output in (poa_tasks if name == "poa" else balance_tasks)],
+            output_filepath=os.path.join(root, f"{name}.parquet")
+        )
+
+    def solve(solver: pulp.LpSolver) -> None:
+        optimizer = BudgetLpOptimizer.build(params=DEFAULT_PARAMS)
+        optimizer.solve(solver=solver)
+
+    rng = np.random.default_rng(0)
+    batch = pd.DataFrame([DEFAULT_PARAMS] * n_fcps)
+    batch["N_max"] = rng.integers(100, 1000, n_fcps)
+    batch["kids_ratio"] = rng.uniform(0.05, 0.5, n_fcps).round(2)
+    benchmarks["optimizer.solve_cbc"] = lambda: solve(solver=pulp.PULP_CBC_CMD(msg=False))
+    benchmarks["optimizer.solve_enumeration"] = lambda: solve(solver=EnumerationSolver())
+    benchmarks["optimizer.batch_cbc"] = lambda: solve_batch(params=batch, solver=pulp.PULP_CBC_CMD(msg=False))
+    benchmarks["optimizer.batch_enumeration"] = lambda: solve_batch(params=batch, solver=EnumerationSolver())
+
+    results = []
+    for name, fn in benchmarks.items():
+        runs = measure(fn=fn, repeat=repeat)
+        results.append({"scale": n_fcps, "benchmark": name, "seconds": statistics.median(runs), "runs": runs})
+        print(f"{n_fcps:>6} {name:<32} {statistics.median(runs):.4f}s", file=sys.stderr)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark loaders, processors, pipelines and the optimizer")
+    parser.add_argument("--scales", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    setup_logger(level="WARNING", sink=sys.stderr)
+
+    results = []
+    for n_fcps in args.scales:
+        with tempfile.TemporaryDirectory() as root:
+            results.extend(run_scale(n_fcps=n_fcps, repeat=args.repeat, workers=args.workers, root=root))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "openpyxl": openpyxl.__version__,
+            "excel_engine": ExcelLoader().engine,
+            "pulp": pulp.__version__,
+            "workers": args.workers,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    output = args.output or os.path.join("benchmarks", "results", f"{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"Results saved to {output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
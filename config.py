@@ -1,13 +1,20 @@
 from loguru import logger
+import os
 import sys
 
-logger.remove()
-logger.add(
-    sys.stdout,
-    format="<cyan>{time:YYYY-MM-DD HH:mm:ss}</cyan> | "
-           "<level>{level: <8}</level> | "
-           "<white>{name}</white>:<white>{function}</white>:<white>{line}</white> - "
-           "<level>{message}</level>",
-    level="DEBUG",
-    colorize=True,
-)
+EXCEL_ENGINE = os.getenv("EXCEL_ENGINE", "auto")
+CHART_OF_ACCOUNTS = os.getenv("CHART_OF_ACCOUNTS", "./data/chart_of_accounts.csv")
+LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG")
+
+
+def setup_logger(level: str = LOG_LEVEL, sink=sys.stdout) -> None:
+    logger.remove()
+    logger.add(
+        sink,
+        format="<cyan>{time:YYYY-MM-DD HH:mm:ss}</cyan> | "
+               "<level>{level: <8}</level> | "
+               "<white>{name}</white>:<white>{function}</white>:<white>{line}</white> - "
+               "<level>{message}</level>",
+        level=level,
+        colorize=True,
+    )
@@ -1,10 +1,15 @@
 import streamlit as st
-import pulp
 import pandas as pd
-from src.modelling.optimizer import BudgetLpOptimizer
+from config import setup_logger
+from src.modelling.cache import SolveCache
+from src.modelling.params import DEFAULT_PARAMS
+from src.app.executor import SolveExecutor
 from PIL import Image
+import time
 import os
 
+setup_logger()
+
 # Configuración de la página
 st.set_page_config(
     page_title="Optimizador de Compassion",
@@ -16,42 +21,19 @@ st.set_page_config(
 MODEL_VERSION = "v1.0.0"
 
 
-# Función para ejecutar el optimizador
-def run_optimizer(params):
-    pulp.LpSolverDefault.msg = False
-
-    model = pulp.LpProblem(name="compassion", sense=pulp.LpMinimize)
+# Caché de soluciones compartida entre sesiones
+@st.cache_resource
+def get_solve_cache():
+    return SolveCache(maxsize=512, ttl=24 * 3600, path=os.getenv("SOLVE_CACHE_DIR"), namespace=MODEL_VERSION)
 
-    variables = {
-        "x1": pulp.LpVariable(name="x1", lowBound=0, cat="Integer"),
-        "x2": pulp.LpVariable(name="x2", lowBound=0, cat="Integer"),
-        "t1": pulp.LpVariable(name="t1", lowBound=0, cat="Integer"),
-        "t2": pulp.LpVariable(name="t2", lowBound=0, cat="Integer")
-    }
-
-    optimizer = BudgetLpOptimizer(model=model, variables=variables, params=params)
-    optimizer.set_objective()
-    optimizer.add_constraints()
-    optimizer.solve()
-
-    results = {
-        "status": pulp.LpStatus[model.status],
-        "n1": pulp.value(variables['x1']),
-        "n2": pulp.value(variables['x2']),
-        "t1": pulp.value(variables['t1']),
-        "t2": pulp.value(variables['t2']),
-    }
 
-    if results["status"] == "Optimal":
-        results["total_kids"] = results["n1"] + results["n2"]
-        results["expenses"] = ((params["C1"] * results["n1"] + params["C2"] * results["n2"]) +
-                               (params["D1"] * results["t1"]) + (params["D2"] * results["t2"]) +
-                               params["G"] + params["med_remb"] + params["V"] +
-                               params["director"] + params["accountant"] +
-                               params["secretary"] + params["additional"] + params["doctor"])
-        results["budget"] = (params["I"] + params["E"]) * results["total_kids"]
-
-    return results
+# Ejecutor de optimizaciones en segundo plano compartido entre sesiones
+@st.cache_resource
+def get_solve_executor():
+    return SolveExecutor(
+        max_workers=int(os.getenv("SOLVE_WORKERS", 2)),
+        time_limit=float(os.getenv("SOLVE_TIME_LIMIT", 60))
+    )
 
 
 def sidebar_contents():
@@ -76,34 +58,34 @@ def sidebar_contents():
 
     # Sección de parámetros de costo
     with st.sidebar.expander("Parámetros de Costo", expanded=True):
-        c1 = st.number_input("Costo participante basado en el hogar", value=25.00, step=10.0, format="%.2f")
-        c2 = st.number_input("Costo participante basado en el centro", value=99.00, step=10.0, format="%.2f")
-        d1 = st.number_input("Costo tutor para atención en el hogar", value=7735.32, step=10.0, format="%.2f")
-        d2 = st.number_input("Costo tutor para atención en el centro", value=7735.32, step=10.0, format="%.2f")
+        c1 = st.number_input("Costo participante basado en el hogar", value=DEFAULT_PARAMS["C1"], step=10.0, format="%.2f")
+        c2 = st.number_input("Costo participante basado en el centro", value=DEFAULT_PARAMS["C2"], step=10.0, format="%.2f")
+        d1 = st.number_input("Costo tutor para atención en el hogar", value=DEFAULT_PARAMS["D1"], step=10.0, format="%.2f")
+        d2 = st.number_input("Costo tutor para atención en el centro", value=DEFAULT_PARAMS["D2"], step=10.0, format="%.2f")
 
     # Sección de parámetros de ingreso
     with st.sidebar.expander("Parámetros de Ingresos", expanded=True):
-        i = st.number_input("Tarifa Child Support Anual", value=20.5 * 12, step=10.0, format="%.2f")
-        e = st.number_input("LRM aportes en efectivo", value=0.00, step=10.0, format="%.2f")
+        i = st.number_input("Tarifa Child Support Anual", value=DEFAULT_PARAMS["I"], step=10.0, format="%.2f")
+        e = st.number_input("LRM aportes en efectivo", value=DEFAULT_PARAMS["E"], step=10.0, format="%.2f")
 
     # Sección de restricciones
     with st.sidebar.expander("Restricciones", expanded=True):
-        n_max = st.number_input("Capacidad máxima de participantes", value=1000, step=10)
+        n_max = st.number_input("Capacidad máxima de participantes", value=DEFAULT_PARAMS["N_max"], step=10)
         kids_ratio = st.slider(
-            "Proporción participantes en el hogar", min_value=0.0, max_value=1.0, value=0.12, step=0.01,
+            "Proporción participantes en el hogar", min_value=0.0, max_value=1.0, value=DEFAULT_PARAMS["kids_ratio"], step=0.01,
             format="%.2f"
         )
 
     # Sección de gastos fijos
     with st.sidebar.expander("Gastos", expanded=True):
-        g = st.number_input("Gastos recurrentes", value=3012.26, step=100.0, format="%.2f")
-        med_remb = st.number_input("Gastos reembolso médico", value=500.00, step=100.0, format="%.2f")
-        v = st.number_input("Provisión / Reembolso salud", value=1000.00, step=100.0, format="%.2f")
-        doctor = st.number_input("Costo responsbale Salud y CPO", value=4741.56, step=100.0, format="%.2f")
-        director = st.number_input("Costo director/a", value=7735.32, step=100.0, format="%.2f")
-        accountant = st.number_input("Costo contador/a", value=float(200 * 12), step=100.0, format="%.2f")
-        secretary = st.number_input("Costo secretario/a", value=4741.56, step=100.0, format="%.2f")
-        additional = st.number_input("Costo otra posición", value=0.00, step=100.0, format="%.2f")
+        g = st.number_input("Gastos recurrentes", value=DEFAULT_PARAMS["G"], step=100.0, format="%.2f")
+        med_remb = st.number_input("Gastos reembolso médico", value=DEFAULT_PARAMS["med_remb"], step=100.0, format="%.2f")
+        v = st.number_input("Provisión / Reembolso salud", value=DEFAULT_PARAMS["V"], step=100.0, format="%.2f")
+        doctor = st.number_input("Costo responsbale Salud y CPO", value=DEFAULT_PARAMS["doctor"], step=100.0, format="%.2f")
+        director = st.number_input("Costo director/a", value=DEFAULT_PARAMS["director"], step=100.0, format="%.2f")
+        accountant = st.number_input("Costo contador/a", value=DEFAULT_PARAMS["accountant"], step=100.0, format="%.2f")
+        secretary = st.number_input("Costo secretario/a", value=DEFAULT_PARAMS["secretary"], step=100.0, format="%.2f")
+        additional = st.number_input("Costo otra posición", value=DEFAULT_PARAMS["additional"], step=100.0, format="%.2f")
 
     # Documentación del modelo como sección normal (no colapsable)
     st.sidebar.header("Documentación del Modelo")
@@ -321,8 +303,40 @@ def main():
 
     # Botón para ejecutar la optimización
     if st.button("Ejecutar Optimización", type="primary"):
-        with st.spinner("Calculando solución óptima..."):
-            results = run_optimizer(params)
+        results = get_solve_cache().get(params=params)
+        if results is None:
+            st.session_state["job_id"] = get_solve_executor().submit(params=params)
+            st.session_state.pop("solution", None)
+        else:
+            st.session_state["solution"] = (params, results)
+
+    # Seguimiento del trabajo en segundo plano
+    job_id = st.session_state.get("job_id")
+    if job_id is not None:
+        job = get_solve_executor().status(job_id=job_id)
+        if job is None:
+            del st.session_state["job_id"]
+        elif job.done:
+            del st.session_state["job_id"]
+            if job.status == "done":
+                get_solve_cache().set(params=job.params, results=job.result)
+                st.session_state["solution"] = (job.params, job.result)
+            elif job.status == "timeout":
+                st.error(f"⏱️ La optimización superó el tiempo límite ({job.elapsed:.0f} s)")
+            elif job.status == "cancelled":
+                st.warning("Optimización cancelada")
+            else:
+                st.error(f"❌ Error en la optimización: {job.error}")
+        else:
+            st.info(f"Calculando solución óptima... ({job.elapsed:.1f} s)")
+            if st.button("Cancelar"):
+                get_solve_executor().cancel(job_id=job_id)
+            time.sleep(0.5)
+            st.rerun()
+
+    solution = st.session_state.get("solution")
+    if solution is not None:
+        solution_params, results = solution
 
         # Estado de la solución con badge
         if results["status"] == "Optimal":
@@ -332,7 +346,7 @@ def main():
             display_metrics(results)
 
             # SECCIÓN 2: Detalles de la solución (colapsable)
-            display_details(results, params)
+            display_details(results, solution_params)
         else:
             st.error(f"❌ Estado de la solución: Inviable")
             st.warning("No se pudo encontrar una solución óptima. Revise los parámetros del modelo.")
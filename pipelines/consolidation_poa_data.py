@@ -1,22 +1,29 @@
 import os
-
-import pandas as pd
-
-from src.data import ExcelLoader
+from config import setup_logger
+from src.data import ParquetLoader, ParquetConsolidator, Manifest, AnalyticsCube
 from src.utils import save_pandas_data, list_files
 
-loader = ExcelLoader()
+setup_logger()
+
+loader = ParquetLoader()
+consolidator = ParquetConsolidator(loader=loader)
 source_path = "./data/processed/poa"
 final_path = "./data/processed/final"
-filepaths = list_files(path=source_path)
 filename = "poa"
-ext = ".xlsx"
-
-data_list = []
-for filepath in filepaths:
-    data = loader.load(filepath=filepath)
-    data_list.append(data)
+ext = ".parquet"
+filepaths = list_files(path=source_path, ext=ext)
+manifest = Manifest(filepath=os.path.join(final_path, "manifest.json"))
+cube = AnalyticsCube(path="./data/processed/cube")
+export_excel = False
 
-final = pd.concat(data_list)
 output_filepath = os.path.join(final_path, f"{filename}{ext}")
-save_pandas_data(input_data=final, filepath=output_filepath)
\ No newline at end of file
+if manifest.is_stale(inputs=filepaths, output=output_filepath):
+    consolidator.consolidate(filepaths=filepaths, output_filepath=output_filepath)
+    if export_excel:
+        final = loader.load(filepath=output_filepath)
+        save_pandas_data(input_data=final, filepath=os.path.join(final_path, f"{filename}.xlsx"))
+    manifest.update(inputs=[filepath for filepath in filepaths if filepath not in consolidator.skipped], output=output_filepath)
+    manifest.save()
+else:
+    print(f"{output_filepath} is up to date")
+cube.refresh(kind="budget", filepaths=filepaths, loader=loader)
@@ -0,0 +1,28 @@
+import os
+from config import setup_logger
+from src.data import ParquetLoader, CSVLoader
+from src.modelling.derive import derive_params, ACCOUNT_PARAMS
+from src.modelling.batch import solve_batch
+from src.utils import save_pandas_data, file_exists
+
+setup_logger()
+
+loader = ParquetLoader()
+final_path = "./data/processed/final"
+mapping_filepath = "./data/config/account_params.csv"
+filename = "solutions"
+ext = ".parquet"
+export_excel = False
+
+mapping = CSVLoader().load(filepath=mapping_filepath) if file_exists(path=mapping_filepath) else ACCOUNT_PARAMS
+params = derive_params(
+    poa=loader.load(filepath=os.path.join(final_path, "poa.parquet")),
+    balance=loader.load(filepath=os.path.join(final_path, "balance.parquet")),
+    fcps=loader.load(filepath=os.path.join(final_path, "fcps.parquet")),
+    mapping=mapping
+)
+results = solve_batch(params=params).reset_index()
+output_filepath = os.path.join(final_path, f"{filename}{ext}")
+save_pandas_data(input_data=results, filepath=output_filepath)
+if export_excel:
+    save_pandas_data(input_data=results, filepath=os.path.join(final_path, f"{filename}.xlsx"))
@@ -1,17 +1,41 @@
 import os
-from src.data import CSVLoader, POADataProcessor
-from src.utils import save_pandas_data, list_files, get_filename
+from config import setup_logger
+from src.data import CSVLoader, POADataProcessor, ProcessorRunner, Manifest, JSONLinesSink, load_metrics, summarize
+from src.utils import list_files, get_filename
+
+setup_logger()
 
 loader = CSVLoader()
 source_path = "./data/raw/POA FY24"
 processed_path = "./data/processed/poa"
 filepaths = list_files(path=source_path)
-processor = POADataProcessor(loader=loader)
-ext = ".xlsx"
+metrics_path = os.path.join(processed_path, "metrics.jsonl")
+processor = POADataProcessor(loader=loader, sink=JSONLinesSink(filepath=metrics_path))
+manifest = Manifest(filepath=os.path.join(processed_path, "manifest.json"))
+quarantine_path = os.path.join(processed_path, "quarantine")
+workers = int(os.getenv("PIPELINE_WORKERS", os.cpu_count()))
+ext = ".parquet"
+
+if __name__ == "__main__":
+    removed = manifest.prune(inputs=filepaths)
+    print(f"Removed {len(removed)} outputs of deleted files")
+    tasks = []
+    for filepath in filepaths:
+        filename = get_filename(filepath=filepath)
+        output_filepath = os.path.join(processed_path, f"{filename}{ext}")
+        if manifest.is_stale(inputs=[filepath], output=output_filepath):
+            tasks.append((filepath, output_filepath))
+    print(f"Skipping {len(filepaths) - len(tasks)} unchanged files")
 
-for filepath in filepaths:
-    processed_data = processor.process(filepath=filepath)
-    filename = get_filename(filepath=filepath)
-    output_filepath = os.path.join(processed_path, f"{filename}{ext}")
-    save_pandas_data(input_data=processed_data, filepath=output_filepath)
-    print(f"Processed: {filepath}")
\ No newline at end of file
+    if os.path.exists(metrics_path):
+        os.remove(metrics_path)
+    runner = ProcessorRunner(processor=processor, workers=workers, quarantine_path=quarantine_path)
+    report = runner.run(tasks=tasks)
+    for row in report[report["status"] == "ok"].itertuples():
+        manifest.update(inputs=[row.filepath], output=row.output)
+    manifest.save()
+    print(report[report["status"] != "ok"])
+    if os.path.exists(metrics_path):
+        summary = summarize(metrics=load_metrics(filepath=metrics_path))
+        print(summary["stages"])
+        print(summary["fcps"])
@@ -0,0 +1,193 @@
+import time
+import uuid
+import queue
+import threading
+import multiprocessing
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Connection
+from typing import Dict, Any, Callable, List
+from src.modelling.batch import solve_params
+
+FINISHED = ("done", "failed", "timeout", "cancelled")
+
+
+@dataclass
+class SolveJob:
+    id: str
+    params: Dict[str, Any]
+    status: str = "queued"
+    result: Dict[str, Any] | None = None
+    error: str | None = None
+    submitted: float = field(default_factory=time.time)
+    started: float | None = None
+    finished: float | None = None
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in FINISHED
+
+    @property
+    def elapsed(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+
+def serve(conn: Connection) -> None:
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+        solve, params = message
+        try:
+            conn.send(("done", solve(params), None))
+        except Exception as e:
+            conn.send(("failed", None, f"{type(e).__name__}: {e}"))
+    conn.close()
+
+
+class SolveWorker:
+    def __init__(self, context: Any):
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=serve, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+
+    @property
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    def stop(self, terminate: bool = False) -> None:
+        if not terminate and self.alive:
+            try:
+                self.conn.send(None)
+            except (BrokenPipeError, OSError):
+                terminate = True
+        if terminate and self.alive:
+            self.process.terminate()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+
+class SolveExecutor:
+    def __init__(
+            self,
+            max_workers: int = 2,
+            time_limit: float | None = 60.0,
+            max_jobs: int = 1000,
+            poll_interval: float = 0.05,
+            start_method: str | None = None,
+            preload: List[str] | None = None
+    ):
+        if start_method is None:
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        self.time_limit: float | None = time_limit
+        self.max_jobs: int = max_jobs
+        self.poll_interval: float = poll_interval
+        self.context = multiprocessing.get_context(start_method)
+        if start_method == "forkserver":
+            self.context.set_forkserver_preload(preload if preload is not None else ["src.modelling.batch"])
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="solve-supervisor")
+        self.idle: "queue.LifoQueue[SolveWorker]" = queue.LifoQueue()
+        self.jobs: Dict[str, SolveJob] = {}
+        self.lock = threading.Lock()
+
+    def submit(
+            self,
+            params: Dict[str, Any],
+            solve: Callable[[Dict[str, Any]], Dict[str, Any]] = solve_params,
+            time_limit: float | None = None
+    ) -> str:
+        job = SolveJob(id=uuid.uuid4().hex, params=dict(params))
+        with self.lock:
+            self.jobs[job.id] = job
+            self.prune()
+        self.pool.submit(self.supervise, job, solve, time_limit if time_limit is not None else self.time_limit)
+        return job.id
+
+    def acquire(self) -> SolveWorker:
+        while True:
+            try:
+                worker = self.idle.get_nowait()
+            except queue.Empty:
+                return SolveWorker(context=self.context)
+            if worker.alive:
+                return worker
+            worker.stop(terminate=True)
+
+    def supervise(self, job: SolveJob, solve: Callable[[Dict[str, Any]], Dict[str, Any]], time_limit: float | None) -> None:
+        if job.cancel_event.is_set():
+            self.finish(job=job, status="cancelled")
+            return
+        worker = None
+        reusable = False
+        job.started = time.time()
+        job.status = "running"
+        try:
+            worker = self.acquire()
+            worker.conn.send((solve, job.params))
+            deadline = None if time_limit is None else job.started + time_limit
+            while True:
+                if worker.conn.poll(self.poll_interval):
+                    status, result, error = worker.conn.recv()
+                    self.finish(job=job, status=status, result=result, error=error)
+                    reusable = True
+                    break
+                if job.cancel_event.is_set():
+                    self.finish(job=job, status="cancelled")
+                    break
+                if deadline is not None and time.time() >= deadline:
+                    self.finish(job=job, status="timeout", error=f"Solve exceeded {time_limit}s")
+                    break
+                if not worker.alive and not worker.conn.poll():
+                    self.finish(job=job, status="failed", error=f"Solver process exited with code {worker.process.exitcode}")
+                    break
+        except Exception as e:
+            self.finish(job=job, status="failed", error=f"{type(e).__name__}: {e}")
+        finally:
+            if worker is not None:
+                if reusable and worker.alive:
+                    self.idle.put(worker)
+                else:
+                    worker.stop(terminate=True)
+
+    def finish(self, job: SolveJob, status: str, result: Dict[str, Any] | None = None, error: str | None = None) -> None:
+        job.result = result
+        job.error = error
+        job.finished = time.time()
+        job.status = status
+
+    def status(self, job_id: str) -> SolveJob | None:
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        job = self.status(job_id=job_id)
+        if job is None or job.done:
+            return False
+        job.cancel_event.set()
+        return True
+
+    def wait(self, job_id: str, timeout: float | None = None) -> SolveJob:
+        job = self.jobs[job_id]
+        deadline = None if timeout is None else time.time() + timeout
+        while not job.done and (deadline is None or time.time() < deadline):
+            time.sleep(self.poll_interval)
+        return job
+
+    def prune(self) -> None:
+        finished: List[SolveJob] = sorted((job for job in self.jobs.values() if job.done), key=lambda job: job.finished)
+        for job in finished[:max(0, len(self.jobs) - self.max_jobs)]:
+            del self.jobs[job.id]
+
+    def shutdown(self) -> None:
+        for job in list(self.jobs.values()):
+            job.cancel_event.set()
+        self.pool.shutdown(wait=True)
+        while not self.idle.empty():
+            self.idle.get_nowait().stop()
@@ -1,2 +1,11 @@
-from .files import ExcelLoader, CSVLoader, DataLoader
-from .processors import FCPDataProcessor, POADataProcessor, BalanceDataProcessor
\ No newline at end of file
+import importlib
+from typing import Dict
+from src.utils.lazy import lazy_exports
+
+SUBPACKAGES = (".files", ".processors", ".analytics", ".query")
+
+EXPORTS: Dict[str, str] = {
+    name: package for package in SUBPACKAGES for name in importlib.import_module(package, __name__).__all__
+}
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, EXPORTS)
@@ -0,0 +1,8 @@
+from typing import Dict
+from src.utils.lazy import lazy_exports
+
+EXPORTS: Dict[str, str] = {
+    "AnalyticsCube": ".cube"
+}
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, EXPORTS)
@@ -0,0 +1,151 @@
+import os
+import numpy as np
+import pandas as pd
+from typing import List, Dict, Any, Tuple
+from config import logger
+from ..files import DataLoader, Manifest
+from ..processors.categories import CategorySchema
+from ...utils import list_files, get_filename
+
+MEASURES: Dict[str, Tuple[List[str], str]] = {
+    "budget": (["fcpId", "group", "account", "month"], "value"),
+    "execution": (["fcpId", "account", "month"], "diff"),
+}
+VARIANCE_KEYS: List[str] = ["fcpId", "account", "month"]
+
+
+class AnalyticsCube:
+    def __init__(self, path: str = "./data/processed/cube", manifest: Manifest | None = None):
+        self.path: str = path
+        self.manifest: Manifest = manifest or Manifest(filepath=os.path.join(path, "manifest.json"))
+        self.frames: Dict[str, pd.DataFrame] = {}
+
+    @staticmethod
+    def keys(kind: str) -> List[str]:
+        return VARIANCE_KEYS if kind == "variance" else MEASURES[kind][0]
+
+    def empty(self, kind: str) -> pd.DataFrame:
+        return pd.DataFrame(columns=self.keys(kind=kind)).assign(**{kind: pd.Series(dtype=float)})
+
+    def partition(self, kind: str, fcp_id: str) -> str:
+        return os.path.join(self.path, kind, f"{fcp_id}.parquet")
+
+    def fcp_ids(self, kind: str) -> List[str]:
+        path = os.path.join(self.path, kind)
+        return [get_filename(filepath=filepath) for filepath in list_files(path=path, ext=".parquet")] if os.path.isdir(path) else []
+
+    @staticmethod
+    def aggregate(data: pd.DataFrame, kind: str) -> pd.DataFrame:
+        keys, col = MEASURES[kind]
+        return data.groupby(keys, observed=True, sort=False)[col].sum().rename(kind).reset_index()
+
+    @staticmethod
+    def compute_variance(budget: pd.DataFrame, execution: pd.DataFrame) -> pd.DataFrame:
+        budget = budget.groupby(VARIANCE_KEYS, observed=True)["budget"].sum()
+        execution = execution.groupby(VARIANCE_KEYS, observed=True)["execution"].sum()
+        data = pd.concat([budget, execution], axis=1).fillna(0.0)
+        data["variance"] = data["execution"] - data["budget"]
+        data["execution_ratio"] = data["execution"] / data["budget"].replace(0.0, np.nan)
+        return data.reset_index()
+
+    def read_partition(self, kind: str, fcp_id: str) -> pd.DataFrame:
+        filepath = self.partition(kind=kind, fcp_id=fcp_id)
+        if not os.path.exists(filepath):
+            return self.empty(kind=kind)
+        return pd.read_parquet(filepath)
+
+    def write_partition(self, kind: str, fcp_id: str, data: pd.DataFrame) -> None:
+        filepath = self.partition(kind=kind, fcp_id=fcp_id)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        tmp_filepath = f"{filepath}.tmp"
+        data.to_parquet(tmp_filepath, index=False)
+        os.replace(tmp_filepath, filepath)
+
+    def remove_partition(self, kind: str, fcp_id: str) -> None:
+        filepath = self.partition(kind=kind, fcp_id=fcp_id)
+        if os.path.exists(filepath):
+            os.remove(filepath)
+
+    def update_variance(self, fcp_id: str) -> None:
+        budget = self.read_partition(kind="budget", fcp_id=fcp_id)
+        execution = self.read_partition(kind="execution", fcp_id=fcp_id)
+        if budget.empty and execution.empty:
+            self.remove_partition(kind="variance", fcp_id=fcp_id)
+            return
+        self.write_partition(kind="variance", fcp_id=fcp_id, data=self.compute_variance(budget=budget, execution=execution))
+
+    def update(self, kind: str, data: pd.DataFrame) -> List[str]:
+        aggregated = self.aggregate(data=data, kind=kind)
+        fcp_ids = []
+        for fcp_id, group in aggregated.groupby("fcpId", observed=True, sort=False):
+            fcp_id = str(fcp_id)
+            self.write_partition(kind=kind, fcp_id=fcp_id, data=group)
+            self.update_variance(fcp_id=fcp_id)
+            fcp_ids.append(fcp_id)
+        self.frames.clear()
+        return fcp_ids
+
+    def remove(self, kind: str, fcp_id: str) -> None:
+        self.remove_partition(kind=kind, fcp_id=fcp_id)
+        self.update_variance(fcp_id=fcp_id)
+        self.manifest.entries.pop(self.partition(kind=kind, fcp_id=fcp_id), None)
+        self.frames.clear()
+
+    def sources(self, kind: str) -> Dict[str, str | None]:
+        sources = {}
+        for fcp_id in self.fcp_ids(kind=kind):
+            entry = self.manifest.entries.get(self.partition(kind=kind, fcp_id=fcp_id))
+            sources[fcp_id] = next(iter(entry["inputs"]), None) if entry else None
+        return sources
+
+    def refresh(self, kind: str, filepaths: List[str], loader: DataLoader) -> List[str]:
+        updated = []
+        produced: Dict[str, List[str]] = {}
+        for fcp_id, source in self.sources(kind=kind).items():
+            if source in filepaths:
+                produced.setdefault(source, []).append(fcp_id)
+                continue
+            self.remove(kind=kind, fcp_id=fcp_id)
+            updated.append(fcp_id)
+        for filepath in filepaths:
+            partitions = [self.partition(kind=kind, fcp_id=fcp_id) for fcp_id in produced.get(filepath, [])]
+            if partitions and not any(self.manifest.is_stale(inputs=[filepath], output=partition) for partition in partitions):
+                continue
+            data = loader.load(filepath=filepath)
+            if data.empty:
+                logger.warning(f"Skipping empty data from {filepath}")
+                continue
+            fcp_ids = self.update(kind=kind, data=data)
+            for fcp_id in fcp_ids:
+                self.manifest.update(inputs=[filepath], output=self.partition(kind=kind, fcp_id=fcp_id))
+            for fcp_id in set(produced.get(filepath, [])) - set(fcp_ids):
+                self.remove(kind=kind, fcp_id=fcp_id)
+                fcp_ids.append(fcp_id)
+            updated.extend(fcp_ids)
+        os.makedirs(self.path, exist_ok=True)
+        self.manifest.save()
+        logger.success(f"Successfully refreshed {len(updated)} FCPs from {len(filepaths)} files in the {kind} cube at {self.path}")
+        return updated
+
+    def load(self, kind: str) -> pd.DataFrame:
+        if kind not in self.frames:
+            frames = [self.read_partition(kind=kind, fcp_id=fcp_id) for fcp_id in self.fcp_ids(kind=kind)]
+            data = CategorySchema.concat(frames=frames)
+            if data.empty:
+                data = self.empty(kind=kind)
+            self.frames[kind] = data.set_index(self.keys(kind=kind)).sort_index()
+        return self.frames[kind]
+
+    def query(self, kind: str = "variance", **filters: Any) -> pd.DataFrame:
+        data = self.load(kind=kind)
+        unknown = set(filters) - set(data.index.names)
+        if unknown:
+            raise ValueError(f"Unknown {kind} cube levels {sorted(unknown)}, expected {data.index.names}")
+        key = tuple(
+            [filters[level]] if isinstance(filters.get(level), str) else filters.get(level, slice(None))
+            for level in data.index.names
+        )
+        try:
+            return data.loc[key, :]
+        except KeyError:
+            return data.iloc[:0]
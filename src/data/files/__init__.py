@@ -1,2 +1,14 @@
-from .models.loader import DataLoader
-from .loaders import ExcelLoader, CSVLoader
\ No newline at end of file
+from typing import Dict
+from src.utils.lazy import lazy_exports
+
+EXPORTS: Dict[str, str] = {
+    "DataLoader": ".models.loader",
+    "ExcelLoader": ".loaders",
+    "CSVLoader": ".loaders",
+    "ParquetLoader": ".loaders",
+    "Manifest": ".manifest",
+    "ParquetConsolidator": ".consolidator",
+    "CachingLoader": ".caching"
+}
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, EXPORTS)
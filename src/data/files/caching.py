@@ -0,0 +1,94 @@
+import os
+import json
+import glob
+import pickle
+import hashlib
+import pandas as pd
+from typing import Dict, List, Any
+from config import logger
+from .models.loader import DataLoader
+from ...utils import file_hash
+
+
+def path_digest(filepath: str) -> str:
+    return hashlib.sha256(os.path.abspath(filepath).encode("utf-8")).hexdigest()[:16]
+
+
+class CachingLoader(DataLoader):
+    def __init__(
+            self,
+            loader: DataLoader,
+            path: str = "./data/cache/loaders",
+            max_bytes: int = 1 << 30,
+            validate: str = "mtime"
+    ):
+        if validate not in ("mtime", "hash"):
+            raise ValueError(f"Cache validation must be 'mtime' or 'hash', got '{validate}'")
+        self.loader: DataLoader = loader
+        self.path: str = path
+        self.max_bytes: int = max_bytes
+        self.validate: str = validate
+        os.makedirs(path, exist_ok=True)
+
+    def key(self, filepath: str, kwargs: Dict[str, Any]) -> str:
+        stat = os.stat(filepath)
+        version = file_hash(path=filepath) if self.validate == "hash" else stat.st_mtime_ns
+        payload = json.dumps(
+            [type(self.loader).__name__, getattr(self.loader, "engine", None), kwargs, stat.st_size, version],
+            sort_keys=True,
+            default=str
+        )
+        return f"{path_digest(filepath=filepath)}-{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+    def entries(self, filepath: str | None = None) -> List[str]:
+        prefix = "*" if filepath is None else f"{path_digest(filepath=filepath)}-*"
+        return glob.glob(os.path.join(self.path, f"{prefix}.pkl"))
+
+    def load(self, filepath: str, **kwargs) -> pd.DataFrame | Dict[str, pd.DataFrame]:
+        if not os.path.exists(filepath):
+            return self.loader.load(filepath=filepath, **kwargs)
+        cache_filepath = os.path.join(self.path, f"{self.key(filepath=filepath, kwargs=kwargs)}.pkl")
+        try:
+            with open(cache_filepath, "rb") as file:
+                data = pickle.load(file)
+            os.utime(cache_filepath)
+            logger.success(f"Successfully data loaded from cache for {filepath}")
+            return data
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {cache_filepath} - {e}")
+
+        data = self.loader.load(filepath=filepath, **kwargs)
+        if len(data) > 0:
+            tmp_filepath = f"{cache_filepath}.{os.getpid()}.tmp"
+            with open(tmp_filepath, "wb") as file:
+                pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_filepath, cache_filepath)
+            self.evict()
+        return data
+
+    def evict(self) -> None:
+        entries = []
+        for cache_filepath in self.entries():
+            try:
+                stat = os.stat(cache_filepath)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, cache_filepath))
+        total = sum(size for _, size, _ in entries)
+        for _, size, cache_filepath in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(cache_filepath)
+            except OSError:
+                pass
+            total -= size
+
+    def invalidate(self, filepath: str | None = None) -> None:
+        for cache_filepath in self.entries(filepath=filepath):
+            try:
+                os.remove(cache_filepath)
+            except OSError:
+                pass
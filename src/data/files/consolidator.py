@@ -0,0 +1,70 @@
+import os
+import pyarrow as pa
+import pandas as pd
+import pyarrow.parquet as pq
+from typing import Dict, List
+from config import logger
+from .models.loader import DataLoader
+
+
+class ParquetConsolidator:
+    def __init__(self, loader: DataLoader):
+        self.loader: DataLoader = loader
+        self.skipped: List[str] = []
+
+    @staticmethod
+    def widen_dictionaries(schema: pa.Schema) -> pa.Schema:
+        return pa.schema([
+            field.with_type(pa.dictionary(pa.int32(), field.type.value_type, field.type.ordered))
+            if pa.types.is_dictionary(field.type) else field
+            for field in schema
+        ], metadata=schema.metadata)
+
+    def read_schema(self, filepath: str, frames: Dict[str, pd.DataFrame]) -> pa.Schema | None:
+        if filepath.endswith(".parquet"):
+            return pq.read_schema(filepath)
+        data = frames[filepath] = self.loader.load(filepath=filepath)
+        return None if data.empty else pa.Schema.from_pandas(data, preserve_index=False)
+
+    @staticmethod
+    def conform(table: pa.Table, schema: pa.Schema) -> pa.Table:
+        columns = [
+            table.column(field.name).cast(field.type) if field.name in table.column_names else pa.nulls(table.num_rows, field.type)
+            for field in schema
+        ]
+        return pa.Table.from_arrays(columns, schema=schema)
+
+    def consolidate(self, filepaths: List[str], output_filepath: str) -> int:
+        self.skipped = []
+        frames: Dict[str, pd.DataFrame] = {}
+        schemas = [schema for schema in (self.read_schema(filepath=filepath, frames=frames) for filepath in filepaths) if schema is not None]
+        if not schemas:
+            raise ValueError(f"No data to consolidate into {output_filepath}")
+        schema = self.widen_dictionaries(schema=pa.unify_schemas([self.widen_dictionaries(schema=s) for s in schemas]))
+        tmp_filepath = f"{output_filepath}.tmp"
+        writer = None
+        rows = 0
+        try:
+            for filepath in filepaths:
+                data = frames.pop(filepath) if filepath in frames else self.loader.load(filepath=filepath)
+                if data.empty:
+                    logger.warning(f"Skipping empty data from {filepath}")
+                    self.skipped.append(filepath)
+                    continue
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp_filepath, schema)
+                table = self.conform(table=pa.Table.from_pandas(data, preserve_index=False), schema=schema)
+                writer.write_table(table)
+                rows += table.num_rows
+            if writer is None:
+                raise ValueError(f"No data to consolidate into {output_filepath}")
+            writer.close()
+            os.replace(tmp_filepath, output_filepath)
+        except BaseException:
+            if writer is not None:
+                writer.close()
+            if os.path.exists(tmp_filepath):
+                os.remove(tmp_filepath)
+            raise
+        logger.success(f"Successfully consolidated {rows} rows from {len(filepaths) - len(self.skipped)} files into {output_filepath}")
+        return rows
@@ -1,15 +1,41 @@
 import os
+import openpyxl
 import pandas as pd
-from typing import Dict
-from config import logger
+from importlib.util import find_spec
+from typing import Dict, List, Iterator, Tuple, Any
+from config import logger, EXCEL_ENGINE
 from src.data.files.models.loader import DataLoader
 
 
+def resolve_excel_engine(engine: str) -> str:
+    if engine not in ("auto", "calamine", "openpyxl"):
+        raise ValueError(f"Excel engine must be 'auto', 'calamine' or 'openpyxl', got '{engine}'")
+    if engine == "openpyxl":
+        return engine
+    if find_spec("python_calamine") is not None:
+        return "calamine"
+    if engine == "calamine":
+        logger.warning("python-calamine is not installed, falling back to openpyxl")
+    return "openpyxl"
+
+
 class ExcelLoader(DataLoader):
-    def load(self, filepath: str, sheet_name: int = 0, skiprows=None) -> pd.DataFrame | Dict[str, pd.DataFrame]:
+    def __init__(self, engine: str | None = None):
+        self.engine: str = resolve_excel_engine(engine=engine or EXCEL_ENGINE)
+
+    def load(
+            self,
+            filepath: str,
+            sheet_name: int | str | List | None = 0,
+            skiprows=None,
+            usecols=None,
+            dtype=None
+    ) -> pd.DataFrame | Dict[str, pd.DataFrame]:
         if os.path.exists(filepath):
             try:
-                data = pd.read_excel(filepath, sheet_name=sheet_name, skiprows=skiprows)
+                data = pd.read_excel(
+                    filepath, sheet_name=sheet_name, skiprows=skiprows, usecols=usecols, dtype=dtype, engine=self.engine
+                )
                 logger.success(f"Successfully data loaded from {filepath}")
                 return data
             except Exception as e:
@@ -19,6 +45,71 @@ class ExcelLoader(DataLoader):
             logger.error(f"{filepath} not exist!")
             return pd.DataFrame()
 
+    @staticmethod
+    def read_sheet(rows: Iterator[Tuple[Any, ...]], usecols: List[int] | List[str] | None, dtype) -> pd.DataFrame:
+        rows = [tuple(int(v) if isinstance(v, float) and v.is_integer() else v for v in row) for row in rows]
+        while rows and all(value is None for value in rows[-1]):
+            rows.pop()
+        if not rows:
+            return pd.DataFrame()
+        width = max((i + 1 for row in rows for i, value in enumerate(row) if value is not None), default=0)
+        header = [f"Unnamed: {i}" if value is None else value for i, value in enumerate(rows[0][:width])]
+        header += [f"Unnamed: {i}" for i in range(len(header), width)]
+        data = pd.DataFrame([row[:width] for row in rows[1:]], columns=header)
+        data = data.where(data.notna(), float("nan"))
+        if usecols is not None:
+            data = data.iloc[:, list(usecols)] if all(isinstance(col, int) for col in usecols) else data[list(usecols)]
+        if dtype is not None:
+            data = data.astype(dtype)
+        return data
+
+    def iter_sheets(
+            self,
+            filepath: str,
+            skiprows: int | None = None,
+            usecols: List[int] | List[str] | None = None,
+            dtype=None,
+            sheet_names: List[str] | None = None
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        if not os.path.exists(filepath):
+            logger.error(f"{filepath} not exist!")
+            return
+        if self.engine != "openpyxl":
+            yield from self.iter_engine_sheets(
+                filepath=filepath, skiprows=skiprows, usecols=usecols, dtype=dtype, sheet_names=sheet_names
+            )
+            return
+        try:
+            workbook = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+        except Exception as e:
+            logger.error(f"Error loading {filepath} - {e}")
+            return
+        try:
+            for name in sheet_names or workbook.sheetnames:
+                rows = workbook[name].iter_rows(min_row=(skiprows or 0) + 1, values_only=True)
+                yield name, self.read_sheet(rows=rows, usecols=usecols, dtype=dtype)
+            logger.success(f"Successfully data loaded from {filepath}")
+        finally:
+            workbook.close()
+
+    def iter_engine_sheets(
+            self,
+            filepath: str,
+            skiprows: int | None = None,
+            usecols: List[int] | List[str] | None = None,
+            dtype=None,
+            sheet_names: List[str] | None = None
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        try:
+            excel_file = pd.ExcelFile(filepath, engine=self.engine)
+        except Exception as e:
+            logger.error(f"Error loading {filepath} - {e}")
+            return
+        with excel_file:
+            for name in sheet_names or excel_file.sheet_names:
+                yield name, excel_file.parse(sheet_name=name, skiprows=skiprows, usecols=usecols, dtype=dtype)
+            logger.success(f"Successfully data loaded from {filepath}")
+
 
 class CSVLoader(DataLoader):
     def load(self, filepath: str) -> pd.DataFrame:
@@ -33,3 +124,18 @@ class CSVLoader(DataLoader):
         else:
             logger.error(f"{filepath} not exist!")
             return pd.DataFrame()
+
+
+class ParquetLoader(DataLoader):
+    def load(self, filepath: str, columns: List[str] | None = None) -> pd.DataFrame:
+        if os.path.exists(filepath):
+            try:
+                data = pd.read_parquet(filepath, columns=columns)
+                logger.success(f"Successfully data loaded from {filepath}")
+                return data
+            except Exception as e:
+                logger.error(f"Error loading {filepath} - {e}")
+                return pd.DataFrame()
+        else:
+            logger.error(f"{filepath} not exist!")
+            return pd.DataFrame()
@@ -0,0 +1,57 @@
+import os
+import json
+from typing import Dict, List, Any
+from config import logger
+from ...utils import file_exists, file_hash
+
+
+class Manifest:
+    def __init__(self, filepath: str):
+        self.filepath: str = filepath
+        self.entries: Dict[str, Dict[str, Any]] = self.read()
+        self.hashes: Dict[str, str] = {}
+
+    def read(self) -> Dict[str, Dict[str, Any]]:
+        if not file_exists(path=self.filepath):
+            return {}
+        try:
+            with open(self.filepath, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable manifest {self.filepath} - {e}")
+            return {}
+
+    def save(self) -> None:
+        tmp_filepath = f"{self.filepath}.tmp"
+        with open(tmp_filepath, "w", encoding="utf-8") as file:
+            json.dump(self.entries, file, indent=2, sort_keys=True)
+        os.replace(tmp_filepath, self.filepath)
+
+    def hash_inputs(self, inputs: List[str]) -> Dict[str, str]:
+        for path in inputs:
+            if path not in self.hashes:
+                self.hashes[path] = file_hash(path=path)
+        return {path: self.hashes[path] for path in inputs}
+
+    def is_stale(self, inputs: List[str], output: str) -> bool:
+        entry = self.entries.get(output)
+        if entry is None or not file_exists(path=output):
+            return True
+        return entry["inputs"] != self.hash_inputs(inputs=inputs)
+
+    def update(self, inputs: List[str], output: str) -> None:
+        self.entries[output] = {"inputs": self.hash_inputs(inputs=inputs)}
+
+    def prune(self, inputs: List[str]) -> List[str]:
+        current = set(inputs)
+        removed = []
+        for output, entry in list(self.entries.items()):
+            if not current.isdisjoint(entry["inputs"]):
+                continue
+            if file_exists(path=output):
+                os.remove(output)
+            del self.entries[output]
+            removed.append(output)
+        if removed:
+            logger.info(f"Pruned {len(removed)} outputs whose inputs no longer exist")
+        return removed
@@ -1 +1,22 @@
-from .processors import FCPDataProcessor, POADataProcessor, BalanceDataProcessor
\ No newline at end of file
+from typing import Dict
+from src.utils.lazy import lazy_exports
+
+EXPORTS: Dict[str, str] = {
+    "MetricsSink": ".models.sink",
+    "CategorySchema": ".categories",
+    "FrameSchema": ".schema",
+    "SchemaValidationError": ".schema",
+    "DataReadError": ".schema",
+    "FCPDataProcessor": ".processors",
+    "POADataProcessor": ".processors",
+    "BalanceDataProcessor": ".processors",
+    "MemorySink": ".metrics",
+    "JSONLinesSink": ".metrics",
+    "CSVSink": ".metrics",
+    "load_metrics": ".metrics",
+    "summarize": ".metrics",
+    "ProcessorRunner": ".runner",
+    "quarantine_file": ".runner"
+}
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, EXPORTS)
@@ -0,0 +1,52 @@
+import os
+import pandas as pd
+from typing import List, Dict
+from pandas.api.types import union_categoricals
+from config import logger, CHART_OF_ACCOUNTS
+
+MONTHS: List[str] = [f"m{i}" for i in range(1, 13)]
+
+
+class CategorySchema:
+    def __init__(self, columns: List[str], categories: Dict[str, List[str]] | None = None):
+        self.columns: List[str] = columns
+        self.categories: Dict[str, List[str]] = {"month": MONTHS, **(categories or {})}
+
+    @staticmethod
+    def chart_of_accounts(filepath: str = CHART_OF_ACCOUNTS) -> Dict[str, List[str]]:
+        if not os.path.exists(filepath):
+            logger.info(f"No chart of accounts at {filepath}, account and group categories follow each file")
+            return {}
+        chart = pd.read_csv(filepath, dtype=str)
+        return {col: sorted(chart[col].dropna().unique().tolist()) for col in ["account", "group"] if col in chart.columns}
+
+    def apply(self, data: pd.DataFrame) -> pd.DataFrame:
+        for col in self.columns:
+            if col not in data.columns:
+                continue
+            if col in self.categories:
+                values = pd.Categorical(data[col], categories=self.categories[col], ordered=col == "month")
+                unknown = data[col].notna().to_numpy() & values.isna()
+                if unknown.any():
+                    logger.warning(f"{unknown.sum()} values in '{col}' are not in the category vocabulary")
+                    if col != "month":
+                        extra = sorted(pd.unique(data[col][unknown]).tolist())
+                        values = pd.Categorical(data[col], categories=list(self.categories[col]) + extra)
+                data[col] = values
+            else:
+                data[col] = data[col].astype("category")
+        return data
+
+    @staticmethod
+    def concat(frames: List[pd.DataFrame]) -> pd.DataFrame:
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame()
+        for col in frames[0].columns:
+            dtypes = [frame[col].dtype for frame in frames]
+            if not all(isinstance(dtype, pd.CategoricalDtype) for dtype in dtypes) or all(dtype == dtypes[0] for dtype in dtypes):
+                continue
+            categories = union_categoricals([frame[col] for frame in frames], ignore_order=True).categories
+            dtype = pd.CategoricalDtype(categories=categories, ordered=dtypes[0].ordered)
+            frames = [frame.assign(**{col: frame[col].astype(dtype)}) for frame in frames]
+        return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,64 @@
+import os
+import csv
+import json
+import pandas as pd
+from typing import List, Dict, Any
+from .models.sink import MetricsSink
+
+FIELDS = [
+    "timestamp", "pid", "fcpId", "stage", "seconds", "rows_in", "rows_out", "rss_peak_delta_mb", "traced_peak_mb"
+]
+
+
+class MemorySink(MetricsSink):
+    def __init__(self):
+        self.records: List[Dict[str, Any]] = []
+
+    def write(self, record: Dict[str, Any]) -> None:
+        self.records.append(record)
+
+
+class JSONLinesSink(MetricsSink):
+    def __init__(self, filepath: str):
+        self.filepath: str = filepath
+
+    def write(self, record: Dict[str, Any]) -> None:
+        os.makedirs(os.path.dirname(self.filepath) or ".", exist_ok=True)
+        with open(self.filepath, "a", encoding="utf-8") as file:
+            file.write(json.dumps(record) + "\n")
+
+
+class CSVSink(MetricsSink):
+    def __init__(self, filepath: str):
+        self.filepath: str = filepath
+        os.makedirs(os.path.dirname(self.filepath) or ".", exist_ok=True)
+        with open(self.filepath, "a", encoding="utf-8", newline="") as file:
+            if file.tell() == 0:
+                csv.DictWriter(file, fieldnames=FIELDS).writeheader()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        with open(self.filepath, "a", encoding="utf-8", newline="") as file:
+            csv.DictWriter(file, fieldnames=FIELDS, extrasaction="ignore").writerow(record)
+
+
+def load_metrics(filepath: str) -> pd.DataFrame:
+    if filepath.endswith(".csv"):
+        return pd.read_csv(filepath)
+    return pd.read_json(filepath, lines=True)
+
+
+def summarize(metrics: pd.DataFrame, top: int = 10) -> Dict[str, pd.DataFrame]:
+    stages = metrics.groupby("stage").agg(
+        calls=("seconds", "size"),
+        total_seconds=("seconds", "sum"),
+        mean_seconds=("seconds", "mean"),
+        max_seconds=("seconds", "max"),
+        max_rss_peak_delta_mb=("rss_peak_delta_mb", "max")
+    ).sort_values("total_seconds", ascending=False)
+    fcps = metrics.groupby("fcpId").agg(
+        total_seconds=("seconds", "sum"),
+        rows_out=("rows_out", "last"),
+        max_rss_peak_delta_mb=("rss_peak_delta_mb", "max"),
+        slowest_stage=("seconds", lambda seconds: metrics.loc[seconds.idxmax(), "stage"])
+    ).sort_values("total_seconds", ascending=False).head(top)
+    return {"stages": stages, "fcps": fcps}
@@ -1,7 +1,81 @@
+import os
+import time
+import tracemalloc
 import pandas as pd
+from typing import Callable, Dict, Any
 from abc import ABC, abstractmethod
+from .sink import MetricsSink
+from ..schema import DataReadError
+from ....utils import get_filename
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def count_rows(data: Any) -> int | None:
+    if isinstance(data, pd.DataFrame):
+        return len(data)
+    if isinstance(data, dict):
+        return sum(len(df) for df in data.values())
+    return None
+
+
+def peak_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
 
 class DataProcessor(ABC):
+    def __init__(self, sink: MetricsSink | None = None, trace_memory: bool = False):
+        self.sink: MetricsSink | None = sink
+        self.trace_memory: bool = trace_memory
+
+    def get_fcp_id(self, filepath: str) -> str:
+        return get_filename(filepath=filepath)
+
+    @staticmethod
+    def check_loaded(data: pd.DataFrame, filepath: str) -> pd.DataFrame:
+        # Loaders return an empty frame without columns when the file could not be read
+        if data.empty and len(data.columns) == 0:
+            raise DataReadError(f"Could not read {filepath}")
+        return data
+
+    def run_stage(self, fcp_id: str, stage: str, fn: Callable[..., Any], /, **kwargs) -> Any:
+        if self.sink is None:
+            return fn(**kwargs)
+        rows_in = count_rows(data=kwargs.get("data", kwargs.get("info", kwargs.get("input_data"))))
+        started = self.trace_memory and not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        try:
+            if self.trace_memory:
+                tracemalloc.reset_peak()
+                traced_before = tracemalloc.get_traced_memory()[0]
+            rss_before = peak_rss_mb()
+            start = time.perf_counter()
+            result = fn(**kwargs)
+            seconds = time.perf_counter() - start
+            rss_after = peak_rss_mb()
+            traced_peak = (tracemalloc.get_traced_memory()[1] - traced_before) / 2 ** 20 if self.trace_memory else None
+        finally:
+            if started:
+                tracemalloc.stop()
+        record: Dict[str, Any] = {
+            "timestamp": time.time(),
+            "pid": os.getpid(),
+            "fcpId": fcp_id,
+            "stage": stage,
+            "seconds": seconds,
+            "rows_in": rows_in,
+            "rows_out": count_rows(data=result) if result is not None else rows_in,
+            "rss_peak_delta_mb": None if rss_before is None else rss_after - rss_before,
+            "traced_peak_mb": traced_peak
+        }
+        self.sink.write(record=record)
+        return result
+
     @abstractmethod
     def process(self, filepath: str) -> pd.DataFrame:
-        pass
\ No newline at end of file
+        pass
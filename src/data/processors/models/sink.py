@@ -0,0 +1,7 @@
+from typing import Dict, Any
+from abc import ABC, abstractmethod
+
+class MetricsSink(ABC):
+    @abstractmethod
+    def write(self, record: Dict[str, Any]) -> None:
+        pass
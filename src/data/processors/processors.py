@@ -1,14 +1,35 @@
 import re
 import pandas as pd
-from typing import List, Dict
+from typing import List, Dict, Iterable, Tuple
 from config import logger
 from ..files import DataLoader
 from .models.processor import DataProcessor
-from ...utils import get_filename, money_to_float
+from .models.sink import MetricsSink
+from .categories import CategorySchema
+from .schema import FrameSchema, SchemaValidationError, DataReadError, FCP_ID_PATTERN
+from ...utils import get_filename, money_series_to_float
+
+
+def parse_money_col(data: pd.DataFrame, col: str, max_errors: int = 0) -> pd.Series:
+    values, failed = money_series_to_float(values=data[col])
+    if failed.sum() > max_errors:
+        error = FrameSchema.error(check="money", column=col, message=f"Values in '{col}' are not money", failed=failed)
+        raise SchemaValidationError(f"{error['count']} values in '{col}' could not be parsed as money", errors=[error])
+    if failed.any():
+        rows = data.index[failed].tolist()
+        logger.warning(f"{len(rows)} values in '{col}' could not be parsed as money at rows {rows[:10]}, set to NaN")
+    return values
 
 
 class FCPDataProcessor(DataProcessor):
-    def __init__(self, loader: DataLoader):
+    def __init__(
+            self,
+            loader: DataLoader,
+            sink: MetricsSink | None = None,
+            trace_memory: bool = False,
+            frame_schema: FrameSchema | None = None
+    ):
+        super().__init__(sink=sink, trace_memory=trace_memory)
         self.loader: DataLoader = loader
         self.columns: List[str] = [
             "fcpId",
@@ -24,19 +45,43 @@ class FCPDataProcessor(DataProcessor):
             "fcpLat",
             "fcpLon"
         ]
+        self.frame_schema: FrameSchema = frame_schema or FrameSchema(
+            columns=self.columns,
+            required=["fcpId"],
+            patterns={"fcpId": FCP_ID_PATTERN},
+            dtypes={"fpcCurrentParticipants": "integer", "fcpLat": "number", "fcpLon": "number"},
+            id_pattern=None
+        )
 
     def process(self, filepath: str) -> pd.DataFrame:
+        fcp_id = self.get_fcp_id(filepath=filepath)
         logger.info(f"FCP data process initialized from {filepath}")
-        data = self.loader.load(filepath=filepath)
+        data = self.run_stage(fcp_id, "load", self.loader.load, filepath=filepath)
+        data = self.check_loaded(data=data, filepath=filepath)
+        data = self.run_stage(fcp_id, "validate", self.frame_schema.validate, data=data, filepath=filepath)
         data.columns = self.columns
         logger.success(f"Successfully FCP data processed from {filepath}")
         return data
 
 
 class POADataProcessor(DataProcessor):
-    def __init__(self, loader: DataLoader):
+    def __init__(
+            self,
+            loader: DataLoader,
+            sink: MetricsSink | None = None,
+            trace_memory: bool = False,
+            schema: CategorySchema | None = None,
+            frame_schema: FrameSchema | None = None,
+            max_money_errors: int = 0
+    ):
+        super().__init__(sink=sink, trace_memory=trace_memory)
         self.loader: DataLoader = loader
+        self.max_money_errors: int = max_money_errors
         self.columns: List[str] = ["activity", "group", "account", "total"] + [f"m{i}" for i in range(1, 13)]
+        self.schema: CategorySchema = schema or CategorySchema(
+            columns=["fcpId", "activity", "group", "account", "month"], categories=CategorySchema.chart_of_accounts()
+        )
+        self.frame_schema: FrameSchema = frame_schema or FrameSchema(columns=self.columns, dtypes={"account": "integer"})
 
     def set_columns(self, data: pd.DataFrame) -> pd.DataFrame:
         data.columns = self.columns
@@ -47,15 +92,10 @@ class POADataProcessor(DataProcessor):
         data = data[data[col].notnull()]
         return data
 
-    @staticmethod
-    def parse_col_types(data: pd.DataFrame) -> pd.DataFrame:
+    def parse_col_types(self, data: pd.DataFrame) -> pd.DataFrame:
         data["account"] = data["account"].astype(int).astype(str)
-        data["total"] = data["total"].apply(money_to_float)
-        for col in [f"m{i}" for i in range(1, 13)]:
-            if data[col].dtype.name == "object":
-                data[col] = data[col].apply(money_to_float)
-            else:
-                data[col] = data[col].astype(float)
+        for col in ["total"] + [f"m{i}" for i in range(1, 13)]:
+            data[col] = parse_money_col(data=data, col=col, max_errors=self.max_money_errors)
         return data
 
     @staticmethod
@@ -75,45 +115,84 @@ class POADataProcessor(DataProcessor):
         return data
 
     def process(self, filepath: str) -> pd.DataFrame:
-        fcp_id = get_filename(filepath=filepath)
+        fcp_id = self.frame_schema.check_id(fcp_id=self.get_fcp_id(filepath=filepath), filepath=filepath)
         logger.info(f"[{fcp_id}] POA data process initialized from {filepath}")
-        data = self.loader.load(filepath=filepath)
-        data = self.set_columns(data=data)
-        data = self.remove_nans_by_col(data=data, col="account")
-        data = self.parse_col_types(data=data)
-        data = self.set_fcp_id(data=data, fcp_id=fcp_id)
-        data = self.unpivot_month_values(data=data)
+        data = self.run_stage(fcp_id, "load", self.loader.load, filepath=filepath)
+        data = self.check_loaded(data=data, filepath=filepath)
+        data = self.run_stage(fcp_id, "validate", self.frame_schema.validate, data=data, filepath=filepath)
+        data = self.run_stage(fcp_id, "set_columns", self.set_columns, data=data)
+        data = self.run_stage(fcp_id, "remove_nans_by_col", self.remove_nans_by_col, data=data, col="account")
+        data = self.run_stage(fcp_id, "parse_col_types", self.parse_col_types, data=data)
+        data = self.run_stage(fcp_id, "set_fcp_id", self.set_fcp_id, data=data, fcp_id=fcp_id)
+        data = self.run_stage(fcp_id, "unpivot_month_values", self.unpivot_month_values, data=data)
+        data = self.run_stage(fcp_id, "set_categories", self.schema.apply, data=data)
         logger.info(f"[{fcp_id}] Successfully POA data processed from {filepath}")
         return data
 
 
 class BalanceDataProcessor(DataProcessor):
-    def __init__(self, loader: DataLoader):
+    def __init__(
+            self,
+            loader: DataLoader,
+            sink: MetricsSink | None = None,
+            trace_memory: bool = False,
+            schema: CategorySchema | None = None,
+            frame_schema: FrameSchema | None = None,
+            max_money_errors: int = 0
+    ):
+        super().__init__(sink=sink, trace_memory=trace_memory)
         self.loader: DataLoader = loader
+        self.max_money_errors: int = max_money_errors
         self.columns: List[str] = ["account", "description", "before", "debe", "haber", "diff", "month"]
+        self.usecols: List[int] = list(range(len(self.columns) - 1))
+        self.schema: CategorySchema = schema or CategorySchema(
+            columns=["fcpId", "account", "description", "month"], categories=CategorySchema.chart_of_accounts()
+        )
+        self.frame_schema: FrameSchema = frame_schema or FrameSchema(
+            columns=self.columns, required=["account"], dtypes={"account": "integer"}
+        )
 
     def set_columns(self, data: pd.DataFrame) -> pd.DataFrame:
         data.columns = self.columns
         return data
 
-    @staticmethod
-    def parse_data_sheets(info: Dict[str, pd.DataFrame]) -> pd.DataFrame:
-        data_list = []
-        for i, (_, df) in enumerate(info.items(), 1):
-            copy_df = df.copy()
-            copy_df["month"] = f"m{i}"
-            data_list.append(copy_df)
-        data = pd.concat(data_list).reset_index(drop=True)
+    def load_sheets(self, filepath: str) -> Iterable[Tuple[str, pd.DataFrame]]:
+        if hasattr(self.loader, "iter_sheets"):
+            return self.loader.iter_sheets(filepath=filepath, skiprows=5, usecols=self.usecols)
+        return self.loader.load(filepath=filepath, sheet_name=None, skiprows=5).items()
+
+    def parse_data_sheets(
+            self,
+            info: Dict[str, pd.DataFrame] | Iterable[Tuple[str, pd.DataFrame]],
+            filepath: str | None = None
+    ) -> pd.DataFrame:
+        data_list, errors, sheets = [], [], 0
+        for i, (name, df) in enumerate(info.items() if isinstance(info, dict) else info, 1):
+            sheets += 1
+            df["month"] = f"m{i}"
+            # Months without rows yet are kept, every other sheet must match the schema on its own
+            if len(df):
+                errors += [dict(error, sheet=name) for error in self.frame_schema.errors(data=df)]
+            data_list.append(df)
+        if not sheets:
+            raise DataReadError(f"Could not read any sheet from {filepath or 'data'}")
+        data = pd.concat(data_list, ignore_index=True)
+        if len(data) < self.frame_schema.min_rows:
+            errors.append(self.frame_schema.error(
+                check="rows", message=f"Expected at least {self.frame_schema.min_rows} rows, got {len(data)}"
+            ))
+        if errors:
+            raise SchemaValidationError(
+                f"{len(errors)} schema errors in {filepath or 'data'}: {errors[0]['message']}"
+                + (f" (sheet {errors[0]['sheet']!r})" if "sheet" in errors[0] else ""),
+                errors=errors
+            )
         return data
 
-    @staticmethod
-    def parse_col_types(data: pd.DataFrame) -> pd.DataFrame:
+    def parse_col_types(self, data: pd.DataFrame) -> pd.DataFrame:
         data["account"] = data["account"].astype(int).astype(str)
         for col in ["before", "debe", "haber", "diff"]:
-            if data[col].dtype.name == "object":
-                data[col] = data[col].apply(money_to_float)
-            else:
-                data[col] = data[col].astype(float)
+            data[col] = parse_money_col(data=data, col=col, max_errors=self.max_money_errors)
         return data
 
     @staticmethod
@@ -126,17 +205,25 @@ class BalanceDataProcessor(DataProcessor):
         data = data[data["account"] != "204"]
         return data
 
-    def process(self, filepath: str) -> pd.DataFrame:
+    @staticmethod
+    def get_fcp_id(filepath: str) -> str:
         filename = get_filename(filepath=filepath)
-        match = re.search(pattern="([A-Z]{2}\d{4})$", string=filename)
-        fcp_id = match.group(1)
+        match = re.search(pattern=rf"({FCP_ID_PATTERN})$", string=filename)
+        if match is None:
+            error = FrameSchema.error(check="fcp_id", message=f"No FCP id at the end of '{filename}'")
+            raise SchemaValidationError(f"Invalid FCP id in {filepath}", errors=[error])
+        return match.group(1)
+
+    def process(self, filepath: str) -> pd.DataFrame:
+        fcp_id = self.get_fcp_id(filepath=filepath)
         logger.info(f"[{fcp_id}] Balance data process initialized from {filepath}")
-        info = self.loader.load(filepath=filepath, sheet_name=None, skiprows=5)
-        data = self.parse_data_sheets(info=info)
-        data = self.set_columns(data=data)
-        data = self.parse_col_types(data=data)
-        data = self.filter_values_by_col(data=data, col="account")
-        data = self.set_fcp_id(data=data, fcp_id=fcp_id)
+        sheets = self.load_sheets(filepath=filepath)
+        data = self.run_stage(fcp_id, "load", self.parse_data_sheets, info=sheets, filepath=filepath)
+        data = self.run_stage(fcp_id, "set_columns", self.set_columns, data=data)
+        data = self.run_stage(fcp_id, "parse_col_types", self.parse_col_types, data=data)
+        data = self.run_stage(fcp_id, "filter_values_by_col", self.filter_values_by_col, data=data, col="account")
+        data = self.run_stage(fcp_id, "set_fcp_id", self.set_fcp_id, data=data, fcp_id=fcp_id)
+        data = self.run_stage(fcp_id, "set_categories", self.schema.apply, data=data)
         logger.success(f"[{fcp_id}] Successfully Balance data processed from {filepath}")
         return data
 
@@ -0,0 +1,72 @@
+import os
+import json
+import time
+import shutil
+import pandas as pd
+from typing import List, Tuple, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from config import logger
+from .models.processor import DataProcessor
+from .schema import SchemaValidationError
+from ...utils import save_pandas_data
+
+
+def quarantine_file(filepath: str, quarantine_path: str, error: SchemaValidationError) -> str:
+    os.makedirs(quarantine_path, exist_ok=True)
+    target = os.path.join(quarantine_path, os.path.basename(filepath))
+    report = {"filepath": filepath, "quarantined": target, "timestamp": time.time(), "error": str(error), "errors": error.errors}
+    with open(f"{target}.error.json", "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2, default=str)
+    if os.path.exists(filepath):
+        shutil.move(filepath, target)
+    logger.warning(f"Quarantined {filepath} into {quarantine_path} - {error}")
+    return target
+
+
+def process_file(
+        processor: DataProcessor,
+        filepath: str,
+        output_filepath: str,
+        quarantine_path: str | None = None
+) -> Dict[str, Any]:
+    try:
+        data = processor.process(filepath=filepath)
+        processor.run_stage(
+            processor.get_fcp_id(filepath=filepath), "save", save_pandas_data, input_data=data, filepath=output_filepath
+        )
+        return {"filepath": filepath, "output": output_filepath, "status": "ok", "rows": len(data), "error": None}
+    except SchemaValidationError as e:
+        if quarantine_path is not None:
+            quarantine_file(filepath=filepath, quarantine_path=quarantine_path, error=e)
+        else:
+            logger.error(f"Invalid {filepath} - {e}")
+        return {"filepath": filepath, "output": output_filepath, "status": "invalid", "rows": 0, "error": str(e)}
+    except Exception as e:
+        logger.error(f"Error processing {filepath} - {e}")
+        return {"filepath": filepath, "output": output_filepath, "status": "failed", "rows": 0, "error": str(e)}
+
+
+class ProcessorRunner:
+    def __init__(self, processor: DataProcessor, workers: int | None = None, quarantine_path: str | None = None):
+        self.processor: DataProcessor = processor
+        self.workers: int = workers or os.cpu_count() or 1
+        self.quarantine_path: str | None = quarantine_path
+
+    def run(self, tasks: List[Tuple[str, str]]) -> pd.DataFrame:
+        logger.info(f"Processing {len(tasks)} files with {self.workers} workers")
+        if self.workers == 1:
+            results = [process_file(self.processor, filepath, output, self.quarantine_path) for filepath, output in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                results = list(executor.map(
+                    process_file,
+                    [self.processor] * len(tasks),
+                    [filepath for filepath, _ in tasks],
+                    [output for _, output in tasks],
+                    [self.quarantine_path] * len(tasks)
+                ))
+        report = pd.DataFrame(results, columns=["filepath", "output", "status", "rows", "error"])
+        failed = (report["status"] != "ok").sum()
+        invalid = (report["status"] == "invalid").sum()
+        logger.info(f"Processed {len(report) - failed} files, {failed} failed ({invalid} invalid)")
+        return report
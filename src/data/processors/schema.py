@@ -0,0 +1,91 @@
+import re
+import pandas as pd
+from typing import List, Dict, Any
+
+FCP_ID_PATTERN: str = r"[A-Z]{2}\d{4}"
+
+
+class SchemaValidationError(Exception):
+    def __init__(self, message: str, errors: List[Dict[str, Any]]):
+        super().__init__(message)
+        self.errors: List[Dict[str, Any]] = errors
+
+
+class DataReadError(Exception):
+    pass
+
+
+class FrameSchema:
+    def __init__(
+            self,
+            columns: List[str],
+            headers: List[str] | None = None,
+            dtypes: Dict[str, str] | None = None,
+            patterns: Dict[str, str] | None = None,
+            required: List[str] | None = None,
+            min_rows: int = 1,
+            id_pattern: str | None = FCP_ID_PATTERN
+    ):
+        self.columns: List[str] = columns
+        self.headers: List[str] | None = headers
+        self.dtypes: Dict[str, str] = dtypes or {}
+        self.patterns: Dict[str, str] = patterns or {}
+        self.required: List[str] = required or []
+        self.min_rows: int = min_rows
+        self.id_pattern: str | None = id_pattern
+
+    @staticmethod
+    def error(check: str, message: str, column: str | None = None, failed: pd.Series | None = None) -> Dict[str, Any]:
+        error = {"check": check, "column": column, "message": message, "count": None, "rows": []}
+        if failed is not None:
+            error["count"] = int(failed.sum())
+            error["rows"] = failed.index[failed.to_numpy()][:10].tolist()
+        return error
+
+    def check_id(self, fcp_id: str | None, filepath: str) -> str:
+        if self.id_pattern is not None and (fcp_id is None or re.fullmatch(self.id_pattern, fcp_id) is None):
+            error = self.error(check="fcp_id", message=f"FCP id {fcp_id!r} does not match {self.id_pattern}")
+            raise SchemaValidationError(f"Invalid FCP id in {filepath}", errors=[error])
+        return fcp_id
+
+    def check_dtype(self, values: pd.Series, dtype: str) -> pd.Series:
+        present = values.notna()
+        if dtype == "number":
+            parsed = pd.to_numeric(values, errors="coerce") if values.dtype == object else values
+            return present & parsed.isna()
+        if dtype == "integer":
+            parsed = pd.to_numeric(values, errors="coerce")
+            return present & (parsed.isna() | (parsed % 1 != 0))
+        raise ValueError(f"Unknown schema dtype '{dtype}', expected 'number' or 'integer'")
+
+    def errors(self, data: pd.DataFrame) -> List[Dict[str, Any]]:
+        if len(data.columns) != len(self.columns):
+            return [self.error(check="columns", message=f"Expected {len(self.columns)} columns, got {len(data.columns)}")]
+        errors = []
+        if len(data) < self.min_rows:
+            errors.append(self.error(check="rows", message=f"Expected at least {self.min_rows} rows, got {len(data)}"))
+        if self.headers is not None:
+            mismatched = [f"{found!r} != {expected!r}" for found, expected in zip(data.columns, self.headers) if found != expected]
+            if mismatched:
+                errors.append(self.error(check="headers", message=f"Unexpected headers: {', '.join(mismatched)}"))
+        data = data.set_axis(self.columns, axis=1)
+        for col in self.required:
+            failed = data[col].isna()
+            if failed.any():
+                errors.append(self.error(check="required", column=col, message=f"Missing values in '{col}'", failed=failed))
+        for col, dtype in self.dtypes.items():
+            failed = self.check_dtype(values=data[col], dtype=dtype)
+            if failed.any():
+                errors.append(self.error(check="dtype", column=col, message=f"Values in '{col}' are not {dtype}", failed=failed))
+        for col, pattern in self.patterns.items():
+            values = data[col]
+            failed = values.notna() & ~values.astype(str).str.fullmatch(pattern)
+            if failed.any():
+                errors.append(self.error(check="pattern", column=col, message=f"Values in '{col}' do not match {pattern}", failed=failed))
+        return errors
+
+    def validate(self, data: pd.DataFrame, filepath: str | None = None) -> pd.DataFrame:
+        errors = self.errors(data=data)
+        if errors:
+            raise SchemaValidationError(f"{len(errors)} schema errors in {filepath or 'data'}: {errors[0]['message']}", errors=errors)
+        return data
@@ -0,0 +1,139 @@
+import os
+import re
+import pandas as pd
+from typing import List, Dict, Any, Tuple
+from config import logger
+
+AGGREGATIONS: Dict[str, str] = {"sum": "SUM", "mean": "AVG", "min": "MIN", "max": "MAX", "count": "COUNT"}
+READERS: Dict[str, str] = {".parquet": "read_parquet", ".csv": "read_csv_auto"}
+IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class QueryEngine:
+    def __init__(self, database: str = ":memory:", threads: int | None = None):
+        try:
+            import duckdb
+        except ImportError as e:
+            raise ImportError("QueryEngine requires duckdb (pip install duckdb)") from e
+        self.connection = duckdb.connect(database=database)
+        if threads is not None:
+            self.connection.execute(f"SET threads = {int(threads)}")
+        self.views: Dict[str, str] = {}
+        self.columns: Dict[str, List[str]] = {}
+
+    def __enter__(self) -> "QueryEngine":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    @staticmethod
+    def source(path: str, ext: str | None = None) -> str:
+        if os.path.isdir(path):
+            ext = ext or ".parquet"
+            path = os.path.join(path, f"*{ext}")
+        ext = ext or os.path.splitext(path)[1]
+        if ext not in READERS:
+            raise ValueError(f"Unsupported file type '{ext}', expected one of {list(READERS)}")
+        literal = "'" + path.replace("'", "''") + "'"
+        return f"{READERS[ext]}({literal}, union_by_name = true)"
+
+    def register(self, name: str, path: str, ext: str | None = None) -> None:
+        if not IDENTIFIER.match(name):
+            raise ValueError(f"Invalid view name '{name}'")
+        self.connection.execute(f"CREATE OR REPLACE VIEW {quote(name)} AS SELECT * FROM {self.source(path=path, ext=ext)}")
+        self.views[name] = path
+        self.columns[name] = [row[0] for row in self.connection.execute(f"DESCRIBE {quote(name)}").fetchall()]
+        logger.success(f"Successfully registered view '{name}' over {path}")
+
+    def register_outputs(self, processed_path: str = "./data/processed") -> List[str]:
+        final_path = os.path.join(processed_path, "final")
+        sources = {
+            "poa": os.path.join(processed_path, "poa"),
+            "balance": os.path.join(processed_path, "balance"),
+            "poa_final": os.path.join(final_path, "poa.parquet"),
+            "balance_final": os.path.join(final_path, "balance.parquet"),
+            "fcps": os.path.join(final_path, "fcps.parquet"),
+        }
+        registered = []
+        for name, path in sources.items():
+            if not os.path.exists(path):
+                continue
+            if os.path.isdir(path) and not any(filename.endswith(".parquet") for filename in os.listdir(path)):
+                continue
+            self.register(name=name, path=path)
+            registered.append(name)
+        return registered
+
+    def check_columns(self, view: str, columns: List[str]) -> None:
+        if view not in self.columns:
+            raise KeyError(f"View '{view}' is not registered")
+        unknown = [col for col in columns if col not in self.columns[view]]
+        if unknown:
+            raise KeyError(f"Columns {unknown} not found in view '{view}'")
+
+    @staticmethod
+    def where(filters: Dict[str, Any], alias: Dict[str, str] | None = None) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        for col, value in filters.items():
+            name = f"{alias[col]}.{quote(col)}" if alias else quote(col)
+            if isinstance(value, (list, tuple, set)):
+                values = list(value)
+                clauses.append(f"{name} IN ({', '.join('?' for _ in values)})" if values else "FALSE")
+                params.extend(values)
+            elif value is None:
+                clauses.append(f"{name} IS NULL")
+            else:
+                clauses.append(f"{name} = ?")
+                params.append(value)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def sql(self, query: str, params: List[Any] | None = None) -> pd.DataFrame:
+        return self.connection.execute(query, params or []).df()
+
+    def filter(self, view: str, columns: List[str] | None = None, **filters: Any) -> pd.DataFrame:
+        self.check_columns(view=view, columns=(columns or []) + list(filters))
+        select = ", ".join(quote(col) for col in columns) if columns else "*"
+        where, params = self.where(filters=filters)
+        return self.sql(query=f"SELECT {select} FROM {quote(view)}{where}", params=params)
+
+    def aggregate(self, view: str, by: List[str], values: Dict[str, str], **filters: Any) -> pd.DataFrame:
+        self.check_columns(view=view, columns=by + list(values) + list(filters))
+        unknown = set(values.values()) - set(AGGREGATIONS)
+        if unknown:
+            raise ValueError(f"Unsupported aggregations {sorted(unknown)}, expected one of {list(AGGREGATIONS)}")
+        keys = ", ".join(quote(col) for col in by)
+        measures = ", ".join(f"{AGGREGATIONS[fn]}({quote(col)}) AS {quote(col)}" for col, fn in values.items())
+        where, params = self.where(filters=filters)
+        query = f"SELECT {keys}, {measures} FROM {quote(view)}{where} GROUP BY {keys} ORDER BY {keys}"
+        return self.sql(query=query, params=params)
+
+    def join(
+            self,
+            left: str,
+            right: str,
+            on: List[str],
+            columns: List[str] | None = None,
+            how: str = "inner",
+            **filters: Any
+    ) -> pd.DataFrame:
+        if how not in ("inner", "left", "right", "full"):
+            raise ValueError(f"Join type must be 'inner', 'left', 'right' or 'full', got '{how}'")
+        self.check_columns(view=left, columns=on)
+        self.check_columns(view=right, columns=on)
+        alias = {col: "l" if col in self.columns[left] else "r" for col in (columns or []) + list(filters)}
+        self.check_columns(view=right, columns=[col for col, side in alias.items() if side == "r"])
+        select = ", ".join(
+            quote(col) if col in on else f"{alias[col]}.{quote(col)}" for col in columns
+        ) if columns else "*"
+        where, params = self.where(filters=filters, alias={col: "l" if col in on else alias[col] for col in filters})
+        using = ", ".join(quote(col) for col in on)
+        query = f"SELECT {select} FROM {quote(left)} AS l {how.upper()} JOIN {quote(right)} AS r USING ({using}){where}"
+        return self.sql(query=query, params=params)
@@ -0,0 +1,22 @@
+from typing import Dict
+from src.utils.lazy import lazy_exports
+
+EXPORTS: Dict[str, str] = {
+    "LpOptimizer": ".optimizer",
+    "BudgetLpOptimizer": ".optimizer",
+    "PortfolioLpOptimizer": ".portfolio",
+    "MatrixModel": ".matrix",
+    "EnumerationSolver": ".solvers",
+    "SolverConfig": ".solvers",
+    "SolveStats": ".solvers",
+    "SolveCache": ".cache",
+    "solve_params": ".batch",
+    "solve_batch": ".batch",
+    "scenario_grid": ".sweep",
+    "derive_params": ".derive",
+    "ACCOUNT_PARAMS": ".derive",
+    "DEFAULT_PARAMS": ".params",
+    "parse_params": ".params"
+}
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, EXPORTS)
@@ -0,0 +1,33 @@
+import pulp
+import pandas as pd
+from typing import List, Dict, Any
+from .optimizer import BudgetLpOptimizer
+from .solvers import SolverConfig
+
+
+def solve_params(
+        params: Dict[str, Any],
+        solver: pulp.LpSolver | None = None,
+        config: SolverConfig | None = None
+) -> Dict[str, Any]:
+    optimizer = BudgetLpOptimizer.build(params=params)
+    optimizer.solve(solver=solver, config=config)
+    return optimizer.get_results()
+
+
+def solve_batch(
+        params: pd.DataFrame,
+        solver: pulp.LpSolver | None = None,
+        config: SolverConfig | None = None
+) -> pd.DataFrame:
+    solver = solver or (config or SolverConfig(backend="enum")).build()
+    optimizer = None
+    results: List[Dict[str, Any]] = []
+    for row in params.to_dict(orient="records"):
+        if optimizer is None:
+            optimizer = BudgetLpOptimizer.build(params=row)
+        else:
+            optimizer.update_params(params=row)
+        optimizer.solve(solver=solver)
+        results.append(optimizer.get_results())
+    return pd.DataFrame(results, index=params.index)
@@ -0,0 +1,145 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Tuple
+
+
+class SolveCache:
+    def __init__(
+            self,
+            maxsize: int = 256,
+            ttl: float | None = 3600,
+            path: str | None = None,
+            precision: int = 6,
+            namespace: str = "",
+            max_disk_entries: int | None = 10_000,
+            max_disk_bytes: int | None = None
+    ):
+        self.maxsize: int = maxsize
+        self.ttl: float | None = ttl
+        self.path: str | None = path
+        self.precision: int = precision
+        self.namespace: str = namespace
+        self.max_disk_entries: int | None = max_disk_entries
+        self.max_disk_bytes: int | None = max_disk_bytes
+        self.entries: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self.stats: Dict[str, int] = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "disk_evictions": 0}
+        self.lock = threading.Lock()
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+
+    def key(self, params: Dict[str, Any]) -> str:
+        normalized = {
+            name: round(float(value), self.precision) if isinstance(value, (int, float)) else value
+            for name, value in params.items()
+        }
+        payload = json.dumps([self.namespace, normalized], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def expired(self, created: float) -> bool:
+        return self.ttl is not None and time.time() - created >= self.ttl
+
+    def read_disk(self, key: str) -> Tuple[float, Dict[str, Any]] | None:
+        filepath = os.path.join(self.path, f"{key}.json")
+        try:
+            with open(filepath, "r", encoding="utf-8") as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if self.expired(created=entry["created"]):
+            try:
+                os.remove(filepath)
+            except OSError:
+                pass
+            return None
+        return entry["created"], entry["results"]
+
+    def write_disk(self, key: str, created: float, results: Dict[str, Any]) -> None:
+        filepath = os.path.join(self.path, f"{key}.json")
+        tmp_filepath = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_filepath, "w", encoding="utf-8") as file:
+            json.dump({"created": created, "results": results}, file)
+        os.replace(tmp_filepath, filepath)
+        self.prune_disk()
+
+    def over_disk_limit(self, count: int, size: int) -> bool:
+        too_many = self.max_disk_entries is not None and count > self.max_disk_entries
+        too_large = self.max_disk_bytes is not None and size > self.max_disk_bytes
+        return too_many or too_large
+
+    def prune_disk(self) -> None:
+        if self.max_disk_entries is None and self.max_disk_bytes is None:
+            return
+        files = []
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        files.sort()
+        count, size = len(files), sum(file[1] for file in files)
+        for _, file_size, filepath in files:
+            if not self.over_disk_limit(count=count, size=size):
+                break
+            try:
+                os.remove(filepath)
+            except OSError:
+                continue
+            count, size = count - 1, size - file_size
+            with self.lock:
+                self.stats["disk_evictions"] += 1
+
+    def get(self, params: Dict[str, Any]) -> Dict[str, Any] | None:
+        key = self.key(params=params)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and self.expired(created=entry[0]):
+                del self.entries[key]
+                entry = None
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry[1]
+        if self.path is not None:
+            entry = self.read_disk(key=key)
+            if entry is not None:
+                with self.lock:
+                    self.store(key=key, entry=entry)
+                    self.stats["disk_hits"] += 1
+                return entry[1]
+        with self.lock:
+            self.stats["misses"] += 1
+        return None
+
+    def store(self, key: str, entry: Tuple[float, Dict[str, Any]]) -> None:
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def set(self, params: Dict[str, Any], results: Dict[str, Any]) -> None:
+        key = self.key(params=params)
+        created = time.time()
+        with self.lock:
+            self.store(key=key, entry=(created, results))
+        if self.path is not None:
+            self.write_disk(key=key, created=created, results=results)
+
+    def get_or_solve(self, params: Dict[str, Any], solve: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Dict[str, Any]:
+        results = self.get(params=params)
+        if results is None:
+            results = solve(params)
+            self.set(params=params, results=results)
+        return results
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
@@ -0,0 +1,137 @@
+import os
+import sys
+import csv
+import json
+import argparse
+import itertools
+from typing import List, Dict, Any, Iterator, Iterable, TextIO
+from .params import DEFAULT_PARAMS, parse_params
+
+SOLVERS = ("cbc", "highs", "glpk", "enum")
+
+
+def read_rows(file: TextIO, fmt: str) -> Iterator[Dict[str, Any]]:
+    if fmt == "csv":
+        yield from csv.DictReader(file)
+        return
+    for line in file:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def detect_format(path: str, fmt: str) -> str:
+    if fmt != "auto":
+        return fmt
+    return "csv" if path.endswith(".csv") else "jsonl"
+
+
+def solve_chunk(rows: List[Dict[str, Any]], solver: Dict[str, Any]) -> List[Dict[str, Any]]:
+    from .optimizer import BudgetLpOptimizer
+    from .solvers import SolverConfig
+    config = SolverConfig(**solver)
+    optimizer = None
+    results = []
+    for row in rows:
+        extra = {name: value for name, value in row.items() if name not in DEFAULT_PARAMS}
+        try:
+            params = parse_params(values=row)
+            if optimizer is None:
+                optimizer = BudgetLpOptimizer.build(params=params)
+            else:
+                optimizer.update_params(params=params)
+            optimizer.solve(config=config)
+            results.append({**extra, **optimizer.get_results()})
+        except Exception as e:
+            results.append({**extra, "status": "Error", "error": str(e)})
+    return results
+
+
+def chunked(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    rows = iter(rows)
+    while chunk := list(itertools.islice(rows, size)):
+        yield chunk
+
+
+def run(
+        rows: Iterable[Dict[str, Any]],
+        output: TextIO,
+        workers: int = 1,
+        solver: str = "cbc",
+        chunk_size: int = 64,
+        threads: int | None = None,
+        time_limit: float | None = None,
+        gap: float | None = None
+) -> int:
+    failed = 0
+    config = {"backend": solver, "threads": threads, "time_limit": time_limit, "gap": gap}
+    chunks = chunked(rows=rows, size=chunk_size)
+    if workers == 1:
+        chunk_results = (solve_chunk(rows=chunk, solver=config) for chunk in chunks)
+        executor = None
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=workers)
+        window = chunked(rows=chunks, size=workers * 4)
+        chunk_results = (
+            result
+            for batch in window
+            for result in executor.map(solve_chunk, batch, [config] * len(batch))
+        )
+    try:
+        for results in chunk_results:
+            for result in results:
+                failed += result["status"] == "Error"
+                output.write(json.dumps(result) + "\n")
+            output.flush()
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return failed
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.modelling.cli",
+        description="Solve BudgetLpOptimizer parameter sets from CSV/JSON lines and stream JSON lines results"
+    )
+    parser.add_argument("input", nargs="?", default="-", help="CSV or JSON lines file, '-' for stdin")
+    parser.add_argument("--format", choices=["auto", "csv", "jsonl"], default="auto")
+    parser.add_argument("--output", default="-", help="JSON lines output file, '-' for stdout")
+    parser.add_argument("--workers", type=int, default=int(os.getenv("CLI_WORKERS", 1)))
+    parser.add_argument("--solver", choices=SOLVERS, default="cbc")
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--threads", type=int, default=None)
+    parser.add_argument("--time-limit", type=float, default=None, help="Per-solve time limit in seconds")
+    parser.add_argument("--gap", type=float, default=None, help="Relative MIP gap")
+    parser.add_argument("--defaults", action="store_true", help="Print the default parameters and exit")
+    args = parser.parse_args(argv)
+
+    if args.defaults:
+        print(json.dumps(DEFAULT_PARAMS))
+        return 0
+
+    fmt = detect_format(path=args.input, fmt=args.format)
+    source = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8", newline="")
+    output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        failed = run(
+            rows=read_rows(file=source, fmt=fmt),
+            output=output,
+            workers=max(1, args.workers),
+            solver=args.solver,
+            chunk_size=max(1, args.chunk_size),
+            threads=args.threads,
+            time_limit=args.time_limit,
+            gap=args.gap
+        )
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, List
+from config import logger
+from .params import DEFAULT_PARAMS
+
+ACCOUNT_PARAMS: pd.DataFrame = pd.DataFrame(
+    [
+        {"param": "I", "source": "balance", "prefix": "4", "measure": "haber", "scale": 1.0, "per": "fpcCurrentParticipants"},
+        {"param": "C2", "source": "poa", "prefix": "513", "measure": "value", "scale": 1.0, "per": "fpcCurrentParticipants"},
+    ],
+    columns=["param", "source", "prefix", "measure", "scale", "per"]
+)
+DERIVED_PARAMS: List[str] = [
+    "I", "C1", "C2", "D1", "D2", "G", "med_remb", "V", "doctor", "director", "accountant", "secretary"
+]
+
+
+def leaf_accounts(accounts: pd.Index, groups: pd.Index | None = None) -> np.ndarray:
+    accounts = pd.Index(accounts).astype(str)
+    groups = pd.Index([""] * len(accounts) if groups is None else groups).astype(str)
+    # An account is a leaf unless its own group (fcpId) has sub-accounts under it
+    prefixes = {(group, account[:k]) for group, account in zip(groups, accounts) for k in range(1, len(account))}
+    return np.fromiter(((group, account) not in prefixes for group, account in zip(groups, accounts)), dtype=bool, count=len(accounts))
+
+
+def match_accounts(accounts: pd.Index, prefixes: pd.Series) -> pd.Series:
+    accounts = accounts.astype(str)
+    rules = pd.Series(-1, index=accounts)
+    length = pd.Series(0, index=accounts)
+    for rule, prefix in prefixes.astype(str).items():
+        matched = accounts.str.startswith(prefix) & (len(prefix) > length.to_numpy())
+        rules[matched] = rule
+        length[matched] = len(prefix)
+    return rules
+
+
+def aggregate_source(data: pd.DataFrame, mapping: pd.DataFrame) -> pd.DataFrame:
+    data = data.assign(fcpId=data["fcpId"].astype(str), account=data["account"].astype(str))
+    pairs = data[["fcpId", "account"]].drop_duplicates()
+    pairs = pairs[leaf_accounts(accounts=pd.Index(pairs["account"]), groups=pd.Index(pairs["fcpId"]))]
+    accounts = pd.Index(pairs["account"].unique())
+    rules = match_accounts(accounts=accounts, prefixes=mapping["prefix"])
+    rules = rules[rules >= 0]
+    rules = rules[mapping.loc[rules.to_numpy(), "param"].notna().to_numpy()]
+    leaves = pd.MultiIndex.from_frame(pairs)
+    rule = data["account"].map(rules).where(pd.MultiIndex.from_frame(data[["fcpId", "account"]]).isin(leaves))
+    matched = data[rule.notna()].assign(rule=rule.dropna().astype(int))
+    totals = []
+    for measure, group in mapping.loc[mapping.index.isin(rules)].groupby("measure"):
+        rows = matched[matched["rule"].isin(group.index)]
+        totals.append(rows.groupby(["fcpId", "rule"], observed=True)[measure].sum().rename("total"))
+    if not totals:
+        return pd.DataFrame(columns=["fcpId", "rule", "total"])
+    return pd.concat(totals).reset_index()
+
+
+def derive_params(
+        poa: pd.DataFrame | None = None,
+        balance: pd.DataFrame | None = None,
+        fcps: pd.DataFrame | None = None,
+        mapping: pd.DataFrame = ACCOUNT_PARAMS,
+        defaults: Dict[str, Any] = DEFAULT_PARAMS,
+        capacity_col: str | None = "fpcCurrentParticipants",
+        strict: bool = False
+) -> pd.DataFrame:
+    mapping = mapping.reset_index(drop=True)
+    sources = {"poa": poa, "balance": balance}
+    totals = pd.concat([
+        aggregate_source(data=data, mapping=mapping[mapping["source"] == source])
+        for source, data in sources.items() if data is not None
+    ] or [pd.DataFrame(columns=["fcpId", "rule", "total"])], ignore_index=True)
+    totals["fcpId"] = totals["fcpId"].astype(str)
+    totals = totals.join(mapping[["param", "scale", "per"]], on="rule")
+    totals["total"] = totals["total"].astype(float) * totals["scale"].astype(float)
+
+    fcp_ids = pd.Index(totals["fcpId"].unique(), name="fcpId")
+    if fcps is not None:
+        fcps = fcps.assign(fcpId=fcps["fcpId"].astype(str)).drop_duplicates("fcpId").set_index("fcpId")
+        fcp_ids = fcp_ids.union(fcps.index)
+        for per in totals["per"].dropna().unique():
+            divisor = totals["fcpId"].map(fcps[per].astype(float).replace(0.0, np.nan))
+            totals["total"] = totals["total"].where(totals["per"] != per, totals["total"] / divisor)
+    elif totals["per"].notna().any():
+        raise ValueError("FCP data is required to derive per-participant parameters")
+
+    totals = totals.dropna(subset=["total"])
+    mapped = set(mapping["param"].dropna())
+    unmatched = sorted(mapped - set(totals["param"]))
+    if unmatched and strict:
+        raise ValueError(f"Parameters {unmatched} matched no accounts")
+    derived = totals.pivot_table(index="fcpId", columns="param", values="total", aggfunc="sum")
+    for name in [name for name in DERIVED_PARAMS if name not in mapped and name in defaults]:
+        logger.warning(f"Parameter '{name}' has no account mapping, using default {defaults[name]}")
+    for name in unmatched:
+        logger.warning(f"Parameter '{name}' matched no accounts, using default {defaults[name]}")
+    for name in sorted(mapped - set(unmatched)):
+        missing = fcp_ids.difference(derived[name].dropna().index)
+        if len(missing):
+            logger.warning(
+                f"Parameter '{name}' could not be derived for {len(missing)} of {len(fcp_ids)} FCPs "
+                f"({', '.join(missing[:5])}{', ...' if len(missing) > 5 else ''}), using default {defaults[name]}"
+            )
+    params = pd.DataFrame(index=fcp_ids).join(derived)
+    for name, value in defaults.items():
+        params[name] = params[name].fillna(value) if name in params.columns else value
+    if fcps is not None and capacity_col is not None:
+        params["N_max"] = fcps[capacity_col].reindex(params.index).fillna(defaults["N_max"])
+    params["N_max"] = params["N_max"].astype(int)
+    return params[list(defaults)].sort_index()
@@ -0,0 +1,142 @@
+import pulp
+import numpy as np
+from typing import List, Dict, Any, Tuple
+
+SENSES: Dict[int, Tuple[float, float]] = {
+    pulp.LpConstraintLE: (-np.inf, 0.0),
+    pulp.LpConstraintEQ: (0.0, 0.0),
+    pulp.LpConstraintGE: (0.0, np.inf),
+}
+
+
+class MatrixModel:
+    def __init__(
+            self,
+            variables: List[str],
+            c: np.ndarray,
+            rows: np.ndarray,
+            cols: np.ndarray,
+            values: np.ndarray,
+            senses: np.ndarray,
+            b: np.ndarray,
+            lb: np.ndarray,
+            ub: np.ndarray,
+            integer: np.ndarray,
+            constraints: List[str],
+            sense: int = pulp.LpMinimize
+    ):
+        self.variables: List[str] = variables
+        self.c: np.ndarray = np.asarray(c, dtype=float)
+        self.rows: np.ndarray = np.asarray(rows, dtype=np.int64)
+        self.cols: np.ndarray = np.asarray(cols, dtype=np.int64)
+        self.values: np.ndarray = np.asarray(values, dtype=float)
+        self.senses: np.ndarray = np.asarray(senses, dtype=np.int64)
+        self.b: np.ndarray = np.asarray(b, dtype=float)
+        self.lb: np.ndarray = np.asarray(lb, dtype=float)
+        self.ub: np.ndarray = np.asarray(ub, dtype=float)
+        self.integer: np.ndarray = np.asarray(integer, dtype=bool)
+        self.constraints: List[str] = constraints
+        self.sense: int = sense
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.constraints), len(self.variables)
+
+    def dense(self) -> np.ndarray:
+        A = np.zeros(self.shape)
+        np.add.at(A, (self.rows, self.cols), self.values)
+        return A
+
+    def inequalities(self) -> Tuple[np.ndarray, np.ndarray]:
+        A = self.dense()
+        le = np.isin(self.senses, [pulp.LpConstraintLE, pulp.LpConstraintEQ])
+        ge = np.isin(self.senses, [pulp.LpConstraintGE, pulp.LpConstraintEQ])
+        return np.vstack([A[le], -A[ge]]), np.concatenate([self.b[le], -self.b[ge]])
+
+    def row_terms(self, variables: List[pulp.LpVariable]) -> List[List[Tuple[pulp.LpVariable, float]]]:
+        order = np.argsort(self.rows, kind="stable")
+        splits = np.searchsorted(self.rows[order], np.arange(1, len(self.constraints)))
+        cols = np.split(self.cols[order], splits)
+        values = np.split(self.values[order], splits)
+        return [
+            [(variables[j], value) for j, value in zip(row_cols.tolist(), row_values.tolist())]
+            for row_cols, row_values in zip(cols, values)
+        ]
+
+    def add_constraints(self, model: pulp.LpProblem, variables: List[pulp.LpVariable]) -> None:
+        for name, terms, sense, rhs in zip(self.constraints, self.row_terms(variables=variables), self.senses.tolist(), self.b.tolist()):
+            model.addConstraint(pulp.LpConstraint(e=pulp.LpAffineExpression(terms), sense=sense, name=name, rhs=rhs))
+
+    def to_pulp(self, name: str = "model") -> Tuple[pulp.LpProblem, Dict[str, pulp.LpVariable]]:
+        model = pulp.LpProblem(name=name, sense=self.sense)
+        variables = {
+            var: pulp.LpVariable(
+                name=var,
+                lowBound=None if np.isinf(lower) else lower,
+                upBound=None if np.isinf(upper) else upper,
+                cat=pulp.LpInteger if integer else pulp.LpContinuous
+            )
+            for var, lower, upper, integer in zip(self.variables, self.lb.tolist(), self.ub.tolist(), self.integer.tolist())
+        }
+        columns = list(variables.values())
+        model.setObjective(pulp.LpAffineExpression([(var, coef) for var, coef in zip(columns, self.c.tolist()) if coef != 0]))
+        self.add_constraints(model=model, variables=columns)
+        return model, variables
+
+    @classmethod
+    def from_pulp(cls, lp: pulp.LpProblem) -> "MatrixModel":
+        variables = lp.variables()
+        index = {var.name: j for j, var in enumerate(variables)}
+        rows, cols, values, senses, b = [], [], [], [], []
+        for i, constraint in enumerate(lp.constraints.values()):
+            for var, coef in constraint.items():
+                rows.append(i)
+                cols.append(index[var.name])
+                values.append(coef)
+            senses.append(constraint.sense)
+            b.append(-constraint.constant)
+        c = np.zeros(len(variables))
+        for var, coef in lp.objective.items():
+            c[index[var.name]] = coef
+        return cls(
+            variables=[var.name for var in variables],
+            c=c,
+            rows=np.array(rows, dtype=np.int64),
+            cols=np.array(cols, dtype=np.int64),
+            values=np.array(values, dtype=float),
+            senses=np.array(senses, dtype=np.int64),
+            b=np.array(b, dtype=float),
+            lb=np.array([-np.inf if var.lowBound is None else var.lowBound for var in variables], dtype=float),
+            ub=np.array([np.inf if var.upBound is None else var.upBound for var in variables], dtype=float),
+            integer=np.array([var.cat == pulp.LpInteger for var in variables], dtype=bool),
+            constraints=list(lp.constraints),
+            sense=lp.sense
+        )
+
+    def solve_highs(self, time_limit: float | None = None, gap: float | None = None) -> Dict[str, Any]:
+        try:
+            from scipy.optimize import milp, LinearConstraint, Bounds
+            from scipy.sparse import coo_array
+        except ImportError as e:
+            raise ImportError("MatrixModel.solve_highs requires scipy (pip install scipy)") from e
+        A = coo_array((self.values, (self.rows, self.cols)), shape=self.shape).tocsr()
+        offsets = np.array([SENSES[sense] for sense in self.senses.tolist()]).reshape(-1, 2)
+        options = {"disp": False}
+        if time_limit is not None:
+            options["time_limit"] = time_limit
+        if gap is not None:
+            options["mip_rel_gap"] = gap
+        sign = -1.0 if self.sense == pulp.LpMaximize else 1.0
+        result = milp(
+            c=sign * self.c,
+            constraints=LinearConstraint(A, self.b + offsets[:, 0], self.b + offsets[:, 1]),
+            integrality=self.integer.astype(int),
+            bounds=Bounds(self.lb, self.ub),
+            options=options
+        )
+        status = {0: "Optimal", 1: "Not Solved", 2: "Infeasible", 3: "Unbounded"}.get(result.status, "Undefined")
+        return {
+            "status": status,
+            "x": dict(zip(self.variables, result.x.tolist())) if result.x is not None else None,
+            "objective": None if result.fun is None else sign * result.fun
+        }
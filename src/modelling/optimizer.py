@@ -1,6 +1,43 @@
 import pulp
+import numpy as np
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import List, Dict, Any, Tuple
+from .matrix import MatrixModel
+from .solvers import SolverConfig, SolveStats, solve_model
+
+VARIABLES: List[str] = ["x1", "x2", "t1", "t2"]
+
+
+def budget_constraint_rows(params: Dict[str, np.ndarray]) -> Dict[str, Tuple[Dict[str, np.ndarray], int, np.ndarray]]:
+    income = params["I"] + params["E"]
+    fixed = (
+        params["doctor"] + params["G"] + params["med_remb"] + params["V"] +
+        params["director"] + params["accountant"] + params["secretary"] + params["additional"]
+    )
+    kratio = params["kids_ratio"]
+    zero, one = np.zeros_like(income), np.ones_like(income)
+    le, ge = pulp.LpConstraintLE, pulp.LpConstraintGE
+    return {
+        "R1": (
+            {"x1": params["C1"] - income, "x2": params["C2"] - income, "t1": params["D1"], "t2": params["D2"], "y": fixed},
+            le,
+            zero
+        ),
+        "R2": ({"x1": one, "x2": one, "y": -params["N_max"]}, le, zero),
+        "R3": ({"x1": one, "y": -one}, ge, zero),
+        "R4": ({"x2": one, "y": -one}, ge, zero),
+        "R5": ({"x1": 1 - kratio, "x2": -kratio}, le, zero),
+        "R9": ({"x1": one, "t1": -30 * one}, le, zero),
+        "R10": ({"x2": one, "t1": -30 * one, "t2": -100 * one}, le, zero),
+        "R11": ({"t1": one}, ge, zero),
+        "R12": ({"t2": one}, ge, zero),
+        "R13": (
+            {"x1": (1.5 * 2 * 10) * one, "x2": 1.5 * one, "t1": (2 * 10 + 2 * 2 + 2 * 44 + 2 * 2 + 2 * 44 - 0.8 * 1920) * one},
+            le,
+            zero
+        ),
+        "R14": ({"x2": 1.5 * one, "t2": (2 * 44 + 2 * 2 + 2 * 44 - 0.8 * 1920) * one}, le, zero),
+    }
 
 
 class LpOptimizer(ABC):
@@ -13,6 +50,7 @@ class LpOptimizer(ABC):
         self.model = model
         self.variables = variables
         self.params = params
+        self.stats: SolveStats | None = None
 
     @abstractmethod
     def set_objective(self) -> None:
@@ -22,9 +60,9 @@ class LpOptimizer(ABC):
     def add_constraints(self) -> None:
         pass
 
-    @abstractmethod
-    def solve(self) -> None:
-        pass
+    def solve(self, solver: pulp.LpSolver | None = None, config: SolverConfig | None = None) -> SolveStats:
+        self.stats = solve_model(model=self.model, solver=solver, config=config)
+        return self.stats
 
 
 class BudgetLpOptimizer(LpOptimizer):
@@ -37,51 +75,83 @@ class BudgetLpOptimizer(LpOptimizer):
         super().__init__(model=model, variables=variables, params=params)
 
     def set_objective(self) -> None:
-        x1 = self.variables["x1"]
-        x2 = self.variables["x2"]
-        t1 = self.variables["t1"]
-        t2 = self.variables["t2"]
-        obj_func = (x1 + x2) + (t1 + t2)
-        self.model.setObjective(obj_func)
+        self.model.setObjective(pulp.LpAffineExpression([(self.variables[var], 1) for var in VARIABLES]))
 
     def add_constraints(self) -> None:
-        x1 = self.variables["x1"]
-        x2 = self.variables["x2"]
-        c1 = self.params["C1"]
-        c2 = self.params["C2"]
-        d1 = self.params["D1"]
-        d2 = self.params["D2"]
-        t1 = self.variables["t1"]
-        t2 = self.variables["t2"]
-        G = self.params["G"]
-        med_remb = self.params["med_remb"]
-        E = self.params["E"]
-        V = self.params["V"]
-        I = self.params["I"]
-        n_max = self.params["N_max"]
-        kratio = self.params["kids_ratio"]
-
-        doctor = self.params["doctor"]
-        director = self.params["director"]
-        accountant = self.params["accountant"]
-        secretary = self.params["secretary"]
-        additional = self.params["additional"]
-        crew = director + accountant + secretary + additional
-
-        R1 = (c1 * x1 + c2 * x2) + (d1 * t1) + (d2 * t2) + doctor + G + med_remb + V + crew <= (I + E) * (x1 + x2)
-        R2 = x1 + x2 <= n_max
-        R3 = x1 >= 1
-        R4 = x2 >= 1
-        R5 = x1 <= (kratio) * (x1 + x2)
-        R9 = x1 <= (30 * t1)
-        R10 = x2 <= ((100 * t2) + (30 * t1))
-        R11 = t1 >= 0
-        R12 = t2 >= 0
-        R13 = (x1 * 1.5 * 2 * 10) + (t1 * 2 * 10) + (t1 * 2 * 2) + (t1 * 2 * 44) + (t1 * 2 * 2) + (x2 * 1.5) + (2 * t1 * 44) <= 0.8 * (t1 * 1920)
-        R14 = (t2 * 2 * 44) + (t2 * 2 * 2) + (x2 * 1.5) + (2 * t2 * 44) <= 0.8 * (t2 * 1920)
-
-        for const in [R1, R2, R3, R4, R5, R9, R10, R11, R12, R13, R14]:
-            self.model.addConstraint(constraint=const)
-
-    def solve(self) -> None:
-        self.model.solve()
+        matrix = self.to_matrix(params=self.params)
+        matrix.add_constraints(model=self.model, variables=[self.variables[var] for var in matrix.variables])
+
+    @staticmethod
+    def to_matrix(params: Dict[str, Any]) -> MatrixModel:
+        rows, cols, values, senses, b = [], [], [], [], []
+        families = budget_constraint_rows(params={key: np.array([value], dtype=float) for key, value in params.items()})
+        for i, (coefficients, sense, rhs) in enumerate(families.values()):
+            for var, coef in coefficients.items():
+                if var == "y":
+                    rhs = rhs - coef
+                    continue
+                rows.append(i)
+                cols.append(VARIABLES.index(var))
+                values.append(coef[0])
+            senses.append(sense)
+            b.append(rhs[0])
+        return MatrixModel(
+            variables=VARIABLES,
+            c=np.ones(len(VARIABLES)),
+            rows=np.array(rows),
+            cols=np.array(cols),
+            values=np.array(values),
+            senses=np.array(senses),
+            b=np.array(b),
+            lb=np.zeros(len(VARIABLES)),
+            ub=np.full(len(VARIABLES), np.inf),
+            integer=np.ones(len(VARIABLES), dtype=bool),
+            constraints=list(families),
+            sense=pulp.LpMinimize
+        )
+
+    def set_constraint(self, name: str, coefficients: Dict[str, float], rhs: float) -> None:
+        constraint = self.model.constraints[name]
+        for var, coef in coefficients.items():
+            constraint.expr[self.variables[var]] = coef
+        constraint.expr.constant = -rhs
+        constraint.changeRHS(rhs)
+
+    def update_params(self, params: Dict[str, Any]) -> None:
+        self.params = params
+        matrix = self.to_matrix(params=params)
+        rows = zip(matrix.constraints, matrix.row_terms(variables=matrix.variables), matrix.b.tolist())
+        for name, terms, rhs in rows:
+            self.set_constraint(name=name, coefficients=dict(terms), rhs=rhs)
+
+    def get_results(self) -> Dict[str, Any]:
+        params = self.params
+        results = {
+            "status": pulp.LpStatus[self.model.status],
+            "n1": pulp.value(self.variables["x1"]),
+            "n2": pulp.value(self.variables["x2"]),
+            "t1": pulp.value(self.variables["t1"]),
+            "t2": pulp.value(self.variables["t2"]),
+        }
+
+        if results["status"] == "Optimal":
+            results["total_kids"] = results["n1"] + results["n2"]
+            results["expenses"] = ((params["C1"] * results["n1"] + params["C2"] * results["n2"]) +
+                                   (params["D1"] * results["t1"]) + (params["D2"] * results["t2"]) +
+                                   params["G"] + params["med_remb"] + params["V"] +
+                                   params["director"] + params["accountant"] +
+                                   params["secretary"] + params["additional"] + params["doctor"])
+            results["budget"] = (params["I"] + params["E"]) * results["total_kids"]
+
+        return results
+
+    @classmethod
+    def build(cls, params: Dict[str, Any], name: str = "compassion") -> "BudgetLpOptimizer":
+        model = pulp.LpProblem(name=name, sense=pulp.LpMinimize)
+        variables = {
+            var: pulp.LpVariable(name=var, lowBound=0, cat="Integer") for var in VARIABLES
+        }
+        optimizer = cls(model=model, variables=variables, params=params)
+        optimizer.set_objective()
+        optimizer.add_constraints()
+        return optimizer
@@ -0,0 +1,35 @@
+from typing import Dict, Any
+
+DEFAULT_PARAMS: Dict[str, float] = {
+    "C1": 25.00,
+    "C2": 99.00,
+    "D1": 7735.32,
+    "D2": 7735.32,
+    "I": 20.5 * 12,
+    "E": 0.00,
+    "N_max": 1000,
+    "kids_ratio": 0.12,
+    "G": 3012.26,
+    "med_remb": 500.00,
+    "V": 1000.00,
+    "doctor": 4741.56,
+    "director": 7735.32,
+    "accountant": 200.0 * 12,
+    "secretary": 4741.56,
+    "additional": 0.00
+}
+
+
+def parse_params(values: Dict[str, Any]) -> Dict[str, float]:
+    params = dict(DEFAULT_PARAMS)
+    for name, value in values.items():
+        if name not in DEFAULT_PARAMS or value is None or value == "":
+            continue
+        try:
+            params[name] = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Parameter '{name}' must be numeric, got {value!r}")
+    if not 0 <= params["kids_ratio"] <= 1:
+        raise ValueError(f"Parameter 'kids_ratio' must be between 0 and 1, got {params['kids_ratio']}")
+    params["N_max"] = int(params["N_max"])
+    return params
@@ -0,0 +1,274 @@
+import pulp
+import numpy as np
+import pandas as pd
+from dataclasses import replace
+from typing import List, Dict, Any, Tuple
+from .matrix import MatrixModel
+from .optimizer import LpOptimizer, budget_constraint_rows
+from .solvers import SolverConfig, SolveStats
+
+VARIABLES: List[str] = ["x1", "x2", "t1", "t2", "y"]
+
+
+class PortfolioLpOptimizer(LpOptimizer):
+    def __init__(
+            self,
+            model: pulp.LpProblem,
+            variables: Dict[str, pulp.LpVariable],
+            params: Dict[str, Any],
+            fcps: pd.DataFrame,
+            budget: float | None = None,
+            region_caps: Dict[str, float] | None = None,
+            capacity_col: str = "fpcCurrentParticipants",
+            region_col: str = "fcpState"
+    ):
+        super().__init__(model=model, variables=variables, params=params)
+        self.fcps: pd.DataFrame = fcps.reset_index(drop=True)
+        self.budget: float | None = budget
+        self.region_caps: Dict[str, float] = region_caps or {}
+        self.capacity_col: str = capacity_col
+        self.region_col: str = region_col
+        self.fcp_ids: List[str] = self.fcps["fcpId"].astype(str).tolist()
+        self.matrix: Dict[str, np.ndarray] = {
+            key: self.fcps[key].to_numpy(dtype=float) if key in self.fcps.columns else np.full(len(self.fcps), float(value))
+            for key, value in params.items()
+        }
+        self.matrix["N_max"] = self.fcps[capacity_col].to_numpy(dtype=float)
+        self.columns: Dict[str, List[pulp.LpVariable]] = {
+            var: [variables[f"{var}_{fcp_id}"] for fcp_id in self.fcp_ids] for var in VARIABLES
+        }
+
+    def objective(self) -> Dict[str, np.ndarray]:
+        n = len(self.fcp_ids)
+        if self.model.sense != pulp.LpMaximize:
+            return {var: np.ones(n) if var != "y" else np.zeros(n) for var in VARIABLES}
+        return {var: np.ones(n) if var in ("x1", "x2") else np.zeros(n) for var in VARIABLES}
+
+    def set_objective(self) -> None:
+        objective = self.objective()
+        terms = [(var, coef) for name in VARIABLES for var, coef in zip(self.columns[name], objective[name].tolist()) if coef != 0]
+        self.model.setObjective(pulp.LpAffineExpression(terms))
+
+    def to_matrix(self) -> MatrixModel:
+        n = len(self.fcp_ids)
+        index = np.arange(n)
+        offsets = {var: k * n for k, var in enumerate(VARIABLES)}
+        rows, cols, values, senses, b, names = [], [], [], [], [], []
+        for name, (coefficients, sense, rhs) in budget_constraint_rows(params=self.matrix).items():
+            for var, coef in coefficients.items():
+                rows.append(len(names) + index)
+                cols.append(offsets[var] + index)
+                values.append(coef)
+            senses.append(np.full(n, sense))
+            b.append(rhs)
+            names.extend(f"{name}_{fcp_id}" for fcp_id in self.fcp_ids)
+
+        groups = {"budget": (index, self.budget)} if self.budget is not None else {}
+        if self.region_caps:
+            regions = self.fcps[self.region_col].astype(str)
+            for region, members in regions.groupby(regions).indices.items():
+                if region in self.region_caps:
+                    groups[f"region_{region}"] = (members, self.region_caps[region])
+        for name, (members, cap) in groups.items():
+            for var in ["x1", "x2"]:
+                rows.append(np.full(len(members), len(names)))
+                cols.append(offsets[var] + members)
+                values.append(self.matrix["I"][members])
+            senses.append(np.array([pulp.LpConstraintLE]))
+            b.append(np.array([cap], dtype=float))
+            names.append(name)
+
+        variables = list(self.variables.values())
+        return MatrixModel(
+            variables=[var.name for var in variables],
+            c=np.concatenate([self.objective()[var] for var in VARIABLES]),
+            rows=np.concatenate(rows),
+            cols=np.concatenate(cols),
+            values=np.concatenate(values),
+            senses=np.concatenate(senses),
+            b=np.concatenate(b),
+            lb=np.array([var.lowBound for var in variables], dtype=float),
+            ub=np.array([np.inf if var.upBound is None else var.upBound for var in variables], dtype=float),
+            integer=np.ones(len(variables), dtype=bool),
+            constraints=names,
+            sense=self.model.sense
+        )
+
+    def add_constraints(self) -> None:
+        self.to_matrix().add_constraints(model=self.model, variables=list(self.variables.values()))
+
+    def minimize_tutors(self) -> None:
+        values = {name: np.array([var.varValue or 0.0 for var in self.columns[name]]) for name in VARIABLES}
+        zero = np.zeros(len(self.fcp_ids))
+        upper = values["t1"] + values["t2"]
+        t1 = np.tile(np.arange(int(upper.max(initial=0)) + 1, dtype=float), (len(upper), 1))
+        feasible = t1 <= upper[:, None]
+        rows = budget_constraint_rows(params=self.matrix).values()
+        bounds = []
+        for coefficients, sense, rhs in rows:
+            sign = 1.0 if sense == pulp.LpConstraintLE else -1.0
+            fixed = sum((coefficients[var] * values[var] for var in ("x1", "x2", "y") if var in coefficients), zero)
+            slack = sign * (rhs - fixed)[:, None] - sign * coefficients.get("t1", zero)[:, None] * t1
+            bounds.append((sign * coefficients.get("t2", zero)[:, None], slack))
+        t2 = np.zeros_like(t1)
+        for coef, slack in bounds:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                t2 = np.where(coef < 0, np.fmax(t2, np.ceil(slack / coef - 1e-9)), t2)
+        for coef, slack in bounds:
+            feasible &= coef * t2 <= slack + 1e-9
+        total = np.where(feasible, t1 + t2, np.inf)
+        best = total.argmin(axis=1)
+        improved = np.isfinite(total[np.arange(len(best)), best])
+        for i in np.flatnonzero(improved):
+            self.columns["t1"][i].varValue = float(t1[i, best[i]])
+            self.columns["t2"][i].varValue = float(t2[i, best[i]])
+
+    def solve_fcp(self, i: int, capacity: int, sense: int = pulp.LpMaximize) -> Dict[str, float] | None:
+        fcps = self.fcps.iloc[[i]].assign(**{self.capacity_col: capacity})
+        single = PortfolioLpOptimizer.build(
+            fcps=fcps,
+            params=self.params,
+            capacity_col=self.capacity_col,
+            region_col=self.region_col,
+            allow_closing=False,
+            sense=sense
+        )
+        single.solve(solver=SolverConfig(backend="enum").build(), warm_start=False)
+        if single.model.sol_status != pulp.LpSolutionOptimal:
+            return None
+        return {var: single.columns[var][0].varValue for var in VARIABLES}
+
+    def initial_solution(self) -> Dict[str, np.ndarray]:
+        n = len(self.fcp_ids)
+        solution = {var: np.zeros(n) for var in VARIABLES}
+        regions = self.fcps[self.region_col].astype(str).tolist() if self.region_caps else [None] * n
+        remaining = {None: np.inf if self.budget is None else self.budget, **self.region_caps}
+        funding = self.matrix["I"]
+        solved: Dict[Tuple[Any, ...], Dict[str, float] | None] = {}
+
+        def solve_fcp(i: int, capacity: int, sense: int = pulp.LpMaximize) -> Dict[str, float] | None:
+            key = (capacity, sense) + tuple(float(values[i]) for name, values in self.matrix.items() if name != "N_max")
+            if key not in solved:
+                solved[key] = self.solve_fcp(i=i, capacity=capacity, sense=sense)
+            return solved[key]
+
+        def scopes(i: int) -> List[str | None]:
+            return [None] + ([regions[i]] if regions[i] in remaining else [])
+
+        def room(i: int) -> float:
+            return min(remaining[scope] for scope in scopes(i)) / funding[i] if funding[i] > 0 else np.inf
+
+        def assign(i: int, capacity: float) -> None:
+            chosen = solve_fcp(i=i, capacity=int(capacity)) or dict.fromkeys(VARIABLES, 0.0)
+            for scope in scopes(i):
+                remaining[scope] += funding[i] * (solution["x1"][i] + solution["x2"][i] - chosen["x1"] - chosen["x2"])
+            for var, value in chosen.items():
+                solution[var][i] = value
+
+        order = np.argsort(-self.matrix["N_max"], kind="stable").tolist()
+        minimum = np.full(n, np.inf)
+        for i in order:
+            smallest = solve_fcp(i=i, capacity=int(self.matrix["N_max"][i]), sense=pulp.LpMinimize)
+            if smallest is not None:
+                minimum[i] = smallest["x1"] + smallest["x2"]
+            if min(self.matrix["N_max"][i], np.floor(room(i))) >= minimum[i]:
+                assign(i=i, capacity=min(self.matrix["N_max"][i], np.floor(room(i))))
+
+        for j in order:
+            if solution["y"][j] or minimum[j] > self.matrix["N_max"][j] or room(j) < 1:
+                continue
+            short = [scope for scope in scopes(j) if remaining[scope] < funding[j] * minimum[j]]
+            donors = [i for i in order if solution["y"][i] and all(scope in scopes(i) for scope in short)]
+            need = minimum[j] - np.floor(room(j))
+            spare = sum(solution["x1"][i] + solution["x2"][i] - minimum[i] for i in donors)
+            if spare < need:
+                continue
+            for i in donors:
+                if room(j) >= minimum[j]:
+                    break
+                kids = solution["x1"][i] + solution["x2"][i]
+                assign(i=i, capacity=max(minimum[i], kids - (minimum[j] - np.floor(room(j)))))
+            if room(j) >= minimum[j]:
+                assign(i=j, capacity=min(self.matrix["N_max"][j], np.floor(room(j))))
+        return solution
+
+    def solve(
+            self,
+            solver: pulp.LpSolver | None = None,
+            config: SolverConfig | None = None,
+            warm_start: bool = True
+    ) -> SolveStats:
+        config = config or SolverConfig()
+        if warm_start and self.model.sense == pulp.LpMaximize and (solver is not None or config.supports("warm_start")):
+            for var, values in self.initial_solution().items():
+                for column, value in zip(self.columns[var], values.tolist()):
+                    column.setInitialValue(value)
+            if solver is None:
+                config = replace(config, warm_start=True)
+            # CBC scores a MIP start with the wrong sign under -max, so hand it the equivalent minimisation
+            objective = self.model.objective
+            self.model.sense, self.model.objective = pulp.LpMinimize, -objective
+            try:
+                stats = super().solve(solver=solver, config=config)
+            finally:
+                self.model.sense, self.model.objective = pulp.LpMaximize, objective
+            self.stats = stats = replace(stats, objective=pulp.value(objective))
+        else:
+            stats = super().solve(solver=solver, config=config)
+        if self.model.sol_status in (pulp.LpSolutionOptimal, pulp.LpSolutionIntegerFeasible):
+            self.minimize_tutors()
+        return stats
+
+    def get_results(self) -> pd.DataFrame:
+        status = pulp.LpStatus[self.model.status]
+        results = pd.DataFrame({"fcpId": self.fcp_ids, "status": status})
+        for var, name in zip(VARIABLES, ["n1", "n2", "t1", "t2", "open"]):
+            results[name] = [var.varValue for var in self.columns[var]]
+        if status == "Optimal":
+            p = self.matrix
+            results["total_kids"] = results["n1"] + results["n2"]
+            results["expenses"] = (
+                p["C1"] * results["n1"] + p["C2"] * results["n2"] + p["D1"] * results["t1"] + p["D2"] * results["t2"] +
+                p["G"] + p["med_remb"] + p["V"] + p["director"] + p["accountant"] + p["secretary"] + p["additional"] +
+                p["doctor"]
+            ) * results["open"]
+            results["budget"] = (p["I"] + p["E"]) * results["total_kids"]
+            results["funding"] = p["I"] * results["total_kids"]
+        return results
+
+    @classmethod
+    def build(
+            cls,
+            fcps: pd.DataFrame,
+            params: Dict[str, Any],
+            budget: float | None = None,
+            region_caps: Dict[str, float] | None = None,
+            capacity_col: str = "fpcCurrentParticipants",
+            region_col: str = "fcpState",
+            allow_closing: bool = True,
+            sense: int = pulp.LpMaximize,
+            name: str = "compassion_portfolio"
+    ) -> "PortfolioLpOptimizer":
+        model = pulp.LpProblem(name=name, sense=sense)
+        fcp_ids = fcps["fcpId"].astype(str).tolist()
+        variables = {
+            f"{var}_{fcp_id}": pulp.LpVariable(name=f"{var}_{fcp_id}", lowBound=0, cat="Integer")
+            for var in VARIABLES[:-1] for fcp_id in fcp_ids
+        }
+        variables.update({
+            f"y_{fcp_id}": pulp.LpVariable(name=f"y_{fcp_id}", lowBound=0 if allow_closing else 1, upBound=1, cat="Integer")
+            for fcp_id in fcp_ids
+        })
+        optimizer = cls(
+            model=model,
+            variables=variables,
+            params=params,
+            fcps=fcps,
+            budget=budget,
+            region_caps=region_caps,
+            capacity_col=capacity_col,
+            region_col=region_col
+        )
+        optimizer.set_objective()
+        optimizer.add_constraints()
+        return optimizer
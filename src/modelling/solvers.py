@@ -0,0 +1,503 @@
+import os
+import re
+import math
+import time
+import tempfile
+import contextlib
+from fractions import Fraction
+import pulp
+import numpy as np
+from dataclasses import dataclass, asdict, replace
+from typing import List, Dict, Any, Tuple
+from config import logger
+from .matrix import MatrixModel
+
+BACKENDS = ("cbc", "highs", "glpk", "enum")
+ROLES: Tuple[str, ...] = ("x1", "x2", "t1", "t2")
+UNSUPPORTED_OPTIONS: Dict[str, Tuple[str, ...]] = {"glpk": ("threads", "warm_start")}
+
+
+class SearchSpaceError(pulp.PulpSolverError):
+    pass
+
+
+class EnumerationSolver(pulp.LpSolver):
+    name = "ENUMERATION"
+
+    def __init__(
+            self,
+            max_points: int = 100_000,
+            chunk_size: int = 4096,
+            max_rounds: int = 10,
+            grid_size: int = 64,
+            tol: float = 1e-7,
+            fallback: pulp.LpSolver | None = None,
+            **kwargs
+    ):
+        super().__init__(msg=False, **kwargs)
+        self.fallback: pulp.LpSolver = fallback if fallback is not None else pulp.PULP_CBC_CMD(msg=False)
+        self.max_points: int = max_points
+        self.chunk_size: int = chunk_size
+        self.max_rounds: int = max_rounds
+        self.grid_size: int = grid_size
+        self.tol: float = tol
+        self.nodes: int | None = 0
+
+    def available(self) -> bool:
+        return True
+
+    @staticmethod
+    def to_matrix(lp: pulp.LpProblem) -> Tuple[List[pulp.LpVariable], np.ndarray, np.ndarray, np.ndarray]:
+        matrix = MatrixModel.from_pulp(lp=lp)
+        A, b = matrix.inequalities()
+        c = -matrix.c if lp.sense == pulp.LpMaximize else matrix.c
+        return lp.variables(), A, b, c
+
+    def tighten_bounds(
+            self,
+            A: np.ndarray,
+            b: np.ndarray,
+            lb: np.ndarray,
+            ub: np.ndarray,
+            rounds: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        positive, negative = A > 0, A < 0
+        with np.errstate(divide="ignore"):
+            inverse = np.where(A != 0, 1 / A, 0.0)
+        for _ in range(rounds):
+            with np.errstate(invalid="ignore"):
+                activity = (np.where(positive, A * lb[:, None, :], 0.0) + np.where(negative, A * ub[:, None, :], 0.0)).sum(axis=2)
+                bound = (b - activity)[:, :, None] * inverse
+                new_ub = np.fmin(ub, np.floor(np.where(positive, bound, np.inf).min(axis=1) + lb + self.tol))
+                new_lb = np.fmax(lb, np.ceil(np.where(negative, bound, -np.inf).max(axis=1) + ub - self.tol))
+            if np.array_equal(new_lb, lb) and np.array_equal(new_ub, ub):
+                break
+            lb, ub = new_lb, new_ub
+        return lb, ub
+
+    @staticmethod
+    def fit(
+            variables: List[pulp.LpVariable],
+            A: np.ndarray,
+            b: np.ndarray,
+            c: np.ndarray
+    ) -> Tuple[List[int], np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        # Columns come back as x1, x2, t1, t2 with any fixed variable (the portfolio's y) folded into b
+        lb = np.array([-np.inf if var.lowBound is None else math.ceil(var.lowBound) for var in variables], dtype=float)
+        ub = np.array([np.inf if var.upBound is None else math.floor(var.upBound) for var in variables], dtype=float)
+        roles = [var.name.split("_")[0] for var in variables]
+        order = [roles.index(role) for role in ROLES if roles.count(role) == 1]
+        others = [j for j in range(len(variables)) if j not in order]
+        if any(var.cat != pulp.LpInteger for var in variables):
+            raise SearchSpaceError("EnumerationSolver only supports pure integer models")
+        if len(order) != len(ROLES) or (lb[others] != ub[others]).any() or (lb[order] < 0).any():
+            raise SearchSpaceError(f"EnumerationSolver only supports models over {ROLES}")
+        if np.isfinite(ub[order[2:]]).any() or abs(c[order[0]] - c[order[1]]) > 0 or (c[order[2:]] < 0).any():
+            raise SearchSpaceError("EnumerationSolver needs unbounded tutors, one weight for kids and non-negative tutor weights")
+        return order, A[:, order], b - A[:, others] @ lb[others], c[order], lb[order], ub[order]
+
+    def exchange(self, A: np.ndarray, c: np.ndarray, lb: np.ndarray, ub: np.ndarray) -> Tuple[str, int, np.ndarray]:
+        # Rows on tutors are either lower bounds on t1, on t2, one shared bound on both, or costs on both. When
+        # P t1 cover what Q t2 cover and every cost prefers one side of that swap, the optimum keeps the other
+        # tutor within one swap of its own lower bound; otherwise t1 ranges over its whole tightened bounds.
+        tutors = A[:, 2:]
+        couple = (tutors < 0).all(axis=1)
+        if ((tutors < 0).any(axis=1) & (tutors > 0).any(axis=1)).any() or couple.sum() > 1:
+            raise SearchSpaceError("EnumerationSolver needs tutor rows that either cover kids or cost budget")
+        if not couple.any():
+            return "t1", 1, couple
+        a1, a2 = -tutors[couple][0]
+        ratio = Fraction(a1 / a2).limit_denominator(1000)
+        if abs(float(ratio) - a1 / a2) > self.tol:
+            raise SearchSpaceError("EnumerationSolver needs commensurable tutor capacities")
+        swap, back = ratio.denominator, ratio.numerator
+        costs = np.vstack([c[2:], tutors[(tutors > 0).any(axis=1)]])
+        delta = back * costs[:, 1] - swap * costs[:, 0]
+        if (delta <= self.tol).all():
+            return "t1", swap, couple
+        if (delta >= -self.tol).all():
+            return "t2", back, couple
+        if ub[2] - lb[2] >= self.grid_size:
+            raise SearchSpaceError("EnumerationSolver found tutor costs that disagree on which tutor is cheaper")
+        return "t1", int(ub[2] - lb[2]) + 1, couple
+
+    def staffing(
+            self,
+            kids: np.ndarray,
+            A: np.ndarray,
+            b: np.ndarray,
+            lb: np.ndarray,
+            family: str,
+            couple: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        residual = b - kids @ A[:, :2].T
+        first, second = (2, 3) if family == "t1" else (3, 2)
+        own = np.flatnonzero((A[:, first] < 0) & (A[:, second] == 0))
+        other = np.flatnonzero((A[:, second] < 0) & (A[:, first] == 0))
+        start = np.fmax(lb[first], np.max(np.ceil(residual[:, own] / A[own, first] - self.tol), axis=1, initial=-np.inf))
+        rest = np.fmax(lb[second], np.max(np.ceil(residual[:, other] / A[other, second] - self.tol), axis=1, initial=-np.inf))
+        return residual, start, rest
+
+    def pieces(
+            self,
+            kids: np.ndarray,
+            residual: np.ndarray,
+            start: np.ndarray,
+            rest: np.ndarray,
+            A: np.ndarray,
+            family: str,
+            couple: np.ndarray
+    ) -> np.ndarray:
+        # For a fixed n the candidate staffing only changes when start, rest or the shared row's residual crosses
+        # a step, so along x1 the cells form runs with the same tutors. Kids cost the same objective within a
+        # run and the budget moves linearly, so only the run end with the most slack can win.
+        first, second = (2, 3) if family == "t1" else (3, 2)
+        costs = (A[:, 2:] > 0).any(axis=1)
+        slope = A[costs, 0] - A[costs, 1]
+        if not ((slope >= 0).all() or (slope <= 0).all()):
+            return np.ones(len(kids), dtype=bool)
+        signature = [kids.sum(axis=1), start, rest]
+        if couple.any():
+            row = np.flatnonzero(couple)[0]
+            steps = Fraction(A[row, first] / A[row, second]).limit_denominator(1000).denominator
+            signature.append(np.ceil(residual[:, row] * steps / A[row, second] - self.tol))
+        change = (np.diff(np.column_stack(signature), axis=0) != 0).any(axis=1)
+        if (slope >= 0).all():
+            return np.r_[True, change]
+        return np.r_[change, True]
+
+    def cheapest(
+            self,
+            residual: np.ndarray,
+            start: np.ndarray,
+            rest: np.ndarray,
+            A: np.ndarray,
+            weights: np.ndarray,
+            family: str,
+            couple: np.ndarray
+    ) -> np.ndarray:
+        # Lower bound on weights @ (t1, t2) over the continuous staffing region, attained at one of its two vertices
+        first, second = (2, 3) if family == "t1" else (3, 2)
+        vertices = [(start, rest)]
+        if couple.any():
+            row = np.flatnonzero(couple)[0]
+            vertices = [
+                (start, np.fmax(rest, (residual[:, row] - A[row, first] * start) / A[row, second])),
+                (np.fmax(start, (residual[:, row] - A[row, second] * rest) / A[row, first]), rest)
+            ]
+        return np.min([np.outer(t_first, weights[:, first - 2]) + np.outer(t_second, weights[:, second - 2]) for t_first, t_second in vertices], axis=0)
+
+    def tutors(
+            self,
+            kids: np.ndarray,
+            residual: np.ndarray,
+            start: np.ndarray,
+            rest: np.ndarray,
+            A: np.ndarray,
+            family: str,
+            width: int,
+            couple: np.ndarray
+    ) -> np.ndarray:
+        first, second = (2, 3) if family == "t1" else (3, 2)
+        fixed = start[:, None] + np.arange(width)
+        needed = rest[:, None]
+        if couple.any():
+            row = np.flatnonzero(couple)[0]
+            needed = np.fmax(needed, np.ceil((residual[:, row, None] - A[row, first] * fixed) / A[row, second] - self.tol))
+        points = np.empty((len(kids), width, 4))
+        points[:, :, :2] = kids[:, None, :]
+        points[:, :, first] = fixed
+        points[:, :, second] = needed
+        return points.reshape(-1, 4)
+
+    def envelope(self, A: np.ndarray, b: np.ndarray, couple: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Every row but the budget scales with the number of kids n, so with r = x1 / n a budget row reads
+        # n * psi(r) <= b, where psi is the per-kid budget use at the cheapest continuous staffing. Returns the
+        # r grid and, per budget row and grid cell, a lower bound on psi over that cell.
+        tutors, homogeneous = A[:, 2:], np.abs(b) <= self.tol
+        free = homogeneous & (tutors == 0).all(axis=1)
+        slope = A[free, 0] - A[free, 1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            limits = -A[free, 1] / slope
+        r_lo = max(0.0, np.max(limits[slope < 0], initial=0.0))
+        r_hi = min(1.0, np.min(limits[slope > 0], initial=1.0))
+        rows = np.flatnonzero((tutors >= 0).all(axis=1) & (tutors > 0).any(axis=1) & (b < -self.tol))
+        if r_lo > r_hi + self.tol:
+            return np.array([r_lo, r_lo]), np.full((len(rows), 1), np.inf), b[rows]
+        r = np.linspace(r_lo, max(r_lo, r_hi), self.grid_size if r_hi > r_lo else 2)
+        load = np.column_stack([r, 1 - r]) @ A[:, :2].T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            alpha = np.max(np.where(homogeneous & (tutors[:, 0] < 0) & (tutors[:, 1] == 0), load / -tutors[:, 0], 0.0), axis=1)
+            beta = np.max(np.where(homogeneous & (tutors[:, 1] < 0) & (tutors[:, 0] == 0), load / -tutors[:, 1], 0.0), axis=1)
+        vertices = [(alpha, beta)]
+        if couple.any() and homogeneous[couple][0]:
+            row = np.flatnonzero(couple)[0]
+            (a1, a2), gamma = -tutors[row], load[:, row]
+            vertices = [(alpha, np.fmax(beta, (gamma - a1 * alpha) / a2)), (np.fmax(alpha, (gamma - a2 * beta) / a1), beta)]
+        lower = np.empty((len(rows), len(r) - 1))
+        for k, row in enumerate(rows):
+            psi = load[:, row] + np.min([tutors[row, 0] * t1 + tutors[row, 1] * t2 for t1, t2 in vertices], axis=0)
+            lower[k] = self.convex_lower(r=r, f=psi)
+        return r, lower, b[rows]
+
+    @staticmethod
+    def convex_lower(r: np.ndarray, f: np.ndarray) -> np.ndarray:
+        # Lower bound per grid cell on a convex function sampled on the grid, extending the neighbouring secants
+        if len(r) < 3:
+            return np.minimum(f[:-1], f[1:])
+        slope = np.diff(f) / np.diff(r)
+        left_slope, right_slope = np.r_[-np.inf, slope[:-1]], np.r_[slope[1:], np.inf]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cross = (f[1:] - f[:-1] - right_slope * r[1:] + left_slope * r[:-1]) / (left_slope - right_slope)
+        cross = np.where(np.isfinite(cross), np.clip(cross, r[:-1], r[1:]), r[:-1])
+        lowest = np.full(len(r) - 1, np.inf)
+        for point in (r[:-1], r[1:], cross):
+            with np.errstate(invalid="ignore"):
+                left = np.where(np.isfinite(left_slope), f[:-1] + left_slope * (point - r[:-1]), -np.inf)
+                right = np.where(np.isfinite(right_slope), f[1:] + right_slope * (point - r[1:]), -np.inf)
+            lowest = np.fmin(lowest, np.fmax(left, right))
+        return lowest
+
+    def window(self, n: np.ndarray, r: np.ndarray, lower: np.ndarray, rhs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # Range of x1 / n that the budget rows leave open for each n, as the outermost grid cells that pass
+        ok = (n[:, None, None] * lower[None] <= rhs[None, :, None] + self.tol * np.maximum(1.0, np.abs(rhs))[None, :, None]).all(axis=1)
+        r_min = np.min(np.where(ok, r[:-1], np.inf), axis=1, initial=np.inf)
+        r_max = np.max(np.where(ok, r[1:], -np.inf), axis=1, initial=-np.inf)
+        return np.ceil(n * r_min - self.tol * n), np.floor(n * r_max + self.tol * n)
+
+    def kid_ranges(
+            self,
+            n: np.ndarray,
+            A: np.ndarray,
+            b: np.ndarray,
+            lb: np.ndarray,
+            ub: np.ndarray,
+            envelope: Tuple[np.ndarray, np.ndarray, np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        split_lo, split_hi = self.window(n, *envelope)
+        free = (A[:, 2:] == 0).all(axis=1)
+        slope = A[free, 0] - A[free, 1]
+        rhs = b[free] - A[free, 1] * n[:, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            limit = rhs / slope
+        lo = np.fmax(np.fmax(lb[0], n - ub[1]), np.ceil(np.max(np.where(slope < 0, limit, -np.inf), axis=1, initial=-np.inf) - self.tol))
+        hi = np.fmin(np.fmin(ub[0], n - lb[1]), np.floor(np.min(np.where(slope > 0, limit, np.inf), axis=1, initial=np.inf) + self.tol))
+        valid = (rhs[:, slope == 0] >= -self.tol).all(axis=1)
+        return np.fmax(lo, split_lo), np.where(valid, np.fmin(hi, split_hi), lo - 1)
+
+    def check_nodes(self) -> None:
+        if self.nodes > self.max_points:
+            raise SearchSpaceError(f"EnumerationSolver search space of {self.nodes} points exceeds {self.max_points}")
+
+    def scan(
+            self,
+            A: np.ndarray,
+            b: np.ndarray,
+            c: np.ndarray,
+            lb: np.ndarray,
+            ub: np.ndarray
+    ) -> np.ndarray | None:
+        family, width, couple = self.exchange(A=A, c=c, lb=lb, ub=ub)
+        envelope = r, lower, rhs = self.envelope(A=A, b=b, couple=couple)
+        n_lo, n_hi = lb[0] + lb[1], ub[0] + ub[1]
+        if len(rhs):
+            lowest = lower.min(axis=1)
+            n_lo = np.inf if (lowest >= -self.tol).any() else max(n_lo, np.ceil(np.max(rhs / lowest) - self.tol * max(1.0, n_lo)))
+        ascending = c[0] >= 0
+        if n_lo > n_hi or not np.isfinite(n_lo):
+            return None
+        if not ascending and not np.isfinite(n_hi):
+            raise SearchSpaceError("EnumerationSolver needs a finite capacity to maximise kids")
+
+        floor = float(c[2:] @ lb[2:])
+        costs = (A[:, 2:] > 0).any(axis=1)
+        weights = np.vstack([c[2:], A[costs, 2:]])
+        best_objective, best_point = np.inf, None
+        n, step = (n_lo, 1) if ascending else (n_hi, -1)
+        block = self.grid_size
+        while n_lo <= n <= n_hi and c[0] * n + floor < best_objective - self.tol:
+            ns = n + step * np.arange(block, dtype=float)
+            ns = ns[(ns >= n_lo) & (ns <= n_hi)]
+            lo, hi = self.kid_ranges(n=ns, A=A, b=b, lb=lb, ub=ub, envelope=envelope)
+            counts = np.maximum(hi - lo + 1, 0).astype(int)
+            total = int(counts.sum())
+            self.nodes += total
+            self.check_nodes()
+            if total:
+                x1 = np.repeat(lo, counts) + np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+                kids = np.column_stack([x1, np.repeat(ns, counts) - x1])
+                residual, start, rest = self.staffing(kids=kids, A=A, b=b, lb=lb, family=family, couple=couple)
+                runs = self.pieces(
+                    kids=kids, residual=residual, start=start, rest=rest, A=A, family=family, couple=couple
+                )
+                kids, residual, start, rest = kids[runs], residual[runs], start[runs], rest[runs]
+                lowest = self.cheapest(residual=residual, start=start, rest=rest, A=A, weights=weights, family=family, couple=couple)
+                bound = kids @ c[:2] + lowest[:, 0]
+                cells = np.flatnonzero((lowest[:, 1:] <= residual[:, costs] + self.tol).all(axis=1) & (bound < best_objective - self.tol))
+                cells = cells[np.argsort(bound[cells], kind="stable")]
+                # Cells go best bound first, so the incumbent from the first batch prunes most of the rest
+                batch = 16
+                while len(cells):
+                    chosen, cells = cells[:batch], cells[batch:]
+                    self.nodes += len(chosen) * width
+                    self.check_nodes()
+                    points = self.tutors(
+                        kids=kids[chosen], residual=residual[chosen], start=start[chosen], rest=rest[chosen], A=A,
+                        family=family, width=width, couple=couple
+                    )
+                    feasible = (points @ A[costs].T <= b[costs] + self.tol).all(axis=1) & (points <= ub).all(axis=1)
+                    objective = np.where(feasible, points @ c, np.inf)
+                    i = int(np.argmin(objective))
+                    if objective[i] < best_objective:
+                        best_objective, best_point = objective[i], points[i]
+                    cells = cells[bound[cells] < best_objective - self.tol]
+                    batch = max(1, self.chunk_size // width)
+            n += step * len(ns)
+            block = max(1, self.chunk_size // max(1, int(counts.max(initial=0))))
+        return best_point
+
+    def actualSolve(self, lp: pulp.LpProblem, **kwargs) -> int:
+        variables, A, b, c = self.to_matrix(lp=lp)
+        self.nodes = 0
+        try:
+            order, A, b, c, lb, ub = self.fit(variables=variables, A=A, b=b, c=c)
+            lb, ub = self.tighten_bounds(A=A, b=b, lb=lb[None, :], ub=ub[None, :], rounds=self.max_rounds)
+            lb, ub = lb[0], ub[0]
+            best_point = self.scan(A=A, b=b, c=c, lb=lb, ub=ub) if (lb <= ub).all() else None
+        except SearchSpaceError:
+            self.nodes = None
+            return self.fallback.actualSolve(lp, **kwargs)
+
+        if best_point is None:
+            lp.assignStatus(pulp.LpStatusInfeasible, pulp.LpSolutionInfeasible)
+            return lp.status
+        for var in variables:
+            var.varValue = var.lowBound
+        for j, value in zip(order, best_point.tolist()):
+            variables[j].varValue = float(value)
+        lp.assignStatus(pulp.LpStatusOptimal, pulp.LpSolutionOptimal)
+        return lp.status
+
+
+@dataclass
+class SolverConfig:
+    backend: str = "cbc"
+    threads: int | None = None
+    time_limit: float | None = None
+    gap: float | None = None
+    warm_start: bool = False
+    msg: bool = False
+
+    def __post_init__(self):
+        if self.backend not in BACKENDS:
+            raise ValueError(f"Unknown solver backend {self.backend!r}, expected one of {BACKENDS}")
+
+    def supports(self, option: str) -> bool:
+        return option not in UNSUPPORTED_OPTIONS.get(self.backend, ())
+
+    def ignore(self, option: str) -> None:
+        logger.warning(f"Solver backend {self.backend!r} does not support {option}={getattr(self, option)!r}, ignoring it")
+
+    def build(self, log_path: str | None = None) -> pulp.LpSolver:
+        for option in UNSUPPORTED_OPTIONS.get(self.backend, ()):
+            if getattr(self, option) not in (None, False):
+                self.ignore(option=option)
+        if self.backend == "enum":
+            return EnumerationSolver(fallback=replace(self, backend="cbc").build(log_path=log_path))
+        if self.backend == "glpk":
+            options = ["--mipgap", str(self.gap)] if self.gap is not None else []
+            return pulp.GLPK_CMD(msg=self.msg, timeLimit=self.time_limit, options=options)
+        if self.backend == "highs":
+            highs = pulp.HiGHS(msg=self.msg, timeLimit=self.time_limit, gapRel=self.gap, threads=self.threads)
+            command = pulp.HiGHS_CMD(
+                msg=self.msg, timeLimit=self.time_limit, gapRel=self.gap, threads=self.threads, warmStart=self.warm_start
+            )
+            if highs.available() and not (self.warm_start and command.available()):
+                if self.warm_start:
+                    self.ignore(option="warm_start")
+                return highs
+            return command
+        return pulp.PULP_CBC_CMD(
+            msg=self.msg,
+            timeLimit=self.time_limit,
+            gapRel=self.gap,
+            threads=self.threads,
+            warmStart=self.warm_start,
+            logPath=log_path
+        )
+
+
+@dataclass
+class SolveStats:
+    backend: str
+    status: str
+    wall_time: float
+    nodes: int | None = None
+    gap: float | None = None
+    objective: float | None = None
+    sol_status: str | None = None
+    time_limited: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def parse_cbc_log(log: str) -> Dict[str, Any]:
+    stats = {}
+    if match := re.search(r"^Result - (.+)$", log, flags=re.MULTILINE):
+        stats["time_limited"] = match.group(1).startswith("Stopped on time")
+    if match := re.search(r"^Enumerated nodes:\s+(\d+)", log, flags=re.MULTILINE):
+        stats["nodes"] = int(match.group(1))
+    objective = re.search(r"^Objective value:\s+(\S+)", log, flags=re.MULTILINE)
+    bound = re.search(r"^(?:Upper|Lower) bound:\s+(\S+)", log, flags=re.MULTILINE)
+    if objective and bound:
+        objective, bound = float(objective.group(1)), float(bound.group(1))
+        stats["gap"] = abs(bound - objective) / max(abs(objective), 1e-10)
+    elif match := re.search(r"^Gap:\s+(\S+)", log, flags=re.MULTILINE):
+        stats["gap"] = abs(float(match.group(1)))
+    elif re.search(r"^Result - Optimal solution found$", log, flags=re.MULTILINE):
+        stats["gap"] = 0.0
+    return stats
+
+
+def solve_model(model: pulp.LpProblem, solver: pulp.LpSolver | None = None, config: SolverConfig | None = None) -> SolveStats:
+    config = config or SolverConfig()
+    with contextlib.ExitStack() as stack:
+        if solver is None:
+            log_path = None
+            if config.backend == "cbc":
+                log_path = os.path.join(stack.enter_context(tempfile.TemporaryDirectory()), "cbc.log")
+            solver = config.build(log_path=log_path)
+        else:
+            log_path = solver.optionsDict.get("logPath")
+        start = time.perf_counter()
+        model.solve(solver)
+        wall_time = time.perf_counter() - start
+        info = {}
+        if log_path is not None and os.path.exists(log_path):
+            with open(log_path, "r", encoding="utf-8", errors="replace") as file:
+                info = parse_cbc_log(log=file.read())
+
+    status = pulp.LpStatus[model.status]
+    if isinstance(solver, EnumerationSolver) and solver.nodes is not None:
+        info["nodes"] = solver.nodes
+        if model.sol_status == pulp.LpSolutionOptimal:
+            info["gap"] = 0.0
+    elif isinstance(solver, pulp.HiGHS):
+        highs = model.solverModel
+        info.update({
+            "nodes": int(highs.getInfo().mip_node_count),
+            "time_limited": highs.modelStatusToString(highs.getModelStatus()) == "Time limit reached"
+        })
+        if model.sol_status in (pulp.LpSolutionOptimal, pulp.LpSolutionIntegerFeasible):
+            info["gap"] = float(highs.getInfo().mip_gap) if model.isMIP() else 0.0
+    return SolveStats(
+        backend=solver.name,
+        status=status,
+        wall_time=wall_time,
+        nodes=info.get("nodes"),
+        gap=info.get("gap"),
+        objective=pulp.value(model.objective),
+        sol_status=pulp.LpSolution[model.sol_status],
+        time_limited=info.get("time_limited", model.sol_status == pulp.LpSolutionIntegerFeasible)
+    )
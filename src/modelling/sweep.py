@@ -0,0 +1,74 @@
+import os
+import pulp
+import itertools
+import pandas as pd
+from typing import List, Dict, Any, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from .optimizer import BudgetLpOptimizer
+from .solvers import SolverConfig
+
+
+def scenario_grid(base: Dict[str, Any], grid: Dict[str, Iterable]) -> pd.DataFrame:
+    keys = list(grid)
+    rows = [{**base, **dict(zip(keys, values))} for values in itertools.product(*grid.values())]
+    return pd.DataFrame(rows)
+
+
+def relaxation_sensitivity(optimizer: BudgetLpOptimizer) -> Dict[str, float]:
+    variables = list(optimizer.variables.values())
+    for var in variables:
+        var.cat = pulp.LpContinuous
+    try:
+        optimizer.solve(config=SolverConfig())
+        status = pulp.LpStatus[optimizer.model.status]
+        optimal = status == "Optimal"
+        sensitivity = {"relaxed_status": status}
+        for name, constraint in optimizer.model.constraints.items():
+            sensitivity[f"shadow_{name}"] = constraint.pi if optimal else float("nan")
+        for name, var in optimizer.variables.items():
+            sensitivity[f"reduced_{name}"] = var.dj if optimal else float("nan")
+    finally:
+        for var in variables:
+            var.cat = pulp.LpInteger
+    return sensitivity
+
+
+def solve_scenarios(rows: List[Dict[str, Any]], duals: bool = True) -> List[Dict[str, Any]]:
+    optimizer = BudgetLpOptimizer.build(params=rows[0])
+    incumbent = None
+    results = []
+    for row in rows:
+        optimizer.update_params(params=row)
+        if incumbent is not None:
+            for name, value in incumbent.items():
+                optimizer.variables[name].setInitialValue(value)
+        optimizer.solve(config=SolverConfig(warm_start=incumbent is not None))
+        result = optimizer.get_results()
+        if result["status"] == "Optimal":
+            incumbent = {name: var.varValue for name, var in optimizer.variables.items()}
+        if duals:
+            result.update(relaxation_sensitivity(optimizer=optimizer))
+        results.append(result)
+    return results
+
+
+def sweep(
+        base: Dict[str, Any],
+        grid: Dict[str, Iterable],
+        workers: int | None = None,
+        duals: bool = True
+) -> pd.DataFrame:
+    scenarios = scenario_grid(base=base, grid=grid)
+    rows = scenarios.to_dict(orient="records")
+    if not rows:
+        return pd.DataFrame(columns=list(grid))
+    workers = min(workers or os.cpu_count() or 1, len(rows))
+    size = -(-len(rows) // workers)
+    chunks = [rows[i:i + size] for i in range(0, len(rows), size)]
+    if workers == 1:
+        chunk_results = [solve_scenarios(rows=chunk, duals=duals) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunk_results = list(executor.map(solve_scenarios, chunks, [duals] * len(chunks)))
+    results = pd.DataFrame([result for chunk in chunk_results for result in chunk])
+    return pd.concat([scenarios[list(grid)], results], axis=1)
@@ -1,7 +1,14 @@
-from .files import (
-    file_exists,
-    save_pandas_data,
-    get_filename,
-    list_files
-)
-from .values import money_to_float
\ No newline at end of file
+from typing import Dict
+from .lazy import lazy_exports
+
+EXPORTS: Dict[str, str] = {
+    "file_exists": ".files",
+    "file_hash": ".files",
+    "save_pandas_data": ".files",
+    "get_filename": ".files",
+    "list_files": ".files",
+    "money_to_float": ".values",
+    "money_series_to_float": ".values"
+}
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, EXPORTS)
@@ -1,30 +1,43 @@
 import os
-import pandas as pd
-from typing import List
+import hashlib
+from typing import List, TYPE_CHECKING
 
-def save_pandas_data(input_data: pd.DataFrame, filepath: str) -> None:
+if TYPE_CHECKING:
+    import pandas as pd
+
+def save_pandas_data(input_data: "pd.DataFrame", filepath: str) -> None:
     if filepath.endswith(".csv"):
         input_data.to_csv(filepath, index=False)
     elif filepath.endswith(".xlsx"):
         input_data.to_excel(filepath, index=False)
+    elif filepath.endswith(".parquet"):
+        input_data.to_parquet(filepath, index=False)
     else:
-        raise ValueError("El archivo debe tener extensión .csv o .xlsx")
+        raise ValueError("El archivo debe tener extensión .csv, .xlsx o .parquet")
 
 
 def file_exists(path: str) -> bool:
     return os.path.isfile(path)
 
 
+def file_hash(path: str, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def get_filename(filepath: str) -> str:
     filename_ext = os.path.basename(filepath)
     filename = os.path.splitext(filename_ext)[0]
     return filename
 
 
-def list_files(path: str) -> List[str]:
+def list_files(path: str, ext: str | None = None) -> List[str]:
     files = []
     for file in os.listdir(path):
         full_path = os.path.join(path, file)
-        if os.path.isfile(full_path):
+        if os.path.isfile(full_path) and (ext is None or file.endswith(ext)):
             files.append(full_path)
-    return files
\ No newline at end of file
+    return sorted(files)
\ No newline at end of file
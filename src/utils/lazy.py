@@ -0,0 +1,19 @@
+import sys
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(name: str, mapping: Dict[str, str]) -> Tuple[List[str], Callable[[str], Any], Callable[[], List[str]]]:
+    namespace = sys.modules[name].__dict__
+
+    def __getattr__(attr: str) -> Any:
+        if attr not in mapping:
+            raise AttributeError(f"module {name!r} has no attribute {attr!r}")
+        value = getattr(importlib.import_module(mapping[attr], name), attr)
+        namespace[attr] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(mapping))
+
+    return list(mapping), __getattr__, __dir__
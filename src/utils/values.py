@@ -1,4 +1,24 @@
+from typing import Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
 def money_to_float(value: str|float) -> float:
     if isinstance(value, str):
         value = value.replace(",","")
-    return float(value)
\ No newline at end of file
+    return float(value)
+
+
+def money_series_to_float(values: "pd.Series") -> Tuple["pd.Series", "pd.Series"]:
+    import pandas as pd
+    if values.dtype.name != "object":
+        return values.astype(float), pd.Series(False, index=values.index)
+    text = values.astype("string").str.replace(r"[$€£\s]|USD", "", regex=True)
+    negative = text.str.fullmatch(r"\(.*\)|.+-", na=False)
+    cleaned = text.str.replace(r"[(),]", "", regex=True).str.replace(r"(?<=.)-$", "", regex=True)
+    cleaned = cleaned.mask(negative, "-" + cleaned)
+    blank = cleaned.isna() | cleaned.isin(["", "-"]) | (cleaned.str.lower() == "nan")
+    parsed = pd.to_numeric(cleaned.mask(blank).astype(object), errors="coerce").astype(float)
+    failed = parsed.isna() & ~blank
+    return parsed, failed
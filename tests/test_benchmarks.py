@@ -0,0 +1,26 @@
+import json
+from benchmarks.compare import compare
+from benchmarks.generators import generate_dataset
+from benchmarks.run import run_scale
+from src.data import CSVLoader, ExcelLoader, FCPDataProcessor, POADataProcessor, BalanceDataProcessor
+from src.utils import list_files
+
+
+def test_generate_dataset(tmp_path):
+    paths = generate_dataset(root=str(tmp_path), n_fcps=2, poa_rows=20)
+    assert len(FCPDataProcessor(loader=ExcelLoader()).process(filepath=paths["fcps"])) == 2
+    poa = POADataProcessor(loader=CSVLoader()).process(filepath=list_files(path=paths["poa"])[0])
+    balance = BalanceDataProcessor(loader=ExcelLoader()).process(filepath=list_files(path=paths["balance"])[0])
+    assert not poa.empty
+    assert not balance.empty
+
+
+def test_run_and_compare(tmp_path):
+    results = run_scale(n_fcps=2, repeat=1, workers=1, root=str(tmp_path))
+    assert {"poa.load", "pipeline.process_balance", "optimizer.solve_cbc"} <= {r["benchmark"] for r in results}
+    baseline, candidate = tmp_path / "baseline.json", tmp_path / "candidate.json"
+    baseline.write_text(json.dumps({"meta": {}, "results": results}))
+    slower = [{**r, "seconds": r["seconds"] * 2} for r in results]
+    candidate.write_text(json.dumps({"meta": {}, "results": slower}))
+    data = compare(baseline=str(baseline), candidate=str(candidate), threshold=1.5)
+    assert data["regression"].all()
@@ -0,0 +1,48 @@
+import os
+from src.modelling.cache import SolveCache
+
+
+def test_solve_cache_normalizes_params():
+    calls = []
+
+    def solve(params):
+        calls.append(params)
+        return {"status": "Optimal", "n1": params["x"]}
+
+    cache = SolveCache(maxsize=2)
+    assert cache.get_or_solve(params={"x": 1.0, "y": 2}, solve=solve)["n1"] == 1.0
+    assert cache.get_or_solve(params={"y": 2.0, "x": 1.0000000001}, solve=solve)["n1"] == 1.0
+    assert len(calls) == 1
+    assert cache.stats["hits"] == 1 and cache.stats["misses"] == 1
+
+
+def test_solve_cache_eviction_and_disk_tier(tmp_path):
+    cache = SolveCache(maxsize=1, path=str(tmp_path))
+    cache.set(params={"x": 1}, results={"n1": 1})
+    cache.set(params={"x": 2}, results={"n1": 2})
+    assert cache.stats["evictions"] == 1
+
+    other = SolveCache(maxsize=1, path=str(tmp_path))
+    assert other.get(params={"x": 1}) == {"n1": 1}
+    assert other.stats["disk_hits"] == 1
+
+
+def test_solve_cache_ttl():
+    cache = SolveCache(ttl=0)
+    cache.set(params={"x": 1}, results={"n1": 1})
+    assert cache.get(params={"x": 1}) is None
+
+
+def test_solve_cache_disk_cap(tmp_path):
+    cache = SolveCache(maxsize=10, path=str(tmp_path), max_disk_entries=2)
+    for x in range(4):
+        cache.set(params={"x": x}, results={"n1": x})
+        os.utime(tmp_path / f"{cache.key(params={'x': x})}.json", (x, x))
+    assert len(list(tmp_path.glob("*.json"))) == 2
+    assert cache.stats["disk_evictions"] == 2
+    other = SolveCache(path=str(tmp_path))
+    assert other.get(params={"x": 0}) is None and other.get(params={"x": 3}) == {"n1": 3}
+
+    capped = SolveCache(path=str(tmp_path / "bytes"), max_disk_entries=None, max_disk_bytes=1)
+    capped.set(params={"x": 1}, results={"n1": 1})
+    assert list((tmp_path / "bytes").glob("*.json")) == []
@@ -0,0 +1,48 @@
+import os
+import pandas as pd
+from src.data import CSVLoader, CachingLoader
+
+
+class CountingLoader(CSVLoader):
+    def __init__(self):
+        self.calls = 0
+
+    def load(self, filepath: str) -> pd.DataFrame:
+        self.calls += 1
+        return super().load(filepath=filepath)
+
+
+def test_caching_loader(tmp_path):
+    filepath = str(tmp_path / "EC0101.csv")
+    pd.DataFrame({"account": [5101, 5102], "value": [1.5, 2.5]}).to_csv(filepath, index=False)
+    loader = CountingLoader()
+    cache = CachingLoader(loader=loader, path=str(tmp_path / "cache"))
+
+    first = cache.load(filepath=filepath)
+    second = cache.load(filepath=filepath)
+    pd.testing.assert_frame_equal(first, second)
+    assert loader.calls == 1
+
+    pd.DataFrame({"account": [5101], "value": [9.0]}).to_csv(filepath, index=False)
+    os.utime(filepath, ns=(0, os.stat(filepath).st_mtime_ns + 10 ** 9))
+    assert cache.load(filepath=filepath)["value"].tolist() == [9.0]
+    assert loader.calls == 2
+
+    cache.invalidate(filepath=filepath)
+    assert cache.entries(filepath=filepath) == []
+    cache.load(filepath=filepath)
+    assert loader.calls == 3
+
+
+def test_caching_loader_eviction(tmp_path):
+    cache = CachingLoader(loader=CSVLoader(), path=str(tmp_path / "cache"), max_bytes=1)
+    for name in ["EC0101", "EC0102"]:
+        filepath = str(tmp_path / f"{name}.csv")
+        pd.DataFrame({"account": [5101]}).to_csv(filepath, index=False)
+        cache.load(filepath=filepath)
+    assert len(cache.entries()) == 0
+    cache.max_bytes = 1 << 20
+    cache.load(filepath=filepath)
+    assert len(cache.entries()) == 1
+    cache.invalidate()
+    assert cache.entries() == []
@@ -0,0 +1,58 @@
+import pandas as pd
+from src.data import CSVLoader, POADataProcessor, ParquetLoader, ParquetConsolidator, CategorySchema
+from src.utils import save_pandas_data
+from tests.test_runner import write_poa_csv
+
+
+def test_poa_categories(tmp_path):
+    filepaths = []
+    for name in ["EC0101", "EC0102"]:
+        filepath = tmp_path / f"{name}.csv"
+        write_poa_csv(filepath)
+        data = POADataProcessor(loader=CSVLoader()).process(filepath=str(filepath))
+        assert all(isinstance(data[col].dtype, pd.CategoricalDtype) for col in ["fcpId", "activity", "group", "account", "month"])
+        assert data["month"].cat.ordered and data["month"].cat.categories.tolist()[-1] == "m12"
+        filepaths.append(str(tmp_path / f"{name}.parquet"))
+        save_pandas_data(input_data=data, filepath=filepaths[-1])
+
+    output_filepath = str(tmp_path / "poa.parquet")
+    ParquetConsolidator(loader=ParquetLoader()).consolidate(filepaths=filepaths, output_filepath=output_filepath)
+    consolidated = pd.read_parquet(output_filepath)
+    assert isinstance(consolidated["fcpId"].dtype, pd.CategoricalDtype)
+    assert consolidated["fcpId"].cat.categories.tolist() == ["EC0101", "EC0102"]
+
+
+def test_category_schema_concat():
+    schema = CategorySchema(columns=["fcpId", "month"])
+    first = schema.apply(pd.DataFrame({"fcpId": ["EC0101"], "month": ["m1"], "value": [1.0]}))
+    second = schema.apply(pd.DataFrame({"fcpId": ["EC0102"], "month": ["m2"], "value": [2.0]}))
+    data = CategorySchema.concat([first, second])
+    assert data["fcpId"].cat.categories.tolist() == ["EC0101", "EC0102"]
+    assert data["month"].dtype == first["month"].dtype
+    assert data["value"].tolist() == [1.0, 2.0]
+
+
+def test_poa_categories_share_chart_of_accounts(tmp_path):
+    chart = tmp_path / "chart_of_accounts.csv"
+    pd.DataFrame({"account": [5101, 5102, 5201], "group": ["Group", "Group", "Other"]}).to_csv(chart, index=False)
+    schema = CategorySchema(
+        columns=["fcpId", "activity", "group", "account", "month"],
+        categories=CategorySchema.chart_of_accounts(filepath=str(chart))
+    )
+    dtypes = []
+    for name in ["EC0101", "EC0102"]:
+        filepath = tmp_path / f"{name}.csv"
+        write_poa_csv(filepath)
+        data = POADataProcessor(loader=CSVLoader(), schema=schema).process(filepath=str(filepath))
+        dtypes.append((data["account"].dtype, data["group"].dtype))
+    assert dtypes[0] == dtypes[1]
+    assert dtypes[0][0].categories.tolist() == ["5101", "5102", "5201"]
+    assert dtypes[0][1].categories.tolist() == ["Group", "Other"]
+    assert CategorySchema.chart_of_accounts(filepath=str(tmp_path / "missing.csv")) == {}
+
+
+def test_category_schema_keeps_values_outside_the_vocabulary():
+    schema = CategorySchema(columns=["account"], categories={"account": ["5101"]})
+    data = schema.apply(pd.DataFrame({"account": ["5101", "9999"]}))
+    assert data["account"].tolist() == ["5101", "9999"]
+    assert data["account"].cat.categories.tolist() == ["5101", "9999"]
@@ -0,0 +1,33 @@
+import io
+import sys
+import json
+import subprocess
+from src.modelling.cli import main, run
+from src.modelling.params import DEFAULT_PARAMS, parse_params
+from src.modelling.batch import solve_params
+
+
+def test_cli_run():
+    rows = [{"id": "a"}, {"id": "b", "N_max": "800", "kids_ratio": "0.3"}, {"id": "c", "C1": "x"}]
+    output = io.StringIO()
+    failed = run(rows=rows, output=output, workers=2, chunk_size=1)
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert failed == 1
+    assert [result["id"] for result in results] == ["a", "b", "c"]
+    assert {**results[0], "id": None} == {**solve_params(params=DEFAULT_PARAMS), "id": None}
+    assert results[1]["n1"] == solve_params(params=parse_params(values=rows[1]))["n1"]
+    assert results[2]["status"] == "Error"
+
+
+def test_cli_csv(tmp_path):
+    input_filepath, output_filepath = tmp_path / "params.csv", tmp_path / "results.jsonl"
+    input_filepath.write_text("id,N_max\nx,700\ny,900\n")
+    assert main([str(input_filepath), "--output", str(output_filepath), "--solver", "enum"]) == 0
+    results = [json.loads(line) for line in output_filepath.read_text().splitlines()]
+    assert [result["status"] for result in results] == ["Optimal", "Optimal"]
+
+
+def test_cli_import_is_lightweight():
+    code = "import sys, src.modelling.cli; print(sorted(m for m in ('pandas', 'streamlit', 'PIL') if m in sys.modules))"
+    modules = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert modules.strip() == "[]"
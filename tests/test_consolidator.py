@@ -0,0 +1,108 @@
+import pytest
+import pandas as pd
+from src.data import CSVLoader, ParquetLoader, ParquetConsolidator
+from src.utils import save_pandas_data
+
+
+def test_parquet_consolidator(tmp_path):
+    filepaths = []
+    for i, fcp_id in enumerate(["EC0101", "EC0102", "EC0103"]):
+        data = pd.DataFrame({"fcpId": fcp_id, "month": ["m1", "m2"], "value": [float(i), float(i + 1)]})
+        filepath = str(tmp_path / f"{fcp_id}.parquet")
+        save_pandas_data(input_data=data, filepath=filepath)
+        filepaths.append(filepath)
+
+    output_filepath = str(tmp_path / "poa.parquet")
+    consolidator = ParquetConsolidator(loader=ParquetLoader())
+    rows = consolidator.consolidate(filepaths=filepaths, output_filepath=output_filepath)
+    final = pd.read_parquet(output_filepath)
+    assert rows == 6
+    assert final["fcpId"].tolist() == ["EC0101", "EC0101", "EC0102", "EC0102", "EC0103", "EC0103"]
+
+
+def test_parquet_consolidator_categories(tmp_path):
+    filepaths = []
+    for n in [2, 300]:
+        data = pd.DataFrame({"account": pd.Categorical([str(i) for i in range(n)])})
+        filepaths.append(str(tmp_path / f"{n}.parquet"))
+        save_pandas_data(input_data=data, filepath=filepaths[-1])
+
+    output_filepath = str(tmp_path / "balance.parquet")
+    ParquetConsolidator(loader=ParquetLoader()).consolidate(filepaths=filepaths, output_filepath=output_filepath)
+    final = pd.read_parquet(output_filepath)
+    assert isinstance(final["account"].dtype, pd.CategoricalDtype)
+    assert len(final) == 302
+
+
+def test_parquet_consolidator_unifies_null_columns(tmp_path):
+    frames = [
+        pd.DataFrame({"fcpId": "EC0101", "note": [None, None], "value": [1.0, 2.0]}),
+        pd.DataFrame({"fcpId": "EC0102", "note": ["a", None], "value": [3.0, 4.0]}),
+    ]
+    filepaths = []
+    for i, data in enumerate(frames):
+        filepaths.append(str(tmp_path / f"{i}.parquet"))
+        save_pandas_data(input_data=data, filepath=filepaths[-1])
+
+    output_filepath = str(tmp_path / "poa.parquet")
+    assert ParquetConsolidator(loader=ParquetLoader()).consolidate(filepaths=filepaths, output_filepath=output_filepath) == 4
+    final = pd.read_parquet(output_filepath)
+    assert final["note"].tolist() == [None, None, "a", None]
+
+
+class FailingLoader(ParquetLoader):
+    def load(self, filepath: str, **kwargs) -> pd.DataFrame:
+        if filepath.endswith("1.parquet"):
+            raise OSError("read failed")
+        return super().load(filepath=filepath, **kwargs)
+
+
+def test_parquet_consolidator_removes_tmp_on_failure(tmp_path):
+    filepaths = []
+    for i in range(2):
+        filepaths.append(str(tmp_path / f"{i}.parquet"))
+        save_pandas_data(input_data=pd.DataFrame({"value": [1.0, 2.0]}), filepath=filepaths[-1])
+
+    output_filepath = str(tmp_path / "poa.parquet")
+    with pytest.raises(OSError):
+        ParquetConsolidator(loader=FailingLoader()).consolidate(filepaths=filepaths, output_filepath=output_filepath)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["0.parquet", "1.parquet"]
+
+
+class EmptyLoader(ParquetLoader):
+    def load(self, filepath: str, **kwargs) -> pd.DataFrame:
+        if filepath.endswith("1.parquet"):
+            return pd.DataFrame()
+        return super().load(filepath=filepath, **kwargs)
+
+
+def test_parquet_consolidator_reports_skipped_inputs(tmp_path):
+    filepaths = []
+    for i in range(3):
+        filepaths.append(str(tmp_path / f"{i}.parquet"))
+        save_pandas_data(input_data=pd.DataFrame({"value": [float(i)]}), filepath=filepaths[-1])
+
+    consolidator = ParquetConsolidator(loader=EmptyLoader())
+    assert consolidator.consolidate(filepaths=filepaths, output_filepath=str(tmp_path / "poa.parquet")) == 2
+    assert consolidator.skipped == [filepaths[1]]
+
+
+class CountingLoader(CSVLoader):
+    def __init__(self):
+        super().__init__()
+        self.loads = []
+
+    def load(self, filepath: str, **kwargs) -> pd.DataFrame:
+        self.loads.append(filepath)
+        return super().load(filepath=filepath, **kwargs)
+
+
+def test_parquet_consolidator_loads_other_inputs_once(tmp_path):
+    filepaths = []
+    for i in range(2):
+        filepaths.append(str(tmp_path / f"{i}.csv"))
+        pd.DataFrame({"value": [float(i), float(i + 1)]}).to_csv(filepaths[-1], index=False)
+
+    loader = CountingLoader()
+    assert ParquetConsolidator(loader=loader).consolidate(filepaths=filepaths, output_filepath=str(tmp_path / "poa.parquet")) == 4
+    assert loader.loads == filepaths
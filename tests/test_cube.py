@@ -0,0 +1,64 @@
+import os
+import pandas as pd
+from src.data import ParquetLoader, AnalyticsCube
+from src.utils import save_pandas_data
+
+
+def write_frames(tmp_path, fcp_id, scale=1.0):
+    poa = pd.DataFrame({
+        "activity": ["a", "b", "c"],
+        "group": ["Cognitivo", "Físico", "Cognitivo"],
+        "account": ["101", "101", "102"],
+        "fcpId": fcp_id,
+        "month": ["m1", "m1", "m2"],
+        "value": [10.0 * scale, 5.0 * scale, 20.0 * scale]
+    })
+    balance = pd.DataFrame({"account": ["101", "301"], "fcpId": fcp_id, "month": ["m1", "m1"], "diff": [12.0, 3.0]})
+    filepaths = {"poa": str(tmp_path / "poa" / f"{fcp_id}.parquet"), "balance": str(tmp_path / "balance" / f"{fcp_id}.parquet")}
+    for name, data in [("poa", poa), ("balance", balance)]:
+        os.makedirs(os.path.dirname(filepaths[name]), exist_ok=True)
+        save_pandas_data(input_data=data, filepath=filepaths[name])
+    return filepaths
+
+
+def test_analytics_cube(tmp_path):
+    files = [write_frames(tmp_path=tmp_path, fcp_id=fcp_id) for fcp_id in ["EC0101", "EC0102"]]
+    cube = AnalyticsCube(path=str(tmp_path / "cube"))
+    loader = ParquetLoader()
+    assert cube.refresh(kind="budget", filepaths=[f["poa"] for f in files], loader=loader) == ["EC0101", "EC0102"]
+    assert cube.refresh(kind="execution", filepaths=[f["balance"] for f in files], loader=loader) == ["EC0101", "EC0102"]
+
+    budget = cube.query(kind="budget", fcpId="EC0101")
+    assert budget.loc[("EC0101", "Cognitivo", "101", "m1"), "budget"] == 10.0
+    variance = cube.query(fcpId="EC0101", month="m1")
+    assert variance.loc[("EC0101", "101", "m1")].to_dict() == {
+        "budget": 15.0, "execution": 12.0, "variance": -3.0, "execution_ratio": 0.8
+    }
+    assert variance.loc[("EC0101", "301", "m1"), "budget"] == 0.0
+    assert variance.index.is_monotonic_increasing
+    assert cube.query(fcpId="EC0999").empty
+
+    write_frames(tmp_path=tmp_path, fcp_id="EC0102", scale=2.0)
+    cube = AnalyticsCube(path=str(tmp_path / "cube"))
+    assert cube.refresh(kind="budget", filepaths=[f["poa"] for f in files], loader=loader) == ["EC0102"]
+    assert cube.query(fcpId="EC0102", account="101", month="m1")["budget"].item() == 30.0
+    assert cube.refresh(kind="budget", filepaths=[files[1]["poa"]], loader=loader) == ["EC0101"]
+    assert cube.query(fcpId="EC0101", month="m1")["budget"].tolist() == [0.0, 0.0]
+
+
+def test_analytics_cube_reads_fcp_id_from_data(tmp_path):
+    filepath = str(tmp_path / "poa_final.parquet")
+    data = pd.concat([pd.read_parquet(write_frames(tmp_path=tmp_path, fcp_id=fcp_id)["poa"]) for fcp_id in ["EC0101", "EC0102"]])
+    save_pandas_data(input_data=data, filepath=filepath)
+    cube = AnalyticsCube(path=str(tmp_path / "cube"))
+    loader = ParquetLoader()
+    assert cube.refresh(kind="budget", filepaths=[filepath], loader=loader) == ["EC0101", "EC0102"]
+    assert sorted(cube.fcp_ids(kind="budget")) == ["EC0101", "EC0102"]
+    assert cube.refresh(kind="budget", filepaths=[filepath], loader=loader) == []
+
+    save_pandas_data(input_data=data[data["fcpId"] == "EC0102"], filepath=filepath)
+    cube = AnalyticsCube(path=str(tmp_path / "cube"))
+    assert sorted(cube.refresh(kind="budget", filepaths=[filepath], loader=loader)) == ["EC0101", "EC0102"]
+    assert cube.fcp_ids(kind="budget") == ["EC0102"]
+    assert cube.refresh(kind="budget", filepaths=[], loader=loader) == ["EC0102"]
+    assert cube.fcp_ids(kind="budget") == []
@@ -0,0 +1,75 @@
+import pandas as pd
+import pytest
+from config import logger
+from src.modelling.derive import derive_params, leaf_accounts, match_accounts
+from src.modelling.batch import solve_batch
+from src.modelling.params import DEFAULT_PARAMS
+from src.modelling.solvers import EnumerationSolver
+
+
+def test_account_matching():
+    accounts = pd.Index(["5", "51", "51301", "51101", "51304"])
+    assert leaf_accounts(accounts=accounts).tolist() == [False, False, True, True, True]
+    rules = match_accounts(accounts=accounts, prefixes=pd.Series(["51", "513", "9"]))
+    assert rules.tolist() == [-1, 0, 1, 0, 1]
+    groups = pd.Index(["EC0101", "EC0101", "EC0102", "EC0102", "EC0102"])
+    accounts = pd.Index(["513", "51301", "513", "511", "51101"])
+    assert leaf_accounts(accounts=accounts, groups=groups).tolist() == [False, True, True, False, True]
+
+
+def test_derive_params():
+    poa = pd.DataFrame({
+        "fcpId": ["EC0101"] * 4 + ["EC0102"] * 2,
+        "account": ["51101", "51301", "51303", "51304", "51101", "51301"],
+        "month": ["m1"] * 6,
+        "value": [280.0, 110.0, 90.0, 300.0, 40.0, 10.0]
+    })
+    balance = pd.DataFrame({
+        "fcpId": ["EC0101"] * 4 + ["EC0102"] * 2,
+        "account": ["4", "41", "41101", "41102", "4", "41101"],
+        "month": ["m1", "m1", "m1", "m2", "m1", "m1"],
+        "haber": [9999.0, 9999.0, 1000.0, 1500.0, 600.0, 600.0]
+    })
+    fcps = pd.DataFrame({"fcpId": ["EC0101", "EC0102", "EC0103"], "fpcCurrentParticipants": [10, 0, 300]})
+    params = derive_params(poa=poa, balance=balance, fcps=fcps, strict=True)
+    assert params.index.tolist() == ["EC0101", "EC0102", "EC0103"]
+    assert list(params.columns) == list(DEFAULT_PARAMS)
+    assert params["C2"].tolist() == [50.0, DEFAULT_PARAMS["C2"], DEFAULT_PARAMS["C2"]]
+    assert params["I"].tolist() == [250.0, DEFAULT_PARAMS["I"], DEFAULT_PARAMS["I"]]
+    assert params["N_max"].tolist() == [10, 0, 300]
+    results = solve_batch(params=params, solver=EnumerationSolver())
+    assert results.index.tolist() == params.index.tolist()
+
+    with pytest.raises(ValueError):
+        derive_params(poa=poa)
+    with pytest.raises(ValueError, match="'I'"):
+        derive_params(poa=poa, fcps=fcps, strict=True)
+
+
+def test_derive_params_balance_mapping():
+    balance = pd.DataFrame({"fcpId": "EC0101", "account": ["5", "52", "52201"], "month": "m1", "debe": [1.0, 2.0, 4.0]})
+    mapping = pd.DataFrame([{"param": "V", "source": "balance", "prefix": "52", "measure": "debe", "scale": 12.0, "per": None}])
+    params = derive_params(balance=balance, mapping=mapping)
+    assert params.loc["EC0101", "V"] == 48.0
+    assert params.loc["EC0101", "G"] == DEFAULT_PARAMS["G"]
+
+
+def test_derive_params_leaves_and_fallbacks():
+    poa = pd.DataFrame({
+        "fcpId": ["EC0101", "EC0101", "EC0102"],
+        "account": ["513", "51301", "513"],
+        "month": "m1",
+        "value": [500.0, 200.0, 300.0]
+    })
+    fcps = pd.DataFrame({"fcpId": ["EC0101", "EC0102", "EC0103"], "fpcCurrentParticipants": [10, 10, 10]})
+    messages = []
+    sink = logger.add(messages.append, level="WARNING", format="{message}")
+    try:
+        params = derive_params(poa=poa, fcps=fcps)
+    finally:
+        logger.remove(sink)
+    assert params["C2"].tolist() == [20.0, 30.0, DEFAULT_PARAMS["C2"]]
+    messages = [message.strip() for message in messages]
+    assert "Parameter 'C2' could not be derived for 1 of 3 FCPs (EC0103), using default 99.0" in messages
+    assert "Parameter 'I' matched no accounts, using default 246.0" in messages
+    assert "Parameter 'doctor' has no account mapping, using default 4741.56" in messages
@@ -0,0 +1,39 @@
+import time
+from src.app.executor import SolveExecutor
+from src.modelling.batch import solve_params
+from src.modelling.params import DEFAULT_PARAMS
+
+
+def slow_solve(params):
+    time.sleep(30)
+    return {}
+
+
+def failing_solve(params):
+    raise ValueError("bad params")
+
+
+def test_solve_executor():
+    executor = SolveExecutor(max_workers=2, time_limit=20)
+    try:
+        job_id = executor.submit(params=DEFAULT_PARAMS)
+        job = executor.wait(job_id=job_id, timeout=30)
+        assert job.status == "done"
+        assert job.result == solve_params(params=DEFAULT_PARAMS)
+
+        warm = [executor.wait(job_id=executor.submit(params=DEFAULT_PARAMS), timeout=30) for _ in range(3)]
+        assert all(job.status == "done" for job in warm)
+        assert max(job.elapsed for job in warm) < 0.3
+
+        failed = executor.wait(job_id=executor.submit(params=DEFAULT_PARAMS, solve=failing_solve), timeout=30)
+        assert failed.status == "failed" and "bad params" in failed.error
+
+        timeout = executor.wait(job_id=executor.submit(params=DEFAULT_PARAMS, solve=slow_solve, time_limit=0.5), timeout=30)
+        assert timeout.status == "timeout"
+
+        job_id = executor.submit(params=DEFAULT_PARAMS, solve=slow_solve)
+        assert executor.cancel(job_id=job_id)
+        assert executor.wait(job_id=job_id, timeout=30).status == "cancelled"
+        assert not executor.cancel(job_id=job_id)
+    finally:
+        executor.shutdown()
@@ -0,0 +1,42 @@
+import sys
+import json
+import subprocess
+
+IMPORT_BUDGET_SECONDS = 0.5
+
+CODE = """
+import sys, json, time
+start = time.perf_counter()
+import src.data, src.utils, src.modelling
+from src.utils import money_to_float, file_hash, get_filename
+from src.modelling import DEFAULT_PARAMS
+elapsed = time.perf_counter() - start
+heavy = sorted(m for m in ("pandas", "pyarrow", "openpyxl", "pulp", "numpy", "streamlit") if m in sys.modules)
+print(json.dumps({"elapsed": elapsed, "heavy": heavy}))
+"""
+
+
+def test_import_budget():
+    output = subprocess.run([sys.executable, "-c", CODE], capture_output=True, text=True, check=True).stdout
+    report = json.loads(output)
+    assert report["heavy"] == []
+    assert report["elapsed"] < IMPORT_BUDGET_SECONDS
+
+
+def test_lazy_exports():
+    import src.data
+    import src.modelling
+    from src.data import CSVLoader, ProcessorRunner
+    from src.modelling import BudgetLpOptimizer
+    assert CSVLoader.__module__ == "src.data.files.loaders"
+    assert ProcessorRunner.__module__ == "src.data.processors.runner"
+    assert BudgetLpOptimizer.__module__ == "src.modelling.optimizer"
+    assert "ParquetConsolidator" in dir(src.data)
+    assert set(src.modelling.__all__) <= set(dir(src.modelling))
+
+
+def test_data_delegates_to_subpackages():
+    import src.data
+    from src.data import analytics, files, processors, query
+    assert set(src.data.__all__) == set(files.__all__) | set(processors.__all__) | set(analytics.__all__) | set(query.__all__)
+    assert src.data.QueryEngine is query.QueryEngine
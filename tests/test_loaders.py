@@ -1,4 +1,7 @@
-from src.data import ExcelLoader, CSVLoader
+import pytest
+import pandas as pd
+from src.data import ExcelLoader, CSVLoader, ParquetLoader
+from src.utils import save_pandas_data
 
 def test_excel_loader():
     loader = ExcelLoader()
@@ -8,4 +11,63 @@ def test_excel_loader():
 def test_csv_loader():
     loader = CSVLoader()
     data = loader.load(filepath="./data/test/EC0107.csv")
-    assert len(data) > 1
\ No newline at end of file
+    assert len(data) > 1
+
+def test_parquet_loader(tmp_path):
+    filepath = str(tmp_path / "EC0107.parquet")
+    data = pd.DataFrame({"account": ["5101", "5102"], "value": [1.5, 2.5]})
+    save_pandas_data(input_data=data, filepath=filepath)
+    loader = ParquetLoader()
+    loaded = loader.load(filepath=filepath)
+    pd.testing.assert_frame_equal(loaded, data)
+
+def test_excel_loader_iter_sheets(tmp_path):
+    filepath = str(tmp_path / "balance.xlsx")
+    with pd.ExcelWriter(filepath) as writer:
+        for sheet in ["Octubre", "Noviembre"]:
+            pd.DataFrame({"Title": ["Balance"]}).to_excel(writer, sheet_name=sheet, index=False)
+            pd.DataFrame({"Cuenta": [101, 102], "Saldo": [1.5, None], "Nota": ["a", None]}).to_excel(
+                writer, sheet_name=sheet, startrow=3, index=False
+            )
+    loader = ExcelLoader()
+    expected = loader.load(filepath=filepath, sheet_name=None, skiprows=3, usecols=[0, 1], dtype={"Cuenta": str})
+    sheets = loader.iter_sheets(filepath=filepath, skiprows=3, usecols=[0, 1], dtype={"Cuenta": str})
+    loaded = dict(sheets)
+    assert list(loaded) == list(expected)
+    for name in expected:
+        pd.testing.assert_frame_equal(loaded[name], expected[name])
+
+def test_excel_loader_engine_fallback(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.data.files.loaders.find_spec", lambda name: None)
+    assert ExcelLoader(engine="calamine").engine == "openpyxl"
+    assert ExcelLoader(engine="auto").engine == "openpyxl"
+    monkeypatch.setattr("src.data.files.loaders.find_spec", lambda name: object())
+    assert ExcelLoader(engine="auto").engine == "calamine"
+    assert ExcelLoader(engine="openpyxl").engine == "openpyxl"
+    with pytest.raises(ValueError):
+        ExcelLoader(engine="xlrd")
+
+def test_excel_loader_engine_parity(tmp_path):
+    pytest.importorskip("python_calamine")
+    filepath = str(tmp_path / "parity.xlsx")
+    with pd.ExcelWriter(filepath, engine="openpyxl") as writer:
+        pd.DataFrame({
+            "Cuenta": [101, None, 10201, 103],
+            "Descripcion": ["Caja", None, "Banco", "Inventario"],
+            "Saldo": [1.5, None, -20, 3],
+            "Mixto": ["12", None, 7.25, "abc"],
+            "Fecha": pd.to_datetime(["2024-01-31", None, "2024-02-29", "2024-03-31"])
+        }).to_excel(writer, sheet_name="Octubre", startrow=2, index=False)
+        pd.DataFrame({"Cuenta": [5, None, 51], "Nota": ["x", None, None], "Saldo": [None, None, 0.1]}).to_excel(
+            writer, sheet_name="Noviembre", startrow=2, index=False
+        )
+    calamine, openpyxl = ExcelLoader(engine="calamine"), ExcelLoader(engine="openpyxl")
+    assert calamine.engine == "calamine"
+    expected = openpyxl.load(filepath=filepath, sheet_name=None, skiprows=2)
+    loaded = calamine.load(filepath=filepath, sheet_name=None, skiprows=2)
+    assert list(loaded) == list(expected) == ["Octubre", "Noviembre"]
+    for name in expected:
+        pd.testing.assert_frame_equal(loaded[name], expected[name])
+    sheets = dict(calamine.iter_sheets(filepath=filepath, skiprows=2, usecols=[0, 1, 2]))
+    for name, data in openpyxl.iter_sheets(filepath=filepath, skiprows=2, usecols=[0, 1, 2]):
+        pd.testing.assert_frame_equal(sheets[name], data)
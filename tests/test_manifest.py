@@ -0,0 +1,35 @@
+from src.data import Manifest
+
+
+def test_manifest_detects_changes(tmp_path):
+    source = tmp_path / "EC0107.csv"
+    output = tmp_path / "EC0107.parquet"
+    source.write_text("a,b\n1,2\n")
+    manifest_path = str(tmp_path / "manifest.json")
+
+    manifest = Manifest(filepath=manifest_path)
+    assert manifest.is_stale(inputs=[str(source)], output=str(output))
+    output.write_text("processed")
+    manifest.update(inputs=[str(source)], output=str(output))
+    manifest.save()
+
+    manifest = Manifest(filepath=manifest_path)
+    assert not manifest.is_stale(inputs=[str(source)], output=str(output))
+
+    source.write_text("a,b\n1,3\n")
+    manifest = Manifest(filepath=manifest_path)
+    assert manifest.is_stale(inputs=[str(source)], output=str(output))
+
+
+def test_manifest_prunes_deleted_inputs(tmp_path):
+    manifest = Manifest(filepath=str(tmp_path / "manifest.json"))
+    for name in ["EC0107", "EC0108"]:
+        (tmp_path / f"{name}.csv").write_text("a,b\n1,2\n")
+        (tmp_path / f"{name}.parquet").write_text("processed")
+        manifest.update(inputs=[str(tmp_path / f"{name}.csv")], output=str(tmp_path / f"{name}.parquet"))
+
+    (tmp_path / "EC0108.csv").unlink()
+    removed = manifest.prune(inputs=[str(tmp_path / "EC0107.csv")])
+    assert removed == [str(tmp_path / "EC0108.parquet")]
+    assert not (tmp_path / "EC0108.parquet").exists() and (tmp_path / "EC0107.parquet").exists()
+    assert list(manifest.entries) == [str(tmp_path / "EC0107.parquet")]
@@ -0,0 +1,32 @@
+import pulp
+import numpy as np
+import pytest
+from src.modelling.matrix import MatrixModel
+from src.modelling.optimizer import BudgetLpOptimizer
+from src.modelling.params import DEFAULT_PARAMS
+
+
+def test_budget_matrix_roundtrip():
+    optimizer = BudgetLpOptimizer.build(params=DEFAULT_PARAMS)
+    matrix = BudgetLpOptimizer.to_matrix(params=DEFAULT_PARAMS)
+    from_pulp = MatrixModel.from_pulp(lp=optimizer.model)
+    order = [from_pulp.variables.index(var) for var in matrix.variables]
+    np.testing.assert_allclose(from_pulp.dense()[:, order], matrix.dense())
+    np.testing.assert_allclose(from_pulp.b, matrix.b)
+    assert from_pulp.constraints == matrix.constraints
+
+    model, variables = matrix.to_pulp(name="roundtrip")
+    model.solve(pulp.PULP_CBC_CMD(msg=False))
+    optimizer.solve(solver=pulp.PULP_CBC_CMD(msg=False))
+    results = optimizer.get_results()
+    assert pulp.LpStatus[model.status] == results["status"]
+    assert [variables[var].varValue for var in ["x1", "x2", "t1", "t2"]] == [results[k] for k in ["n1", "n2", "t1", "t2"]]
+
+
+def test_budget_matrix_highs():
+    pytest.importorskip("scipy")
+    optimizer = BudgetLpOptimizer.build(params=DEFAULT_PARAMS)
+    optimizer.solve(solver=pulp.PULP_CBC_CMD(msg=False))
+    solution = BudgetLpOptimizer.to_matrix(params=DEFAULT_PARAMS).solve_highs()
+    assert solution["status"] == "Optimal"
+    assert solution["objective"] == pytest.approx(pulp.value(optimizer.model.objective))
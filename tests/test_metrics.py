@@ -0,0 +1,55 @@
+import tracemalloc
+from src.data import CSVLoader, POADataProcessor, ProcessorRunner, MemorySink, JSONLinesSink, CSVSink, load_metrics, summarize
+from tests.test_runner import write_poa_csv
+
+
+def test_stage_metrics(tmp_path):
+    filepath = tmp_path / "EC0101.csv"
+    write_poa_csv(filepath)
+    sink = MemorySink()
+    processor = POADataProcessor(loader=CSVLoader(), sink=sink, trace_memory=True)
+    processor.process(filepath=str(filepath))
+    stages = {record["stage"]: record for record in sink.records}
+    assert list(stages) == [
+        "load", "validate", "set_columns", "remove_nans_by_col", "parse_col_types", "set_fcp_id", "unpivot_month_values",
+        "set_categories"
+    ]
+    assert stages["remove_nans_by_col"]["rows_in"] == 2
+    assert stages["remove_nans_by_col"]["rows_out"] == 1
+    assert stages["unpivot_month_values"]["rows_out"] == 12
+    assert all(record["fcpId"] == "EC0101" and record["seconds"] >= 0 for record in sink.records)
+    assert stages["parse_col_types"]["traced_peak_mb"] is not None
+    assert not tracemalloc.is_tracing()
+
+    tracemalloc.start()
+    try:
+        processor.process(filepath=str(filepath))
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_metrics_sinks_and_summary(tmp_path):
+    tasks = []
+    for name in ["EC0101", "EC0102"]:
+        filepath = tmp_path / f"{name}.csv"
+        write_poa_csv(filepath)
+        tasks.append((str(filepath), str(tmp_path / f"{name}_out.csv")))
+    for sink_filepath, sink_class in [(tmp_path / "metrics.jsonl", JSONLinesSink), (tmp_path / "metrics.csv", CSVSink)]:
+        processor = POADataProcessor(loader=CSVLoader(), sink=sink_class(filepath=str(sink_filepath)))
+        ProcessorRunner(processor=processor, workers=2).run(tasks=tasks)
+        metrics = load_metrics(filepath=str(sink_filepath))
+        assert len(metrics) == 18
+        summary = summarize(metrics=metrics, top=1)
+        assert summary["stages"]["calls"].tolist() == [2] * 9
+        assert len(summary["fcps"]) == 1
+
+
+def test_csv_sink_writes_header_once(tmp_path):
+    filepath = tmp_path / "metrics" / "metrics.csv"
+    record = {"stage": "load", "fcpId": "EC0101", "seconds": 0.1}
+    CSVSink(filepath=str(filepath)).write(record)
+    CSVSink(filepath=str(filepath)).write(record)
+    lines = filepath.read_text(encoding="utf-8").splitlines()
+    assert sum(line.startswith("timestamp,") for line in lines) == 1
+    assert len(load_metrics(filepath=str(filepath))) == 2
@@ -0,0 +1,123 @@
+import pulp
+import pytest
+import pandas as pd
+from src.modelling.optimizer import BudgetLpOptimizer
+from src.modelling.batch import solve_batch
+from src.modelling.sweep import sweep, scenario_grid, relaxation_sensitivity
+from src.modelling.solvers import EnumerationSolver, SolverConfig
+from src.modelling.params import DEFAULT_PARAMS
+
+
+def test_budget_optimizer_solve():
+    optimizer = BudgetLpOptimizer.build(params=DEFAULT_PARAMS)
+    optimizer.solve()
+    results = optimizer.get_results()
+    assert results["status"] == "Optimal"
+    assert results["budget"] >= results["expenses"]
+
+
+def test_solve_batch_matches_single_solves():
+    rows = [
+        DEFAULT_PARAMS,
+        dict(DEFAULT_PARAMS, kids_ratio=0.3, I=300.0),
+        dict(DEFAULT_PARAMS, N_max=50),
+        dict(DEFAULT_PARAMS, C2=120.0, E=10.0),
+    ]
+    batch = solve_batch(params=pd.DataFrame(rows), config=SolverConfig())
+    in_process = solve_batch(params=pd.DataFrame(rows))
+    assert in_process["status"].tolist() == batch["status"].tolist()
+    optimal = batch["status"] == "Optimal"
+    totals = ["n1", "n2", "t1", "t2"]
+    assert in_process.loc[optimal, totals].sum(axis=1).tolist() == batch.loc[optimal, totals].sum(axis=1).tolist()
+    for i, row in enumerate(rows):
+        optimizer = BudgetLpOptimizer.build(params=row)
+        optimizer.solve()
+        expected = optimizer.get_results()
+        assert batch.loc[i, "status"] == expected["status"]
+        if expected["status"] == "Optimal":
+            assert batch.loc[i, ["n1", "n2", "t1", "t2"]].tolist() == [
+                expected["n1"], expected["n2"], expected["t1"], expected["t2"]
+            ]
+
+
+def test_sweep_matches_batch():
+    grid = {"kids_ratio": [0.1, 0.2, 0.3], "I": [246.0, 300.0]}
+    results = sweep(base=DEFAULT_PARAMS, grid=grid, workers=2)
+    expected = solve_batch(params=scenario_grid(base=DEFAULT_PARAMS, grid=grid), config=SolverConfig())
+    assert len(results) == 6
+    assert results[["n1", "n2", "t1", "t2"]].equals(expected[["n1", "n2", "t1", "t2"]])
+    assert "shadow_R1" in results.columns and "reduced_x1" in results.columns
+
+
+def test_sweep_empty_grid():
+    results = sweep(base=DEFAULT_PARAMS, grid={"kids_ratio": [], "I": [246.0]}, workers=2)
+    assert results.empty and list(results.columns) == ["kids_ratio", "I"]
+
+
+def test_sweep_drops_duals_of_infeasible_relaxations():
+    results = sweep(base=DEFAULT_PARAMS, grid={"I": [10.0, DEFAULT_PARAMS["I"]]}, workers=1)
+    duals = [column for column in results.columns if column.startswith(("shadow_", "reduced_"))]
+    assert results["relaxed_status"].tolist() == ["Infeasible", "Optimal"]
+    assert results.loc[0, duals].isna().all() and results.loc[1, duals].notna().all()
+
+
+def test_relaxation_sensitivity_binding_budget_dual():
+    optimizer = BudgetLpOptimizer.build(params=DEFAULT_PARAMS)
+    sensitivity = relaxation_sensitivity(optimizer=optimizer)
+    objective = pulp.value(optimizer.model.objective)
+    optimizer.update_params(params=dict(DEFAULT_PARAMS, G=DEFAULT_PARAMS["G"] + 100.0))
+    relaxation_sensitivity(optimizer=optimizer)
+    assert sensitivity["relaxed_status"] == "Optimal" and sensitivity["shadow_R1"] < 0
+    assert pulp.value(optimizer.model.objective) - objective == pytest.approx(-100.0 * sensitivity["shadow_R1"], rel=1e-4)
+
+
+def test_enumeration_solver_matches_cbc():
+    rows = [
+        DEFAULT_PARAMS,
+        dict(DEFAULT_PARAMS, kids_ratio=0.9, N_max=3000),
+        dict(DEFAULT_PARAMS, I=385.0, C2=29.0, kids_ratio=0.77, N_max=3000),
+        dict(DEFAULT_PARAMS, N_max=50),
+        dict(DEFAULT_PARAMS, I=150.0, N_max=3000),
+        dict(DEFAULT_PARAMS, D1=3000.0, D2=11000.0, N_max=800),
+        dict(DEFAULT_PARAMS, I=600.0, C1=20.0, kids_ratio=0.35, N_max=200_000),
+    ]
+    for row in rows:
+        expected = BudgetLpOptimizer.build(params=row)
+        expected.solve(solver=pulp.PULP_CBC_CMD(msg=False))
+        optimizer = BudgetLpOptimizer.build(params=row)
+        optimizer.solve(solver=EnumerationSolver())
+        assert optimizer.model.status == expected.model.status
+        if optimizer.get_results()["status"] == "Optimal":
+            assert pulp.value(optimizer.model.objective) == pulp.value(expected.model.objective)
+            assert all(constraint.valid(eps=1e-6) for constraint in optimizer.model.constraints.values())
+
+
+def test_enumeration_solver_scales_with_capacity():
+    for n_max in [50_000, 1_000_000]:
+        expected = BudgetLpOptimizer.build(params=dict(DEFAULT_PARAMS, N_max=n_max))
+        expected.solve(solver=pulp.PULP_CBC_CMD(msg=False))
+        optimizer = BudgetLpOptimizer.build(params=dict(DEFAULT_PARAMS, N_max=n_max))
+        stats = optimizer.solve(solver=EnumerationSolver())
+        assert stats.status == "Optimal" and stats.wall_time < 0.5
+        assert pulp.value(optimizer.model.objective) == pulp.value(expected.model.objective)
+
+
+def test_enumeration_solver_falls_back_beyond_size_limit():
+    optimizer = BudgetLpOptimizer.build(params=DEFAULT_PARAMS)
+    stats = optimizer.solve(solver=EnumerationSolver(max_points=1, fallback=pulp.PULP_CBC_CMD(msg=False)))
+    assert stats.status == "Optimal" and stats.nodes is None
+    assert all(constraint.valid(eps=1e-6) for constraint in optimizer.model.constraints.values())
+    assert isinstance(SolverConfig(backend="enum").build().fallback, pulp.PULP_CBC_CMD)
+    stats = BudgetLpOptimizer.build(params=DEFAULT_PARAMS).solve(solver=EnumerationSolver(max_points=1))
+    assert stats.status == "Optimal" and stats.nodes is None
+
+
+def test_update_params_matches_build():
+    params = dict(DEFAULT_PARAMS, I=300.0, C2=45.0, D1=6000.0, N_max=250, kids_ratio=0.3)
+    optimizer = BudgetLpOptimizer.build(params=DEFAULT_PARAMS)
+    optimizer.update_params(params=params)
+    expected = BudgetLpOptimizer.build(params=params)
+    for name, constraint in expected.model.constraints.items():
+        updated = optimizer.model.constraints[name]
+        assert {var.name: coef for var, coef in updated.items()} == {var.name: coef for var, coef in constraint.items()}
+        assert updated.constant == constraint.constant and updated.sense == constraint.sense
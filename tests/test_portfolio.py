@@ -0,0 +1,86 @@
+import time
+import pulp
+import numpy as np
+import pandas as pd
+from src.modelling.optimizer import BudgetLpOptimizer
+from src.modelling.portfolio import PortfolioLpOptimizer
+from src.modelling.params import DEFAULT_PARAMS
+
+FCPS = pd.DataFrame({
+    "fcpId": ["EC0101", "EC0102", "EC0103", "EC0104", "EC0105"],
+    "fpcCurrentParticipants": [500, 450, 300, 600, 420],
+    "fcpState": ["Loja", "Loja", "Azuay", "Azuay", "Guayas"]
+})
+
+
+def test_portfolio_matches_single_fcp_models():
+    optimizer = PortfolioLpOptimizer.build(fcps=FCPS, params=DEFAULT_PARAMS, allow_closing=False, sense=pulp.LpMinimize)
+    optimizer.solve()
+    results = optimizer.get_results()
+    assert (results["status"] == "Infeasible").all()
+
+    fcps = FCPS[FCPS["fpcCurrentParticipants"] >= 420]
+    optimizer = PortfolioLpOptimizer.build(fcps=fcps, params=DEFAULT_PARAMS, allow_closing=False, sense=pulp.LpMinimize)
+    optimizer.solve()
+    results = optimizer.get_results()
+    for row, capacity in zip(results.itertuples(), fcps["fpcCurrentParticipants"]):
+        single = BudgetLpOptimizer.build(params=dict(DEFAULT_PARAMS, N_max=capacity))
+        single.solve(solver=pulp.PULP_CBC_CMD(msg=False))
+        expected = single.get_results()
+        assert (row.n1, row.n2, row.t1, row.t2) == (expected["n1"], expected["n2"], expected["t1"], expected["t2"])
+        assert row.expenses == expected["expenses"]
+
+
+def test_portfolio_budget_and_region_caps():
+    optimizer = PortfolioLpOptimizer.build(fcps=FCPS, params=DEFAULT_PARAMS, budget=300000, region_caps={"Loja": 120000})
+    optimizer.solve()
+    results = optimizer.get_results()
+    assert (results["status"] == "Optimal").all()
+    assert results["funding"].sum() <= 300000
+    assert results.loc[FCPS["fcpState"] == "Loja", "funding"].sum() <= 120000
+    assert results.loc[FCPS["fpcCurrentParticipants"] < 404, "open"].eq(0).all()
+    opened = results[results["open"] == 1]
+    assert (opened["expenses"] <= opened["budget"]).all()
+    assert (opened["total_kids"] <= FCPS.loc[opened.index, "fpcCurrentParticipants"]).all()
+
+
+def minimum_tutors(n1: float, n2: float) -> float:
+    rows = BudgetLpOptimizer.to_matrix(params=DEFAULT_PARAMS)
+    A, b = rows.dense(), rows.b
+    names = rows.constraints
+    capacity = [names.index(name) for name in ["R9", "R10", "R13", "R14"]]
+    return min(
+        t1 + t2 for t1 in range(0, 40) for t2 in range(0, 40)
+        if (A[capacity] @ [n1, n2, t1, t2] <= b[capacity] + 1e-9).all()
+    )
+
+
+def test_portfolio_hires_minimum_tutors():
+    optimizer = PortfolioLpOptimizer.build(fcps=FCPS, params=dict(DEFAULT_PARAMS, I=600.0))
+    optimizer.solve()
+    results = optimizer.get_results()
+    assert (results["status"] == "Optimal").all()
+    assert (results["total_kids"] == FCPS["fpcCurrentParticipants"]).all()
+    for row in results.itertuples():
+        assert row.t1 + row.t2 == minimum_tutors(n1=row.n1, n2=row.n2)
+
+
+def test_portfolio_scales_with_caps():
+    rng = np.random.default_rng(0)
+    fcps = pd.DataFrame({
+        "fcpId": [f"EC{i:04d}" for i in range(300)],
+        "fpcCurrentParticipants": rng.integers(300, 900, 300),
+        "fcpState": rng.choice(["Loja", "Azuay", "Guayas", "Pichincha"], 300)
+    })
+    total = DEFAULT_PARAMS["I"] * fcps["fpcCurrentParticipants"].sum()
+    start = time.perf_counter()
+    optimizer = PortfolioLpOptimizer.build(fcps=fcps, params=DEFAULT_PARAMS, budget=0.6 * total, region_caps={"Loja": 0.1 * total})
+    stats = optimizer.solve()
+    results = optimizer.get_results()
+    assert time.perf_counter() - start < 30
+    assert stats.status == "Optimal"
+    assert results["total_kids"].sum() == np.floor(0.6 * total / DEFAULT_PARAMS["I"])
+    assert results.loc[fcps["fcpState"] == "Loja", "funding"].sum() <= 0.1 * total
+    opened = results[results["open"] == 1].sample(n=20, random_state=0)
+    for row in opened.itertuples():
+        assert row.t1 + row.t2 == minimum_tutors(n1=row.n1, n2=row.n2)
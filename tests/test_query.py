@@ -0,0 +1,42 @@
+import os
+import pandas as pd
+import pytest
+from src.utils import save_pandas_data
+
+pytest.importorskip("duckdb")
+from src.data import QueryEngine
+
+
+def write_outputs(tmp_path):
+    for name in ["poa", "balance", "final"]:
+        os.makedirs(tmp_path / name)
+    for fcp_id in ["EC0101", "EC0102"]:
+        poa = pd.DataFrame({
+            "fcpId": fcp_id, "account": ["101", "102", "101"], "month": ["m1", "m1", "m2"], "value": [1.0, 2.0, 3.0]
+        })
+        balance = pd.DataFrame({"fcpId": fcp_id, "account": ["101"], "month": ["m1"], "diff": [5.0]})
+        save_pandas_data(input_data=poa.astype({"account": "category"}), filepath=str(tmp_path / "poa" / f"{fcp_id}.parquet"))
+        save_pandas_data(input_data=balance, filepath=str(tmp_path / "balance" / f"{fcp_id}.parquet"))
+    fcps = pd.DataFrame({"fcpId": ["EC0101", "EC0102"], "fcpState": ["Pichincha", "Guayas"]})
+    save_pandas_data(input_data=fcps, filepath=str(tmp_path / "final" / "fcps.parquet"))
+
+
+def test_query_engine(tmp_path):
+    write_outputs(tmp_path=tmp_path)
+    with QueryEngine() as engine:
+        assert engine.register_outputs(processed_path=str(tmp_path)) == ["poa", "balance", "fcps"]
+        data = engine.filter("poa", columns=["account", "value"], fcpId="EC0102", month=["m1"])
+        assert data.sort_values("account")["value"].tolist() == [1.0, 2.0]
+        totals = engine.aggregate("poa", by=["fcpId"], values={"value": "sum"}, account="101")
+        assert totals.to_dict(orient="list") == {"fcpId": ["EC0101", "EC0102"], "value": [4.0, 4.0]}
+        joined = engine.join(
+            "poa", "balance", on=["fcpId", "account", "month"], columns=["fcpId", "value", "diff"], how="left",
+            fcpId="EC0101", month="m1"
+        )
+        assert joined.sort_values("value")["diff"].fillna(0).tolist() == [5.0, 0.0]
+        states = engine.join("poa", "fcps", on=["fcpId"], columns=["fcpState", "value"], fcpState="Guayas")
+        assert states["value"].sum() == 6.0
+        with pytest.raises(KeyError):
+            engine.filter("poa", **{"value; DROP": 1})
+        with pytest.raises(ValueError):
+            engine.aggregate("poa", by=["fcpId"], values={"value": "median"})
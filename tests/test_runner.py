@@ -0,0 +1,69 @@
+import json
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+from benchmarks.generators import write_balance_workbook
+from src.data import CSVLoader, ExcelLoader, POADataProcessor, BalanceDataProcessor, ProcessorRunner
+
+
+def write_poa_csv(filepath):
+    data = pd.DataFrame(
+        [["Activity", "Group", 5101, "1,200.00"] + ["100.00"] * 12,
+         ["Activity", "Group", None, "0"] + ["0"] * 12],
+        columns=["Actividad", "Grupo", "Cuenta", "Total"] + [f"Mes {i}" for i in range(1, 13)]
+    )
+    data.to_csv(filepath, index=False)
+
+
+def test_processor_runner(tmp_path):
+    tasks = []
+    for name in ["EC0101", "EC0102", "EC0103"]:
+        filepath = tmp_path / f"{name}.csv"
+        write_poa_csv(filepath)
+        tasks.append((str(filepath), str(tmp_path / f"{name}_out.csv")))
+    bad_filepath = tmp_path / "EC0104.csv"
+    bad_filepath.write_text("a,b\n1,2\n")
+    tasks.insert(1, (str(bad_filepath), str(tmp_path / "EC0104_out.csv")))
+
+    runner = ProcessorRunner(processor=POADataProcessor(loader=CSVLoader()), workers=2)
+    report = runner.run(tasks=tasks)
+    assert report["filepath"].tolist() == [filepath for filepath, _ in tasks]
+    assert report["status"].tolist() == ["ok", "invalid", "ok", "ok"]
+    assert report.loc[0, "rows"] == 12
+    assert len(pd.read_csv(tasks[0][1])) == 12
+
+
+def test_processor_runner_quarantine(tmp_path):
+    good_filepath, bad_filepath = tmp_path / "EC0101.csv", tmp_path / "EC0102.csv"
+    write_poa_csv(good_filepath)
+    bad_filepath.write_text("a,b\n1,2\n")
+    quarantine_path = tmp_path / "quarantine"
+    runner = ProcessorRunner(processor=POADataProcessor(loader=CSVLoader()), workers=2, quarantine_path=str(quarantine_path))
+    report = runner.run(tasks=[(str(path), str(tmp_path / f"{path.stem}.parquet")) for path in [good_filepath, bad_filepath]])
+    assert report["status"].tolist() == ["ok", "invalid"]
+    assert not bad_filepath.exists() and (quarantine_path / "EC0102.csv").exists()
+    error_report = json.loads((quarantine_path / "EC0102.csv.error.json").read_text())
+    assert error_report["errors"][0]["check"] == "columns"
+
+
+def test_processor_runner_quarantines_schema_errors_only(tmp_path):
+    good_filepath, bad_filepath, unreadable_filepath = [tmp_path / f"EC010{i}.xlsx" for i in range(1, 4)]
+    for filepath in [good_filepath, bad_filepath]:
+        write_balance_workbook(filepath=str(filepath), rng=np.random.default_rng(0))
+    workbook = load_workbook(bad_filepath)
+    workbook.worksheets[1]["A8"] = "not an account"
+    workbook.save(bad_filepath)
+    unreadable_filepath.write_bytes(b"not a workbook")
+    quarantine_path = tmp_path / "quarantine"
+    runner = ProcessorRunner(
+        processor=BalanceDataProcessor(loader=ExcelLoader(engine="openpyxl")), workers=1, quarantine_path=str(quarantine_path)
+    )
+    paths = [good_filepath, bad_filepath, unreadable_filepath]
+    report = runner.run(tasks=[(str(path), str(tmp_path / f"{path.stem}.parquet")) for path in paths])
+    assert report["status"].tolist() == ["ok", "invalid", "failed"]
+    assert not bad_filepath.exists() and (quarantine_path / "EC0102.xlsx").exists()
+    assert unreadable_filepath.exists() and not (quarantine_path / "EC0103.xlsx").exists()
+    error_report = json.loads((quarantine_path / "EC0102.xlsx.error.json").read_text())
+    assert [(error["check"], error["sheet"], error["rows"]) for error in error_report["errors"]] == [
+        ("dtype", workbook.sheetnames[1], [1])
+    ]
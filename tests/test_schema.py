@@ -0,0 +1,52 @@
+import pandas as pd
+import pytest
+from src.data import FrameSchema, SchemaValidationError, BalanceDataProcessor, POADataProcessor, CSVLoader
+
+
+def test_frame_schema():
+    schema = FrameSchema(
+        columns=["fcpId", "account", "value"],
+        required=["account"],
+        dtypes={"account": "integer", "value": "number"},
+        patterns={"fcpId": r"[A-Z]{2}\d{4}"}
+    )
+    data = pd.DataFrame({"Código": ["EC0101", "ec01", "EC0103"], "Cuenta": [5101, None, 5101.5], "Valor": ["1", "x", 2]})
+    with pytest.raises(SchemaValidationError) as error:
+        schema.validate(data=data, filepath="EC0101.csv")
+    checks = {(e["check"], e["column"]): e["rows"] for e in error.value.errors}
+    assert checks == {
+        ("required", "account"): [1],
+        ("dtype", "account"): [2],
+        ("dtype", "value"): [1],
+        ("pattern", "fcpId"): [1]
+    }
+    valid = data.iloc[[0]]
+    assert schema.validate(data=valid) is valid
+
+    with pytest.raises(SchemaValidationError) as error:
+        schema.validate(data=pd.DataFrame())
+    assert error.value.errors[0]["check"] == "columns"
+    with pytest.raises(SchemaValidationError):
+        schema.check_id(fcp_id="POA_2024", filepath="POA_2024.csv")
+
+
+def test_processors_fail_fast(tmp_path):
+    with pytest.raises(SchemaValidationError):
+        BalanceDataProcessor.get_fcp_id(filepath="Balance_de_Comprobacion.xlsx")
+    filepath = tmp_path / "EC0101.csv"
+    filepath.write_text("a,b\n1,2\n")
+    with pytest.raises(SchemaValidationError):
+        POADataProcessor(loader=CSVLoader()).process(filepath=str(filepath))
+
+
+def test_processors_reject_unparseable_money(tmp_path):
+    filepath = tmp_path / "EC0101.csv"
+    pd.DataFrame(
+        [["Activity", "Group", 5101, "1,200.00"] + ["100.00"] * 11 + ["abc"]],
+        columns=["Actividad", "Grupo", "Cuenta", "Total"] + [f"Mes {i}" for i in range(1, 13)]
+    ).to_csv(filepath, index=False)
+    with pytest.raises(SchemaValidationError) as error:
+        POADataProcessor(loader=CSVLoader()).process(filepath=str(filepath))
+    assert [(e["check"], e["column"], e["rows"]) for e in error.value.errors] == [("money", "m12", [0])]
+    data = POADataProcessor(loader=CSVLoader(), max_money_errors=1).process(filepath=str(filepath))
+    assert data["value"].isna().sum() == 1
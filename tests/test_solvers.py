@@ -0,0 +1,68 @@
+import pulp
+import pytest
+import numpy as np
+from src.modelling.optimizer import BudgetLpOptimizer
+from src.modelling.solvers import SolverConfig, parse_cbc_log, solve_model
+from src.modelling.params import DEFAULT_PARAMS
+
+
+def test_solver_config_cbc_stats():
+    optimizer = BudgetLpOptimizer.build(params=DEFAULT_PARAMS)
+    stats = optimizer.solve(config=SolverConfig(threads=2, time_limit=30, gap=0.01))
+    assert optimizer.stats is stats
+    assert stats.backend == "PULP_CBC_CMD"
+    assert stats.status == optimizer.get_results()["status"] == "Optimal"
+    assert stats.nodes is not None and stats.gap is not None
+    assert stats.wall_time > 0
+    assert stats.objective == pytest.approx(sum(optimizer.get_results()[k] for k in ["n1", "n2", "t1", "t2"]))
+
+
+def test_solver_config_backends_agree():
+    optimizer = BudgetLpOptimizer.build(params=DEFAULT_PARAMS)
+    expected = optimizer.solve(config=SolverConfig()).objective
+    enum = optimizer.solve(config=SolverConfig(backend="enum"))
+    assert enum.objective == expected and enum.nodes > 0 and enum.gap == 0.0
+    for backend in ["highs", "glpk"]:
+        solver = SolverConfig(backend=backend).build()
+        if not solver.available():
+            continue
+        assert optimizer.solve(solver=solver).objective == pytest.approx(expected)
+
+
+def test_solver_config_validation():
+    with pytest.raises(ValueError):
+        SolverConfig(backend="gurobi")
+    assert isinstance(SolverConfig(backend="glpk", gap=0.05).build(), pulp.GLPK_CMD)
+
+
+def test_parse_cbc_log():
+    log = "Result - Stopped on time limit\n\nObjective value: 10\nGap: 0.05\nEnumerated nodes: 42\n"
+    assert parse_cbc_log(log=log) == {"time_limited": True, "nodes": 42, "gap": 0.05}
+    log = (
+        "Result - Stopped on time limit\n\nObjective value: 11539.00000000\nUpper bound: 11580.095\n"
+        "Gap: -0.00\nEnumerated nodes: 155\n"
+    )
+    assert parse_cbc_log(log=log) == {"time_limited": True, "nodes": 155, "gap": pytest.approx(41.095 / 11539)}
+    log = "Result - Stopped on time limit\n\nNo feasible solution found\nUpper bound: 147448.200\nEnumerated nodes: 11\n"
+    assert parse_cbc_log(log=log) == {"time_limited": True, "nodes": 11}
+    assert parse_cbc_log(log="Result - Optimal solution found\n\nEnumerated nodes: 0\n")["gap"] == 0.0
+
+
+def test_solve_stats_time_limit():
+    rng = np.random.default_rng(1)
+    weights, values = rng.integers(10, 100, (40, 500)), rng.integers(10, 100, 500)
+    model = pulp.LpProblem("knapsack", pulp.LpMaximize)
+    x = [pulp.LpVariable(f"x{i}", cat="Binary") for i in range(500)]
+    model += pulp.lpDot(values.tolist(), x)
+    for row in weights:
+        model += pulp.lpDot(row.tolist(), x) <= int(row.sum()) // 2
+    stats = solve_model(model=model, config=SolverConfig(time_limit=1))
+    assert stats.time_limited and stats.sol_status == "Solution Found"
+    assert stats.gap is None or stats.gap > 0
+
+
+def test_solver_config_unsupported_options():
+    config = SolverConfig(backend="glpk", threads=2, warm_start=True)
+    assert not config.supports("threads") and not config.supports("warm_start")
+    assert SolverConfig().supports("warm_start")
+    assert isinstance(config.build(), pulp.GLPK_CMD)
@@ -1,4 +1,5 @@
-from src.utils import money_to_float
+import pandas as pd
+from src.utils import money_to_float, money_series_to_float
 
 
 def test_money_to_float1():
@@ -7,3 +8,24 @@ def test_money_to_float1():
 
 def test_money_to_float2():
     assert money_to_float(1234.56) == 1234.56
+
+
+def test_money_series_to_float():
+    values = pd.Series(["1,234.56", "(1,000.50)", "$ 12", "", None, "abc", "-7"])
+    parsed, failed = money_series_to_float(values=values)
+    assert parsed.iloc[0] == 1234.56
+    assert parsed.iloc[1] == -1000.50
+    assert parsed.iloc[2] == 12.0
+    assert parsed.iloc[3:6].isna().all()
+    assert parsed.iloc[6] == -7.0
+    assert failed.tolist() == [False, False, False, False, False, True, False]
+
+
+def test_money_series_to_float_signs():
+    values = pd.Series(["$(12.00)", "( $ 3.50 )", "12-", "$ 1,200.00-", "nan", "NaN", "USD -4", "-"])
+    parsed, failed = money_series_to_float(values=values)
+    assert parsed.iloc[:4].tolist() == [-12.0, -3.5, -12.0, -1200.0]
+    assert parsed.iloc[4:6].isna().all()
+    assert parsed.iloc[6] == -4.0
+    assert pd.isna(parsed.iloc[7])
+    assert not failed.any()